@@ -0,0 +1,13 @@
+# benchmarks/__init__.py
+"""
+Headless micro-benchmarks of the gameplay hot paths.
+
+Every case runs against a real Game on the dummy SDL video driver and
+reports per-call timings. Results are written as JSON and can be compared
+against a stored baseline:
+
+    python -m benchmarks --save-baseline
+    python -m benchmarks --baseline benchmarks/baseline.json --max-regression 0.15
+
+Baselines are machine specific; record one on the machine that checks it.
+"""
@@ -0,0 +1,118 @@
+# benchmarks/__main__.py
+"""
+Run the gameplay benchmarks and compare them with a baseline:
+
+    python -m benchmarks                                  # run, write benchmarks/results/latest.json
+    python -m benchmarks --save-baseline                  # also store the run as the baseline
+    python -m benchmarks --baseline benchmarks/baseline.json --threshold "game.game_loop*=0.25"
+    python -m benchmarks --results latest.json --baseline baseline.json   # compare without running
+
+The exit status is 1 if any case is slower than its allowed regression.
+"""
+import argparse
+import os
+import shutil
+import sys
+from fnmatch import fnmatch
+from benchmarks.harness import (
+    BenchmarkRunner, compare_results, load_results, print_comparison, write_results
+)
+
+DEFAULT_OUTPUT = os.path.join('benchmarks', 'results', 'latest.json')
+DEFAULT_BASELINE = os.path.join('benchmarks', 'baseline.json')
+
+def parse_threshold(text: str):
+    """
+    Parse a PATTERN=FRACTION threshold override
+
+    Args:
+        text (str): e.g. 'game.game_loop*=0.25'
+
+    Returns:
+        Tuple[str, float]: Case name pattern and allowed slowdown
+    """
+    pattern, separator, value = text.rpartition('=')
+    if not separator or not pattern:
+        raise argparse.ArgumentTypeError(f"Expected PATTERN=FRACTION, got {text!r}")
+    try:
+        return pattern, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Threshold of {pattern!r} is not a number: {value!r}")
+
+def run_benchmarks(args) -> dict:
+    from benchmarks.cases import build_cases, create_game
+    from src.utils.debug_section import debug
+
+    game = create_game()
+    # Log I/O would dominate the cheaper cases
+    debug.enabled = args.with_logging
+
+    cases = build_cases(game, args.items, level=args.level)
+    if args.filter:
+        cases = [case for case in cases if any(fnmatch(case.name, pattern) for pattern in args.filter)]
+    if not cases:
+        print("No benchmark case matches the filter", file=sys.stderr)
+        sys.exit(2)
+
+    def progress(name: str, result: dict):
+        print(f"{name:<60} {result['median_us']:>10.2f} us/{result['unit']}  "
+              f"(min {result['min_us']:.2f}, stdev {result['stdev_us']:.2f}, {result['calls_per_round']} per round)")
+
+    runner = BenchmarkRunner(rounds=args.rounds, round_time=args.round_time, warmup_time=args.warmup_time)
+    document = runner.run(cases, progress)
+    document['config'].update({'items': list(args.items), 'level': args.level, 'logging': args.with_logging})
+    return document
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the CollectCat gameplay hot paths')
+    parser.add_argument('--items', type=lambda text: [int(count) for count in text.split(',')],
+                        default=[0, 10, 50, 200], help='Comma-separated item counts (default 0,10,50,200)')
+    parser.add_argument('--level', type=int, default=1, help='Level to benchmark (1-3)')
+    parser.add_argument('--filter', action='append', default=[], metavar='PATTERN',
+                        help='Only run cases matching this fnmatch pattern (repeatable)')
+    parser.add_argument('--rounds', type=int, default=15, help='Timed rounds per case')
+    parser.add_argument('--round-time', type=float, default=0.05, help='Target seconds per round')
+    parser.add_argument('--warmup-time', type=float, default=0.05, help='Untimed seconds before each case')
+    parser.add_argument('--with-logging', action='store_true', help='Keep debug logging enabled while timing')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Where to write the JSON results')
+    parser.add_argument('--results', default=None, help='Compare an existing results file instead of running')
+    parser.add_argument('--baseline', default=None,
+                        help=f'Baseline to compare with (default {DEFAULT_BASELINE} if it exists)')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the baseline')
+    parser.add_argument('--max-regression', type=float, default=0.15,
+                        help='Allowed slowdown of the median as a fraction (default 0.15)')
+    parser.add_argument('--threshold', type=parse_threshold, action='append', default=[], metavar='PATTERN=FRACTION',
+                        help='Allowed slowdown of the cases matching a pattern (repeatable, last match wins)')
+    args = parser.parse_args()
+
+    if args.results:
+        results_path = args.results
+        document = load_results(results_path)
+    else:
+        document = run_benchmarks(args)
+        results_path = args.output
+        write_results(document, results_path)
+        print(f"Results written to {results_path}")
+
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path) or '.', exist_ok=True)
+        shutil.copyfile(results_path, baseline_path)
+        print(f"Baseline saved to {baseline_path}")
+        return
+
+    if args.baseline is None and not os.path.exists(baseline_path):
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+        return
+
+    comparison = compare_results(
+        document, load_results(baseline_path), args.max_regression, args.threshold
+    )
+    print_comparison(comparison)
+    regressions = [entry['name'] for entry in comparison if entry['status'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {baseline_path}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# benchmarks/cases.py
+"""
+Benchmark cases for the gameplay hot paths, built around one shared Game.
+"""
+import os
+from typing import Iterable, List, Optional, Sequence
+from benchmarks.harness import BenchmarkCase
+
+DEFAULT_ITEM_COUNTS = (0, 10, 50, 200)
+
+# Seed of the level session used by every case, so runs are comparable
+BENCHMARK_SEED = 1234
+
+def create_game():
+    """
+    Create a Game on the dummy video and audio drivers, ready for benchmarking
+
+    Returns:
+        Game: Game without replay recording and with an uncapped game loop
+        that runs exactly one simulation step per frame
+    """
+    # No window and no audio device; must be set before pygame initializes
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    # Imported here so the dummy drivers are in place first
+    from src.game.game import Game
+    from src.utils.resource_manager import ResourceManager
+
+    game = Game()
+    game.record_replays = False
+    game.max_fps = 0
+    game.fixed_frame_time = 1 / game.settings.simulation_rate
+    # Time gameplay, not asset decoding that is still running in the background
+    ResourceManager.get_instance().asset_loader.wait_all()
+    return game
+
+def populate_items(game, count: int, lanes: Optional[Sequence[int]] = None) -> List:
+    """
+    Replace the items of the level with a fixed, evenly spread set
+
+    Items are kept above the character, so none of them is collected and the
+    score (and with it the game over screen) never changes.
+
+    Args:
+        game (Game): Game with a level set up
+        count (int): Number of items
+        lanes (Sequence[int], optional): Lanes to use, defaults to every lane
+
+    Returns:
+        List: The new items
+    """
+    from src.items.item import ItemType
+
+    game.remove_items(list(game.items))
+    lanes = list(lanes if lanes is not None else range(game.lane_manager.num_lanes))
+    item_types = ItemType.all_types()
+    spawner = game.item_spawner
+    lowest = game.character.y - max(item_type['size'] for item_type in item_types) - 2
+
+    items = []
+    for i in range(count):
+        item_type = item_types[i % len(item_types)]
+        lane = lanes[i % len(lanes)]
+        item = game.item_pool.acquire(
+            lane=lane,
+            color=item_type['color'],
+            is_good=item_type['is_good'],
+            size=item_type['size'],
+            fall_speed=5,
+            level=spawner.current_level,
+            rng=game.rng
+        )
+        item.x = spawner.lane_positions[lane]
+        item.y = item.previous_y = lowest * i / count
+        items.append(item)
+
+    game.items.extend(items)
+    game.item_index.add_many(items)
+    return items
+
+def _repeat(step):
+    def run(calls: int):
+        for _ in range(calls):
+            step()
+    return run
+
+def build_cases(game, item_counts: Iterable[int] = DEFAULT_ITEM_COUNTS, level: int = 1) -> List[BenchmarkCase]:
+    """
+    Build every benchmark case
+
+    Args:
+        game (Game): Game created by create_game
+        item_counts (Iterable[int]): Item counts of the cases that depend on them
+        level (int): Level to set up before each case
+
+    Returns:
+        List[BenchmarkCase]: Cases in run order
+    """
+    from src.system.collision import CollisionManager
+
+    item_counts = list(item_counts)
+    dt = 1 / 60
+
+    def fresh_level():
+        game.setup_level(level, seed=BENCHMARK_SEED)
+        # Nothing may appear from the spawner unless a case asks for it
+        game.item_spawner.max_items = 0
+
+    cases = []
+
+    for count in item_counts:
+        def setup_spawner(count=count):
+            fresh_level()
+            items = populate_items(game, count)
+            spawner = game.item_spawner
+            # Let the spawner fire on its normal interval, whatever the item count
+            spawner.max_items = count + 2
+
+            def step():
+                new_items = spawner.update(items, dt)
+                if new_items:
+                    if game.item_store is not None:
+                        for item in new_items:
+                            game.item_store.release(item)
+                    game.item_pool.release_many(new_items)
+            return _repeat(step)
+        cases.append(BenchmarkCase(f"item_spawner.update[items={count}]", setup_spawner, {'items': count}))
+
+    for count in item_counts:
+        for broad_phase in (True, False):
+            def setup_collisions(count=count, broad_phase=broad_phase):
+                fresh_level()
+                populate_items(game, count)
+                lane_index = game.item_index if broad_phase else None
+
+                def step():
+                    CollisionManager.check_item_collisions(game.character, game.items, lane_index)
+                return _repeat(step)
+            name = f"collision.check_item_collisions[items={count}]"
+            if not broad_phase:
+                name = f"collision.check_item_collisions[items={count},broad_phase=off]"
+            cases.append(BenchmarkCase(name, setup_collisions, {'items': count, 'broad_phase': broad_phase}))
+
+    def setup_world_update():
+        fresh_level()
+
+        def step():
+            game.world.update(dt, level, game.settings)
+        return _repeat(step)
+    cases.append(BenchmarkCase('world.update', setup_world_update))
+
+    def setup_world_draw():
+        fresh_level()
+
+        def step():
+            game.world.update(dt, level, game.settings)
+            game.world.draw(game.screen)
+        return _repeat(step)
+    cases.append(BenchmarkCase('world.draw', setup_world_draw, {'includes': 'world.update'}))
+
+    def setup_character_draw():
+        fresh_level()
+
+        def step():
+            game.character.draw(game.screen)
+        return _repeat(step)
+    cases.append(BenchmarkCase('character.draw', setup_character_draw))
+
+    for score_changing in (False, True):
+        def setup_score_draw(score_changing=score_changing):
+            fresh_level()
+            score_ui = game.score_ui
+
+            def step():
+                if score_changing:
+                    # A new number every call forces the panel to be rebuilt
+                    score_ui.visible_score = (int(score_ui.visible_score) + 1) % 1000
+                score_ui.draw(game.screen)
+            return _repeat(step)
+        name = 'score_ui.draw[score_changing]' if score_changing else 'score_ui.draw'
+        cases.append(BenchmarkCase(name, setup_score_draw, {'score_changing': score_changing}))
+
+    for count in item_counts:
+        def setup_draw_items(count=count):
+            fresh_level()
+            populate_items(game, count)
+
+            def step():
+                game.draw_items()
+            return _repeat(step)
+        cases.append(BenchmarkCase(f"game.draw_items[items={count}]", setup_draw_items, {'items': count}))
+
+    for count in item_counts:
+        def setup_game_loop(count=count):
+            fresh_level()
+            # The character idles in the middle lane; items fall beside it
+            side_lanes = [lane for lane in range(game.lane_manager.num_lanes) if lane != game.lane_manager.current_lane]
+
+            def run(frames: int):
+                # Restore the item set that fell during the previous batch (O(items), not per frame)
+                populate_items(game, count, side_lanes)
+                game.game_loop(max_frames=frames)
+            return run
+        cases.append(BenchmarkCase(f"game.game_loop[items={count}]", setup_game_loop, {'items': count}, unit='frame'))
+
+    return cases
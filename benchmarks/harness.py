@@ -0,0 +1,279 @@
+# benchmarks/harness.py
+"""
+Timing, JSON result files and baseline comparison for the benchmark cases.
+"""
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from fnmatch import fnmatch
+from typing import Callable, List, Optional, Sequence, Tuple
+import pygame
+
+RESULTS_FORMAT_VERSION = 1
+
+class BenchmarkCase:
+    """A named piece of gameplay code timed per call (or per frame)"""
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Callable[[int], None]],
+        params: Optional[dict] = None,
+        unit: str = 'call'
+    ):
+        """
+        Args:
+            name (str): Unique name, e.g. 'collision.check_item_collisions[items=50]'
+            setup (callable): Prepares the state and returns run(n), which performs n calls
+            params (dict, optional): Parameters of the case, stored with the results
+            unit (str): What one call is ('call' or 'frame')
+        """
+        self.name = name
+        self.setup = setup
+        self.params = params or {}
+        self.unit = unit
+
+class BenchmarkRunner:
+    """
+    Times benchmark cases with warm-up, calibration and repeated rounds.
+
+    Each case is first run until it has been warm for `warmup_time`, then the
+    number of calls per round is chosen so a round lasts about `round_time`.
+    The median over `rounds` rounds is the figure compared with baselines;
+    it is far less sensitive to scheduler noise than the mean.
+    """
+
+    def __init__(self, rounds: int = 15, round_time: float = 0.05, warmup_time: float = 0.05):
+        """
+        Args:
+            rounds (int): Timed rounds per case
+            round_time (float): Target duration of one round in seconds
+            warmup_time (float): Untimed run before calibration in seconds
+        """
+        self.rounds = rounds
+        self.round_time = round_time
+        self.warmup_time = warmup_time
+
+    @staticmethod
+    def _time_calls(run: Callable[[int], None], calls: int) -> float:
+        start = time.perf_counter_ns()
+        run(calls)
+        return (time.perf_counter_ns() - start) / 1e9
+
+    def _calibrate(self, run: Callable[[int], None]) -> int:
+        # Double the batch until one batch takes a measurable share of a round
+        calls = 1
+        while True:
+            elapsed = self._time_calls(run, calls)
+            if elapsed >= self.round_time / 4 or calls >= 1 << 20:
+                return max(1, int(calls * self.round_time / max(elapsed, 1e-9)))
+            calls *= 2
+
+    def run_case(self, case: BenchmarkCase) -> dict:
+        """
+        Time one case
+
+        Args:
+            case (BenchmarkCase): Case to run
+
+        Returns:
+            dict: Per-call timings in microseconds and the run configuration
+        """
+        run = case.setup()
+
+        warmup_end = time.perf_counter() + self.warmup_time
+        while time.perf_counter() < warmup_end:
+            run(1)
+
+        calls = self._calibrate(run)
+        per_call_us = sorted(
+            self._time_calls(run, calls) / calls * 1e6 for _ in range(self.rounds)
+        )
+        median_us = statistics.median(per_call_us)
+        return {
+            'params': case.params,
+            'unit': case.unit,
+            'rounds': self.rounds,
+            'calls_per_round': calls,
+            'median_us': median_us,
+            'mean_us': statistics.fmean(per_call_us),
+            'min_us': per_call_us[0],
+            'max_us': per_call_us[-1],
+            'stdev_us': statistics.stdev(per_call_us) if len(per_call_us) > 1 else 0.0,
+            'per_second': 1e6 / median_us if median_us > 0 else float('inf')
+        }
+
+    def run(self, cases: Sequence[BenchmarkCase], progress: Optional[Callable[[str, dict], None]] = None) -> dict:
+        """
+        Time every case
+
+        Args:
+            cases (Sequence[BenchmarkCase]): Cases to run, in order
+            progress (callable, optional): Called with the name and result of each finished case
+
+        Returns:
+            dict: Results document (see write_results)
+        """
+        results = {}
+        for case in cases:
+            results[case.name] = self.run_case(case)
+            if progress:
+                progress(case.name, results[case.name])
+
+        return {
+            'format_version': RESULTS_FORMAT_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'environment': {
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'sdl': '.'.join(str(part) for part in pygame.get_sdl_version()),
+                'platform': platform.platform(),
+                'machine': platform.machine(),
+                'optimized': not __debug__
+            },
+            'config': {
+                'rounds': self.rounds,
+                'round_time': self.round_time,
+                'warmup_time': self.warmup_time
+            },
+            'results': results
+        }
+
+def write_results(document: dict, path: str):
+    """
+    Write a results document as JSON
+
+    Args:
+        document (dict): Results returned by BenchmarkRunner.run
+        path (str): Output file, its directory is created if needed
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as results_file:
+        json.dump(document, results_file, indent=2, sort_keys=True)
+
+def load_results(path: str) -> dict:
+    """
+    Read a results document
+
+    Args:
+        path (str): JSON file written by write_results
+
+    Returns:
+        dict: Results document
+
+    Raises:
+        ValueError: If the file was written by an incompatible version
+    """
+    with open(path) as results_file:
+        document = json.load(results_file)
+    if document.get('format_version') != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results format in {path}: {document.get('format_version')}")
+    return document
+
+def threshold_for(name: str, default: float, overrides: Sequence[Tuple[str, float]]) -> float:
+    """
+    Allowed slowdown of a case
+
+    Args:
+        name (str): Case name
+        default (float): Allowed slowdown as a fraction (0.15 = 15% slower)
+        overrides (Sequence[Tuple[str, float]]): Name pattern (fnmatch) and allowed slowdown
+            pairs in command-line order; the last match wins
+
+    Returns:
+        float: Allowed slowdown of the case
+    """
+    threshold = default
+    for pattern, value in overrides:
+        if fnmatch(name, pattern):
+            threshold = value
+    return threshold
+
+def compare_results(
+    current: dict,
+    baseline: dict,
+    max_regression: float = 0.15,
+    overrides: Optional[Sequence[Tuple[str, float]]] = None
+) -> List[dict]:
+    """
+    Compare the median time of every case with a baseline
+
+    Args:
+        current (dict): Results document of this run
+        baseline (dict): Stored results document
+        max_regression (float): Default allowed slowdown as a fraction
+        overrides (Sequence[Tuple[str, float]], optional): Per-case thresholds by name pattern
+
+    Returns:
+        List[dict]: One entry per case with 'name', 'status' ('ok', 'regression',
+            'improvement', 'new' or 'missing'), the medians, 'change' and 'threshold'.
+            A baseline median of 0 makes any slower run an infinite change (a
+            regression), so the broken baseline is noticed and re-saved
+    """
+    overrides = overrides or []
+    current_results = current['results']
+    baseline_results = baseline['results']
+    comparison = []
+
+    for name, result in current_results.items():
+        threshold = threshold_for(name, max_regression, overrides)
+        entry = {
+            'name': name,
+            'current_us': result['median_us'],
+            'baseline_us': None,
+            'change': None,
+            'threshold': threshold
+        }
+        base = baseline_results.get(name)
+        if base is None:
+            entry['status'] = 'new'
+        else:
+            entry['baseline_us'] = base['median_us']
+            if base['median_us'] > 0:
+                change = result['median_us'] / base['median_us'] - 1
+            else:
+                change = float('inf') if result['median_us'] > 0 else 0.0
+            entry['change'] = change
+            if change > threshold:
+                entry['status'] = 'regression'
+            elif change < -threshold:
+                entry['status'] = 'improvement'
+            else:
+                entry['status'] = 'ok'
+        comparison.append(entry)
+
+    for name, base in baseline_results.items():
+        if name not in current_results:
+            comparison.append({
+                'name': name,
+                'status': 'missing',
+                'current_us': None,
+                'baseline_us': base['median_us'],
+                'change': None,
+                'threshold': threshold_for(name, max_regression, overrides)
+            })
+    return comparison
+
+def print_comparison(comparison: List[dict], stream=sys.stdout):
+    """
+    Print a comparison as a table
+
+    Args:
+        comparison (List[dict]): Entries returned by compare_results
+        stream: Output stream
+    """
+    width = max((len(entry['name']) for entry in comparison), default=4)
+    print(f"{'case':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}  status", file=stream)
+    for entry in comparison:
+        baseline = f"{entry['baseline_us']:.2f} us" if entry['baseline_us'] is not None else '-'
+        current = f"{entry['current_us']:.2f} us" if entry['current_us'] is not None else '-'
+        change = f"{entry['change'] * 100:+.1f}%" if entry['change'] is not None else '-'
+        status = entry['status']
+        if status == 'regression':
+            status = f"REGRESSION (allowed {entry['threshold'] * 100:.0f}%)"
+        print(f"{entry['name']:<{width}}  {baseline:>12}  {current:>12}  {change:>8}  {status}", file=stream)
@@ -80,6 +80,21 @@ class Settings:
         self.difficulty = 'medium'
         self.show_fps = False
         
+        # Performance Settings
+        self.numpy_item_store = True  # Vectorized item movement when NumPy is installed
+        self.item_pool_size = 64  # Idle items kept for reuse instead of reallocating
+        self.event_driven_menus = True  # Menus sleep until input instead of redrawing at 60 FPS
+        self.dirty_rect_rendering = True  # Update only changed screen areas while the background is still
+        self.background_asset_loading = True  # Decode assets on worker threads behind a loading screen
+        self.asset_loader_workers = 2  # Worker threads of the background asset loader
+        self.baked_asset_cache = True  # Keep decoded, pre-scaled images as raw buffers in .asset_cache
+        self.music_crossfade_ms = 800  # Fade between streamed music tracks
+        # Memory budgets of the ResourceManager caches; least recently used assets are evicted above them
+        self.resource_budgets_mb = {'images': 64, 'animations': 32, 'sounds': 32}
+        self.simulation_rate = 60  # Fixed gameplay steps per second, independent of the frame rate
+        self.max_simulation_steps = 5  # Steps run for one slow frame before the rest of its time is dropped
+        self.interpolate_rendering = True  # Draw positions between the last two simulation steps
+        
         # Add level scroll multiplier
         self.level_scroll_multiplier = 1.0
         
@@ -3,6 +3,9 @@ from src.utils.debug_section import debug
 from src.utils.constant import Colors
 from src.utils.resource_manager import ResourceManager
 
+# Cached section handle for per-frame logging
+character_log = debug.section('character')
+
 class Character:
     def __init__(
         self, 
@@ -23,6 +26,8 @@ class Character:
         # Position and dimensions
         self.x = x
         self.y = y
+        # Position after the previous simulation step, for interpolated drawing
+        self.previous_x = x
         self.width = width
         self.height = height
         
@@ -42,56 +47,64 @@ class Character:
         self.current_animation = [default_surface]
         self.current_frame = 0
         self.animation_timer = 0
-        self.animation_speed = 10
+        self.animation_speed = 5  # Simulation steps per animation frame
         self.is_switching_lanes = False
         
+        # Ready-to-blit frames keyed by (width, height)
+        self.frame_cache = {}
+        
         # Load character images
         self.load_character_images()
 
     def load_character_images(self):
         """
-        Load and resize character images with comprehensive error handling
+        Load character frames for the current size, reusing cached frames when available
         """
         debug.log('character', "Starting to load character images")
         
-        # Clear existing images
-        self.idle_images = []
-        self.running_images = []
+        size = (self.width, self.height)
+        frames = self.frame_cache.get(size)
+        if frames is None:
+            frames = {
+                'idle': self._build_frames(self.idle_image_key),
+                'run': self._build_frames(self.run_image_key)
+            }
+            self.frame_cache[size] = frames
         
-        # Image keys
-        idle_key = 'character_idle'
-        run_key = 'character_run'
+        self.idle_images = frames['idle']
+        self.running_images = frames['run']
         
-        # Try to load and resize idle image
-        try:
-            idle_image = self.resource_manager.get_image(idle_key)
-            resized_idle = pygame.transform.scale(idle_image, (self.width, self.height))
-            self.idle_images = [resized_idle]
-            debug.log('character', f"Loaded and resized idle image: {idle_key}")
-        except Exception as e:
-            debug.warning('character', f"Error loading idle image: {e}")
-            # Create fallback idle image
-            fallback = pygame.Surface((self.width, self.height))
-            fallback.fill(self.color)
-            self.idle_images = [fallback]
+        # Set default animation to idle
+        self.current_animation = self.idle_images
+        self.current_frame = 0
+        self.animation_timer = 0
+        
+        debug.log('character', "Character images loading completed")
+
+    def _build_frames(self, image_key):
+        """
+        Scale every frame of an animation to the character size
         
-        # Try to load and resize running image
+        Args:
+            image_key (str): Resource key of the animation or image
+        
+        Returns:
+            list: Ready-to-blit frames
+        """
         try:
-            running_image = self.resource_manager.get_image(run_key)
-            resized_running = pygame.transform.scale(running_image, (self.width, self.height))
-            self.running_images = [resized_running]
-            debug.log('character', f"Loaded and resized running image: {run_key}")
+            source_frames = self.resource_manager.get_animation_frames(image_key)
+            frames = [
+                pygame.transform.scale(frame, (self.width, self.height))
+                for frame in source_frames
+            ]
+            debug.log('character', f"Loaded and resized {len(frames)} frame(s): {image_key}")
+            return frames
         except Exception as e:
-            debug.warning('character', f"Error loading running image: {e}")
-            # Create fallback running image
+            debug.warning('character', f"Error loading image {image_key}: {e}")
+            # Create fallback image
             fallback = pygame.Surface((self.width, self.height))
             fallback.fill(self.color)
-            self.running_images = [fallback]
-        
-        # Set default animation to idle
-        self.current_animation = self.idle_images
-        
-        debug.log('character', "Character images loading completed")
+            return [fallback]
 
     def animate(self):
         """
@@ -113,6 +126,10 @@ class Character:
         self.x = x
         self.target_x = x
 
+    def store_previous_position(self):
+        """Remember the position before a simulation step moves the character"""
+        self.previous_x = self.x
+
     def get_current_image(self):
         """
         Get the current animation frame
@@ -133,35 +150,38 @@ class Character:
         self.current_frame = 0
         self.animation_timer = 0
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
-        Draw the character on the screen with resizing support
+        Draw the character on the screen
         
         Args:
             screen (pygame.Surface): The surface to draw the character on
+            alpha (float): Interpolation between the previous (0) and the current (1) simulation step
+
+        Returns:
+            pygame.Rect: Screen area touched by the character
         """
-        # Get the current animation frame
-        current_image = self.get_current_image()
+        x = self.x if alpha >= 1.0 else self.previous_x + (self.x - self.previous_x) * alpha
         
-        # Ensure image is scaled to current width and height
-        scaled_image = pygame.transform.scale(current_image, (self.width, self.height))
-        
-        # Draw the character image
-        screen.blit(scaled_image, (self.x, self.y))
+        # Frames are pre-scaled to the current size by load_character_images
+        drawn_rect = screen.blit(self.get_current_image(), (x, self.y))
         
         # Optional: Draw debug information
-        if debug.sections.get('character', False):
+        if __debug__ and character_log.enabled:
             # Draw a rectangle around the character
-            pygame.draw.rect(screen, Colors.RED, 
-                            (self.x, self.y, self.width, self.height), 
+            border_rect = pygame.draw.rect(screen, Colors.RED, 
+                            (x, self.y, self.width, self.height), 
                             2)  # 2 pixel border
             
             # Draw center point
-            center_x = self.x + self.width // 2
+            center_x = x + self.width // 2
             center_y = self.y + self.height // 2
-            pygame.draw.circle(screen, Colors.GREEN, (center_x, center_y), 3)
-        
-        debug.log('character', f"Drawing character at ({self.x}, {self.y})")
+            point_rect = pygame.draw.circle(screen, Colors.GREEN, (center_x, center_y), 3)
+            drawn_rect = drawn_rect.unionall([border_rect, point_rect])
+            
+            character_log.log("Drawing character at (%s, %s)", x, self.y)
+
+        return drawn_rect
     
     def resize_character(self, new_width, new_height):
         """
@@ -177,5 +197,5 @@ class Character:
         self.width = new_width
         self.height = new_height
         
-        # Reload images with new size
+        # Switch to frames for the new size (scaled once, then cached)
         self.load_character_images()
\ No newline at end of file
@@ -5,6 +5,10 @@ if TYPE_CHECKING:
     from src.system.lane_system import LaneManager  
     from src.character.character import Character  
     from config.setting import Settings  
+    from src.system.input_system import InputFrame
+
+# Lane switch direction of each gameplay key
+LANE_DIRECTIONS = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}
 
 class CharacterController:
     def __init__(
@@ -24,25 +28,25 @@ class CharacterController:
         self.character = character
         self.lane_manager = lane_manager
         self.settings = settings
-        self.lane_switch_start_time = 0
+        self.lane_switch_elapsed = 0.0  # Simulated seconds since the switch started
         self.lane_switch_duration = 0.2  # Duration of lane switch in seconds
         self.is_lane_switch_in_progress = False
         
         # New attributes to control lane switching
-        self.lane_switch_start_time = 0
+        self.lane_switch_elapsed = 0.0  # Simulated seconds since the switch started
         self.lane_switch_duration = 0.2  # Duration of lane switch in seconds
         self.is_lane_switch_in_progress = False
 
-    def handle_input(self, keys_pressed):
-        if not (keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_RIGHT]):
-            self.lane_manager.can_switch = True  # Reset the switch flag when keys are released
-        
-        if keys_pressed[pygame.K_LEFT] and self.lane_manager.can_switch:
-            if self.lane_manager.switch_lane(-1):
-                self._start_lane_switch()
-        
-        elif keys_pressed[pygame.K_RIGHT] and self.lane_manager.can_switch:
-            if self.lane_manager.switch_lane(1):
+    def handle_input(self, step_input: 'InputFrame'):
+        """
+        Switch lanes for every arrow key pressed since the previous step.
+
+        Args:
+            step_input (InputFrame): Input taken from the InputSystem for this step
+        """
+        for key in step_input.pressed:
+            direction = LANE_DIRECTIONS.get(key)
+            if direction and self.lane_manager.switch_lane(direction):
                 self._start_lane_switch()
     
     def _start_lane_switch(self):
@@ -53,7 +57,7 @@ class CharacterController:
         target_x = self.lane_manager.get_lane_center(self.lane_manager.current_lane, self.character.width)
         self.character.target_x = target_x
         self.is_lane_switch_in_progress = True
-        self.lane_switch_start_time = pygame.time.get_ticks()
+        self.lane_switch_elapsed = 0.0
 
         debug.log('movement', 
             f"Lane Switch Details:\n"
@@ -64,6 +68,7 @@ class CharacterController:
         )
 
         self.character.is_switching_lanes = True
+        self.character.set_animation_state(self.is_lane_switch_in_progress)
         
     def update(self, dt: float, game_speed: float = None):
         """
@@ -85,6 +90,9 @@ class CharacterController:
         if not self.is_lane_switch_in_progress:
             self.character.is_switching_lanes = False
 
+        # Advance the current animation
+        self.character.animate()
+
     def _update_lane_switch(self, dt: float):
         """
         Smoothly update character position during lane switching.
@@ -92,12 +100,12 @@ class CharacterController:
         Args:
             dt (float): Delta time since last frame
         """
-        # Calculate elapsed time
-        current_time = pygame.time.get_ticks()
-        elapsed_time = (current_time - self.lane_switch_start_time) / 1000.0
+        # Calculate elapsed time from the simulation steps, not the wall clock,
+        # so a switch takes the same number of steps at any frame rate
+        self.lane_switch_elapsed += dt
         
         # Calculate movement progress
-        progress = min(elapsed_time / self.lane_switch_duration, 1.0)
+        progress = min(self.lane_switch_elapsed / self.lane_switch_duration, 1.0)
         
         # Use a more precise easing function
         smooth_progress = self._cubic_ease_in_out(progress)
@@ -120,6 +128,7 @@ class CharacterController:
             self.character.force_position(end_x)
             self.is_lane_switch_in_progress = False
             self.character.is_switching_lanes = False
+            self.character.set_animation_state(self.is_lane_switch_in_progress)
     
     def _cubic_ease_in_out(self, t: float) -> float:
         """
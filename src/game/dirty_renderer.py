@@ -0,0 +1,116 @@
+# src/game/dirty_renderer.py
+from typing import Callable, Hashable, List, Optional
+import pygame
+from src.utils.debug_section import debug
+
+renderer_log = debug.section('performance')
+
+class DirtyRectRenderer:
+    """
+    Gameplay renderer that only pushes changed screen regions to the display.
+
+    The static scene (background and lanes) is drawn into a cached surface.
+    While it stays the same, a frame restores the areas covered by last
+    frame's sprites from that cache, draws the sprites again and updates only
+    those rectangles. Whenever the static scene changes (e.g. the background
+    scrolled by a pixel) the frame falls back to a full redraw and flip.
+    """
+
+    def __init__(self, screen: pygame.Surface, max_dirty_fraction: float = 0.5):
+        """
+        Initialize the renderer
+
+        Args:
+            screen (pygame.Surface): Display surface
+            max_dirty_fraction (float): Above this share of the screen a full flip is cheaper
+        """
+        self.screen = screen
+        self.max_dirty_fraction = max_dirty_fraction
+        self.background: Optional[pygame.Surface] = None
+        self.background_key = None
+        self.previous_rects: List[pygame.Rect] = []
+        self.full_redraw_needed = True
+
+        # Statistics
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.updated_pixels = 0
+
+    def invalidate(self):
+        """Force a full redraw next frame (e.g. after a menu drew over the screen)"""
+        self.full_redraw_needed = True
+
+    def render(
+        self,
+        background_key: Hashable,
+        draw_background: Callable[[pygame.Surface], None],
+        draw_sprites: Callable[[pygame.Surface], List[pygame.Rect]]
+    ):
+        """
+        Draw and present one frame
+
+        Args:
+            background_key (Hashable): Changes whenever the static scene looks different
+            draw_background (callable): Draws the static scene onto the surface it is given
+            draw_sprites (callable): Draws the moving parts onto the screen, returns the touched rects
+        """
+        screen_size = self.screen.get_size()
+        if self.background is None or self.background.get_size() != screen_size:
+            self.background = pygame.Surface(screen_size).convert()
+            self.background_key = None
+
+        if background_key != self.background_key:
+            draw_background(self.background)
+            self.background_key = background_key
+            self.full_redraw_needed = True
+
+        if self.full_redraw_needed:
+            self.screen.blit(self.background, (0, 0))
+            self.previous_rects = [rect for rect in draw_sprites(self.screen) if rect]
+            pygame.display.flip()
+            self.full_redraw_needed = False
+            self.full_frames += 1
+            self.updated_pixels += screen_size[0] * screen_size[1]
+            return
+
+        # Restore the background under last frame's sprites, then draw them again
+        for rect in self.previous_rects:
+            self.screen.blit(self.background, rect, rect)
+        sprite_rects = [rect for rect in draw_sprites(self.screen) if rect]
+
+        dirty_rects = self.previous_rects + sprite_rects
+        self.previous_rects = sprite_rects
+
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if dirty_area > self.max_dirty_fraction * screen_size[0] * screen_size[1]:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.updated_pixels += screen_size[0] * screen_size[1]
+        else:
+            pygame.display.update(dirty_rects)
+            self.partial_frames += 1
+            self.updated_pixels += dirty_area
+
+    def get_stats(self) -> dict:
+        """
+        Get rendering statistics
+
+        Returns:
+            dict: Full and partial frame counts and the average share of pixels updated
+        """
+        frames = self.full_frames + self.partial_frames
+        screen_pixels = self.screen.get_width() * self.screen.get_height()
+        return {
+            'full_frames': self.full_frames,
+            'partial_frames': self.partial_frames,
+            'updated_pixel_share': self.updated_pixels / (frames * screen_pixels) if frames else 0.0
+        }
+
+    def log_stats(self):
+        """Write the rendering statistics to the performance log"""
+        if __debug__ and renderer_log.enabled:
+            stats = self.get_stats()
+            renderer_log.log(
+                "Dirty-rect renderer: %d full frames, %d partial frames, %.1f%% of pixels updated",
+                stats['full_frames'], stats['partial_frames'], stats['updated_pixel_share'] * 100
+            )
@@ -0,0 +1,68 @@
+# src/game/fixed_timestep.py
+from src.utils.debug_section import debug
+
+performance_log = debug.section('performance')
+
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into fixed simulation steps.
+
+    Each frame adds its duration to the accumulator, and the game runs one
+    simulation step per whole `step_dt` collected. The leftover fraction is
+    exposed as `alpha`, so rendering can interpolate between the last two
+    simulation states. Gameplay then advances the same way at 30, 60 or
+    144 FPS. A very slow frame runs at most `max_steps` steps; the time
+    beyond that is dropped instead of snowballing into ever slower frames.
+    """
+
+    def __init__(self, step_dt: float = 1 / 60, max_steps: int = 5):
+        """
+        Initialize the accumulator
+
+        Args:
+            step_dt (float): Duration of one simulation step in seconds
+            max_steps (int): Most steps run for a single frame
+        """
+        self.step_dt = step_dt
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+        # Statistics
+        self.total_steps = 0
+        self.dropped_steps = 0
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Add a frame's duration and take the number of steps it completes
+
+        Args:
+            frame_dt (float): Time since the previous frame in seconds
+
+        Returns:
+            int: Simulation steps to run before rendering this frame
+        """
+        if frame_dt > 0:
+            self.accumulator += frame_dt
+
+        # The epsilon keeps exact multiples (e.g. 1/60 at 60 FPS) from losing a step to rounding
+        steps = int(self.accumulator / self.step_dt + 1e-9)
+        if steps > self.max_steps:
+            dropped = steps - self.max_steps
+            self.dropped_steps += dropped
+            self.accumulator -= dropped * self.step_dt
+            steps = self.max_steps
+            if __debug__ and performance_log.enabled:
+                performance_log.log("Slow frame (%.1f ms): dropped %d simulation steps", frame_dt * 1000, dropped)
+
+        self.accumulator = max(0.0, self.accumulator - steps * self.step_dt)
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Progress towards the next step (0-1), used to interpolate rendering"""
+        return min(1.0, self.accumulator / self.step_dt)
+
+    def reset(self):
+        """Forget accumulated time (e.g. after the pause menu)"""
+        self.accumulator = 0.0
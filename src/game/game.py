@@ -8,15 +8,29 @@ from src.game.game_state import current_game_state
 from src.system.lane_system import LaneManager
 from src.game.world import World
 from src.utils.debug_section import debug
-from src.items import Item, ItemSpawner
+from src.items import Item, ItemSpawner, ItemType, item_atlas, ItemStore, ItemPool, NUMPY_AVAILABLE
 from src.utils.constant import Colors
 from src.system.movement import move_character
+from src.system.input_system import InputSystem
 from src.utils.resource_manager import ResourceManager
-from src.system.collision import CollisionManager
+from src.system.collision import CollisionManager, LaneItemIndex
 from src.ui.score_ui import ScoreUI
+from src.ui.static_layer import StaticLayerCache
+from src.ui.loading_screen import LoadingScreen
+from src.ui.performance_hud import PerformanceHUD
 from src.ui.game_over_screen import GameOverScreen
 from src.game.game_state import current_game_state
+from src.game.replay import ReplayRecorder
+from src.utils.music_manager import music_manager, MUSIC_END_EVENT
+from src.utils.frame_profiler import FrameProfiler
+from src.game.dirty_renderer import DirtyRectRenderer
+from src.game.fixed_timestep import FixedTimestep
 import sys
+
+# Cached section handles for logging on the per-frame path
+game_log = debug.section('game')
+performance_log = debug.section('performance')
+
 class Game:
     def __init__(self):
         # Add print statements to verify logging
@@ -31,6 +45,9 @@ class Game:
             debug.log('init', "Attempting to initialize pygame")
             self.initialize_pygame()
             
+            debug.log('init', "Attempting to load assets")
+            self.load_assets()
+            
             debug.log('init', "Attempting to initialize game objects")
             self.initialize_game_objects()
             
@@ -59,8 +76,23 @@ class Game:
         self.RED = Colors.RED
         self.GRAY = Colors.GRAY
         self.GRAY_HOVER = Colors.GRAY_HOVER
+        self.OVERLAY_COLORKEY = Colors.MAGENTA
         self.game_speed = 3.0
         self.current_level = 1
+        
+        # Seeded session random stream and replay recording
+        self.session_seed = None
+        self.rng = random.Random()
+        self.record_replays = True
+        self.replay_directory = 'replays'
+        self.replay_recorder = None
+        
+        # Frame limiter of the game loop (0 runs uncapped, e.g. for benchmarks)
+        self.max_fps = 60
+        # Seconds fed to the simulation per frame instead of the measured time (benchmarks)
+        self.fixed_frame_time = None
+        # Position of the rendered frame between the last two simulation steps
+        self.render_alpha = 1.0
         debug.log('init', "Game variables initialized")
 
     def initialize_pygame(self):
@@ -69,28 +101,86 @@ class Game:
         self.screen_width = 800
         self.screen_height = 600
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        try:
-            pygame.mixer.music.load('path/to/your/background_music.mp3')
-            pygame.mixer.music.set_volume(self.settings.bg_music_volume / 100)
-            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-        except Exception as e:
-            debug.error('audio', f"Failed to load background music: {e}")
+        # Background music is streamed by the music manager (menus and levels pick their track)
+        music_manager.play('background-menu')
         pygame.display.set_caption('CollectCat')
         debug.log('init', f"Screen dimensions set to {self.screen_width}x{self.screen_height}")
 
+    def load_assets(self):
+        """
+        Start decoding the assets and show progress until the menu assets are ready
+        
+        Gameplay images and sounds keep decoding in the background; anything
+        requested before it is ready is waited for on demand.
+        """
+        LoadingScreen(self.screen).run('menu')
+
     def initialize_game_objects(self):
         self.settings = current_settings
         self.lane_manager = LaneManager(self.screen_width, num_lanes=3)
         self.character = None
+        self.item_store = self.create_item_store()
+        self.item_pool = self.create_item_pool()
         self.item_spawner = ItemSpawner(
             screen_width=self.screen_width, 
             screen_height=self.screen_height,
-            num_lanes=self.lane_manager.num_lanes  # Assuming you have a lane manager
+            num_lanes=self.lane_manager.num_lanes,  # Assuming you have a lane manager
+            item_factory=self.item_pool.acquire
         )
-        # Initialize items list
+        # Initialize items list and its collision broad phase
         self.items = []
+        self.item_index = LaneItemIndex(self.item_spawner.lane_positions)
+        self.dirty_renderer = None
+        self.static_layers = StaticLayerCache()
+        # Per-phase frame timing, shown by the HUD while show_fps is on (F3)
+        self.frame_profiler = FrameProfiler()
+        self.performance_hud = PerformanceHUD(self.frame_profiler)
+        # Sole reader of the event queue during gameplay
+        self.input_system = InputSystem()
+        self.input_system.subscribe(MUSIC_END_EVENT, music_manager.handle_event)
+        self.input_system.subscribe(pygame.KEYDOWN, self.performance_hud.handle_event)
         debug.log('init', "Settings and Lane manager initialized")
 
+    def create_item_store(self):
+        """
+        Create the vectorized item store if it is enabled and NumPy is installed
+        
+        Returns:
+            ItemStore or None: New store, or None to use plain Item objects
+        """
+        if not self.settings.numpy_item_store:
+            return None
+        if not NUMPY_AVAILABLE:
+            debug.log('init', "NumPy not installed, items are updated one by one")
+            return None
+        return ItemStore()
+
+    def create_item_pool(self):
+        """
+        Create the item pool, recycling through the item store when there is one
+        
+        Returns:
+            ItemPool: New pool used as the spawner's item factory
+        """
+        if self.item_store is not None:
+            return ItemPool(
+                self.settings.item_pool_size,
+                create=self.item_store.create,
+                recycle=self.item_store.recycle
+            )
+        return ItemPool(self.settings.item_pool_size)
+
+    def create_dirty_renderer(self):
+        """
+        Create the dirty-rectangle renderer if it is enabled
+        
+        Returns:
+            DirtyRectRenderer or None: New renderer, or None to flip full frames
+        """
+        if not self.settings.dirty_rect_rendering:
+            return None
+        return DirtyRectRenderer(self.screen)
+
     def initialize_menus(self):
         try:
             debug.log('menu', "Initializing menus")
@@ -137,6 +227,9 @@ class Game:
         self.idle_images = [self.default_surface]
         self.running_images = [self.default_surface]
         self.world = World(self.screen_width, self.screen_height)
+        
+        # Decode and scale every texture an item can be drawn with once, before any item spawns
+        item_atlas.build(ItemType.all_types(), Item.image_paths_for)
         debug.log('init', "Images initialized")
 
     
@@ -186,29 +279,9 @@ class Game:
         self.score_ui = ScoreUI(self.screen_width, self.screen_height)
                 
     #HANDLE EVENT SESSION
-    def handle_input(self, keys_pressed):
-        """
-        Handle lane switching based on key presses.
-        
-        Args:
-            keys_pressed: Pygame key state dictionary
-        """
-        if not (keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_RIGHT]):
-            self.lane_manager.can_switch = True  # Reset the switch flag when keys are released
-        
-        if keys_pressed[pygame.K_LEFT] and self.lane_manager.can_switch:
-            if self.lane_manager.switch_lane(-1):
-                self.character.is_switching_lanes = True
-                self.character.target_x = self.lane_manager.current_lane_position
-        
-        elif keys_pressed[pygame.K_RIGHT] and self.lane_manager.can_switch:
-            if self.lane_manager.switch_lane(1):
-                self.character.is_switching_lanes = True
-                self.character.target_x = self.lane_manager.current_lane_position
-
     def handle_pause(self):
         debug.log('game', "Game paused")
-        pygame.mixer.music.pause()
+        music_manager.pause()
         pause_menu = PauseMenu(self.screen, current_game_state.get_screen(), self.settings)
         result = pause_menu.display()
         
@@ -230,7 +303,7 @@ class Game:
     
     def resume_game(self):
         # Resume music
-        pygame.mixer.music.unpause()
+        music_manager.resume()
 
     def handle_settings_from_pause(self):
         debug.log('settings', "Entering settings from pause menu")
@@ -245,22 +318,56 @@ class Game:
         
         return 'resume'  # Default fallback
     
-    def handle_character_movement(self):
-        keys_pressed = pygame.key.get_pressed()
-        if hasattr(self, 'character_controller'):
-            self.character_controller.handle_input(keys_pressed)
-            self.character_controller.update(1/60)
-
     def handle_game_logic(self):
-        keys_pressed = pygame.key.get_pressed()
-        move_character(self.character, keys_pressed, self.lane_manager, self.settings)
-        debug.log('game', "Game logic handled")
+        move_character(self.character, self.lane_manager, self.settings)
+        game_log.log("Game logic handled")
     
-    # In game.py, modify the check_collisions method
-    def check_collisions(self):
+    def step_simulation(self, dt, step_input):
+        """
+        Advance gameplay by one fixed simulation step
+        
+        The game loop runs this as often as the fixed timestep requires and
+        headless simulations run it directly, so both advance identically.
+        
+        Args:
+            dt (float): Simulation step in seconds
+            step_input (InputFrame): Input taken from the input system for this step
+        
+        Returns:
+            str or None: 'game_over' or 'win' if the level ended this step
+        """
+        # Phase marks are ignored outside a profiled frame (e.g. headless runs)
+        profiler = self.frame_profiler
+        
+        # Drawing interpolates from the state before this step
+        if self.character:
+            self.character.store_previous_position()
+        
+        if hasattr(self, 'character_controller'):
+            self.character_controller.handle_input(step_input)
+        profiler.mark('input')
+        
+        self.score_ui.update(dt)
+        self.handle_game_logic()
+        # Moves the items and the world, and advances the character controller
+        self.update_game_state(dt)
+        profiler.mark('update')
+        
+        outcome = self.resolve_collisions()
+        profiler.mark('collisions')
+        return outcome
+    
+    def resolve_collisions(self):
+        """
+        Apply item collisions to the score without showing any screen
+        
+        Returns:
+            str or None: 'game_over', 'win' or None if play continues
+        """
         collision_results = CollisionManager.check_item_collisions(
             self.character, 
-            self.items
+            self.items,
+            self.item_index
         )
         
         if collision_results:
@@ -268,37 +375,93 @@ class Game:
             win_triggered = self.score_ui.add_score(collision_results['score_change'])
             
             # Remove collected items
-            for item in collision_results['items_to_remove']:
-                self.items.remove(item)
+            self.remove_items(collision_results['items_to_remove'])
             
             # Check for game over or win condition
             if self.score_ui.total_score < 0:  # Game over if score is less than 0
                 debug.log('game', f"Game over. Final score: {self.score_ui.total_score}")
-                return self.show_game_over_screen()
+                return 'game_over'
             
             # Win condition check based on current level
             if win_triggered:
                 debug.log('game', f"Level {current_game_state.get_level()} completed!")
-                return self.show_game_over_screen(is_win=True)
+                return 'win'
+        
+        return None
+
+    def remove_items(self, items_to_remove):
+        """
+        Remove items from the game and the collision broad phase, then recycle them
+        
+        Args:
+            items_to_remove (list): Items to remove
+        """
+        if not items_to_remove:
+            return
+        for item in items_to_remove:
+            self.item_index.remove(item)
+            if self.item_store is not None:
+                self.item_store.release(item)
+        removed_ids = {id(item) for item in items_to_remove}
+        self.items = [item for item in self.items if id(item) not in removed_ids]
+        self.item_pool.release_many(items_to_remove)
+
+    def check_collisions(self):
+        return self.end_level(self.resolve_collisions())
+
+    def end_level(self, outcome):
+        """
+        Save the replay and show the game over screen if the level ended
         
+        Args:
+            outcome (str or None): Result of resolve_collisions
+        
+        Returns:
+            str or None: Choice made on the game over screen, None if play continues
+        """
+        if outcome:
+            self.finish_replay(outcome)
+        if outcome == 'game_over':
+            return self.show_game_over_screen()
+        if outcome == 'win':
+            return self.show_game_over_screen(is_win=True)
         return None
 
     # RENDER SESSION#
-    def draw_lanes(self):
+    def draw_lanes(self, surface=None):
         """
         Draw visual markers for lanes (optional)
+        
+        Args:
+            surface (pygame.Surface, optional): Target surface, defaults to the screen
+        """
+        surface = surface or self.screen
+        surface.blit(self.get_lane_overlay(), (0, 0))
+        game_log.log("Lanes drawn")
+
+    def get_lane_overlay(self):
         """
-        lane_width = self.screen_width // self.lane_manager.num_lanes
+        Get the pre-rendered lane markers, rebuilt when the lanes or screen size change
+        
+        Returns:
+            pygame.Surface: Transparent overlay with the lane markers
+        """
+        return self.static_layers.get(
+            'lanes', (self.screen_width, self.screen_height), self._build_lane_overlay,
+            theme=(self.lane_manager.num_lanes, self.lane_manager.lane_width),
+            colorkey=self.OVERLAY_COLORKEY
+        )
+
+    def _build_lane_overlay(self, surface):
         for i in range(1, self.lane_manager.num_lanes):
-            x = i * lane_width
-            pygame.draw.line(self.screen, (200, 200, 200), 
-                           (x, 0), (x, self.screen_height), 2)
-        debug.log('game', "Lanes drawn")
+            x = i * self.lane_manager.lane_width
+            pygame.draw.line(surface, (200, 200, 200), 
+                           (x, 0), (x, surface.get_height()), 2)
     
     def draw_items(self):
         for item in self.items:
-            item.draw(self.screen)
-        debug.log('game', "Items drawn")
+            item.draw(self.screen, self.render_alpha)
+        game_log.log("Items drawn")
     
     def draw_score(self):
         """
@@ -313,14 +476,14 @@ class Game:
             # Clear the screen
             self.screen.fill(self.WHITE)
             # Draw world background
-            self.world.draw(self.screen)
+            self.world.draw(self.screen, self.render_alpha)
             # Draw lanes
             self.draw_lanes()
             # Draw items
             self.draw_items()
             # Draw character
             if self.character:
-                self.character.draw(self.screen)
+                self.character.draw(self.screen, self.render_alpha)
             # Draw score
             self.draw_score()
             
@@ -329,10 +492,71 @@ class Game:
         except Exception as e:
             debug.error('game', f"Error in draw_game_state: {e}")
     
+    def draw_static_scene(self, surface):
+        """
+        Draw the parts of a frame that only change when the background scrolls
+        
+        Args:
+            surface (pygame.Surface): Target surface
+        """
+        surface.fill(self.WHITE)
+        self.world.draw(surface, self.render_alpha)
+        self.draw_lanes(surface)
+
+    def draw_sprites(self, surface):
+        """
+        Draw the moving parts of a frame
+        
+        Args:
+            surface (pygame.Surface): Target surface
+        
+        Returns:
+            list: Screen areas touched by the character, the items, the score panel and the HUD
+        """
+        profiler = self.frame_profiler
+        profiler.mark('draw_background')
+        drawn_rects = []
+        if self.character:
+            drawn_rects.append(self.character.draw(surface, self.render_alpha))
+        profiler.mark('draw_character')
+        alpha = self.render_alpha
+        for item in self.items:
+            drawn_rects.append(item.draw(surface, alpha))
+        profiler.mark('draw_items')
+        drawn_rects.append(self.score_ui.draw(surface))
+        profiler.mark('draw_score')
+        drawn_rects.append(self.performance_hud.draw(surface))
+        profiler.mark('draw_hud')
+        return drawn_rects
+
+    def render_frame(self):
+        """
+        Draw the gameplay frame and present it, updating only dirty areas when possible
+        """
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.render(
+                self.world.get_render_key(self.render_alpha),
+                self.draw_static_scene,
+                self.draw_sprites
+            )
+        else:
+            self.draw_static_scene(self.screen)
+            self.draw_sprites(self.screen)
+            pygame.display.flip()
+        self.frame_profiler.mark('flip')
+
     def draw_lane_debug(self, screen):
         """
         Draw lane boundaries for visual debugging
         """
+        overlay = self.static_layers.get(
+            'lane_debug', screen.get_size(), self._build_lane_debug_overlay,
+            theme=(self.lane_manager.num_lanes, self.lane_manager.lane_width),
+            colorkey=self.OVERLAY_COLORKEY
+        )
+        screen.blit(overlay, (0, 0))
+
+    def _build_lane_debug_overlay(self, screen):
         for i, lane in enumerate(self.lane_manager.lanes):
             # Draw lane boundary
             x_start = i * self.lane_manager.lane_width
@@ -349,31 +573,41 @@ class Game:
                             1)
     
     #Game loop SESSION
-    def game_loop(self):
+    def game_loop(self, max_frames=None):
+        """
+        Run the level until it ends, the player quits or leaves through the pause menu
+        
+        Args:
+            max_frames (int, optional): Leave the loop after this many frames (benchmarks)
+        
+        Returns:
+            str: Next screen ('main_menu', 'quit', or the game over screen's choice)
+        """
         debug.log('game', "GAME LOOP: Entering game loop")
         try:
             clock = pygame.time.Clock()
             game_running = True
             frame_count = 0
             
+            # Gameplay advances in fixed steps; rendering interpolates between them
+            timestep = FixedTimestep(1 / self.settings.simulation_rate, self.settings.max_simulation_steps)
+            
             # Initialize last time for delta time calculation
             last_time = pygame.time.get_ticks()
 
+            profiler = self.frame_profiler
             while game_running:
                 frame_count += 1
-                
-                # Calculate delta time
-                current_time = pygame.time.get_ticks()
-                dt = (current_time - last_time) / 1000.0  # Convert to seconds
-                self.score_ui.update(dt)
-                last_time = current_time
+                profiler.begin_frame()
                 
                 # Extensive logging for each frame
-                if frame_count % 60 == 0:  # Log every 60 frames
-                    debug.log('game', f"GAME LOOP: Frame {frame_count}, Current state tracking")
+                if __debug__ and game_log.enabled and frame_count % 60 == 0:  # Log every 60 frames
+                    game_log.log("GAME LOOP: Frame %d, Current state tracking", frame_count)
 
                 # Event handling
-                for event in pygame.event.get():
+                # The input system drains the queue once, feeding the music manager,
+                # the HUD and the gameplay key buffer
+                for event in self.input_system.poll():
                     if event.type == pygame.QUIT:
                         debug.log('game', "GAME LOOP: Quit event detected")
                         return 'quit'
@@ -388,47 +622,61 @@ class Game:
                             return 'main_menu'
                         elif pause_result != 'resume':
                             return pause_result
+                        
+                        self.resume_game()
+                        
+                        # The pause menu drew over the whole screen
+                        if self.dirty_renderer is not None:
+                            self.dirty_renderer.invalidate()
+                        # Time spent in the pause menu is neither frame time nor game time
+                        profiler.discard_frame()
+                        last_time = pygame.time.get_ticks()
+                        timestep.reset()
+                        # The pause menu consumed the key events of its keys
+                        self.input_system.clear()
                     
                     # Additional event handling if needed
                 
-                # Get current key states
-                keys_pressed = pygame.key.get_pressed()
+                # Start a queued music track whose end event was missed
+                music_manager.update()
+                
+                # Calculate delta time
+                current_time = pygame.time.get_ticks()
+                dt = (current_time - last_time) / 1000.0  # Convert to seconds
+                last_time = current_time
+                if self.fixed_frame_time is not None:
+                    dt = self.fixed_frame_time
+                profiler.mark('events')
                 
                 # Game logic
                 try:
-                    # Handle character movement with delta time
-                    # Use character_controller instead of character.controller
-                    if hasattr(self, 'character_controller'):
-                        self.character_controller.handle_input(keys_pressed)
-                        self.character_controller.update(dt)
-                    
-                    # Other game logic updates
-                    self.handle_game_logic()
-                    self.update_game_state(dt)  # Pass dt to update_game_state
-                    
-                    # Collision check with detailed logging
-                    game_over_result = self.check_collisions()
-                    if game_over_result:
-                        debug.log('game', f"GAME LOOP: Game over result - {game_over_result}")
-                        return game_over_result
+                    # Run as many fixed steps as the frame time covers (possibly none);
+                    # each step charges its input, update and collision phases
+                    for _ in range(timestep.advance(dt)):
+                        # Presses buffered since the last step; later steps of the frame get none
+                        step_input = self.input_system.take_frame()
+                        if self.replay_recorder:
+                            self.replay_recorder.record_step(step_input)
+                        
+                        outcome = self.step_simulation(timestep.step_dt, step_input)
+                        if outcome:
+                            game_over_result = self.end_level(outcome)
+                            debug.log('game', f"GAME LOOP: Game over result - {game_over_result}")
+                            return game_over_result
 
                     # Rendering
-                    self.screen.fill(self.WHITE)
-                    self.world.draw(self.screen)
-                    self.draw_lanes()
-                    if self.character:
-                        self.character.draw(self.screen)
-                    self.draw_items()
-                    
-                    # Draw the new score UI
-                    self.score_ui.draw(self.screen)
-                    
-                    pygame.display.flip()
+                    self.render_alpha = timestep.alpha if self.settings.interpolate_rendering else 1.0
+                    self.render_frame()
                     
                     # Performance monitoring
-                    fps = clock.get_fps()
-                    debug.log('performance', f"FPS: {fps:.2f}")
-                    clock.tick(60)
+                    if __debug__ and performance_log.enabled:
+                        performance_log.log("FPS: %.2f", clock.get_fps())
+                    clock.tick(self.max_fps)
+                    profiler.mark('frame_limit')
+                    profiler.end_frame()
+                    
+                    if max_frames is not None and frame_count >= max_frames:
+                        game_running = False
 
                 except Exception as logic_error:
                     debug.error('game', f"GAME LOOP LOGIC ERROR: {logic_error}")
@@ -448,82 +696,153 @@ class Game:
 
     
     # UPDATE GAME STATE SESSION
-    def start_game(self, level):
+    def finish_replay(self, outcome=None):
         """
-        Initialize and start the game for a specific level with full reset
+        Close and save the replay of the current level session, if any
+        
+        Args:
+            outcome (str, optional): 'win', 'game_over' or None if play was interrupted
+        """
+        recorder = self.replay_recorder
+        self.replay_recorder = None
+        if recorder is None or recorder.step_count == 0:
+            return
+        recorder.finish(outcome, self.score_ui.total_score)
+        recorder.save(self.replay_directory)
+
+    def setup_level(self, level, seed=None):
+        """
+        Reset all gameplay state for a level without entering the game loop
         
         Args:
             level (int or str): The selected game level
+            seed (int, optional): Seed for the session random stream (random if omitted)
         
         Returns:
-            str: Game result ('quit', 'restart', 'main_menu', 'level_selection')
+            bool: True if the level is ready to be played
         """
-        debug.log('game', f"START GAME: Attempting to start level {level}")
+        # Ensure level is converted to an integer
+        level = int(level)
+        
+        # Close the replay of a previous session that is being replaced
+        self.finish_replay()
+        
+        # Every random draw of the session comes from one seeded stream
+        self.session_seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.session_seed)
+        debug.log('game', f"Session seed for level {level}: {self.session_seed}")
+        
+        # Presses buffered before the level started must not move the new character
+        self.input_system.clear()
+        
+        # Set the current game state
+        current_game_state.set_screen('game')
+        current_game_state.set_level(level)
+        
+        # FULL RESET OF GAME STATE
+        # Reset all critical game variables
+        # Reset the score UI
+        self.score_ui.reset_score()
+        # Items still on screen go back to the pool, which is kept across levels
+        self.remove_items(self.items)
+        self.item_pool.log_stats()
+        if self.item_store is not None:
+            self.item_store.clear()
+        self.game_speed = 3.0  # Reset game speed
+        
+        # Reinitialize lane manager
+        self.lane_manager = LaneManager(self.screen_width, num_lanes=3)
+        
+        # Reinitialize item spawner with current screen dimensions
+        self.item_spawner = ItemSpawner(
+            screen_width=self.screen_width, 
+            screen_height=self.screen_height,
+            num_lanes=self.lane_manager.num_lanes,
+            current_level=level,  # Pass the current level
+            rng=self.rng,
+            item_factory=self.item_pool.acquire
+        )
+        self.item_index = LaneItemIndex(self.item_spawner.lane_positions)
+        
+        # Start the level with a fresh renderer (cached background and dirty rects)
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.log_stats()
+        self.dirty_renderer = self.create_dirty_renderer()
+        self.frame_profiler.reset()
+        
+        # Reinitialize character
         try:
-            # Ensure level is converted to an integer
-            level = int(level)
+            # Calculate initial lane center
+            initial_x = self.lane_manager.get_lane_center(
+                self.lane_manager.current_lane, 
+                50  # hardcoded character width
+            )
             
-            # Set the current game state
-            current_game_state.set_screen('game')
-            current_game_state.set_level(level)
+            # Recreate character with explicit parameters
+            self.character = Character(
+                x=initial_x,
+                y=self.screen_height - 100,
+                width=50,
+                height=50,
+                color='RED'
+            )
             
-            # FULL RESET OF GAME STATE
-            # Reset all critical game variables
-            # Reset the score UI
-            self.score_ui.reset_score()
-            self.items = []  # Clear existing items
-            self.game_speed = 3.0  # Reset game speed
-            
-            # Reinitialize lane manager
-            self.lane_manager = LaneManager(self.screen_width, num_lanes=3)
-            
-            # Reinitialize item spawner with current screen dimensions
-            self.item_spawner = ItemSpawner(
-                screen_width=self.screen_width, 
-                screen_height=self.screen_height,
-                num_lanes=self.lane_manager.num_lanes,
-                current_level=level  # Pass the current level
+            # Recreate character controller
+            self.character_controller = CharacterController(
+                character=self.character,
+                lane_manager=self.lane_manager,
+                settings=self.settings
             )
             
-            # Reinitialize character
-            try:
-                # Calculate initial lane center
-                initial_x = self.lane_manager.get_lane_center(
-                    self.lane_manager.current_lane, 
-                    50  # hardcoded character width
-                )
-                
-                # Recreate character with explicit parameters
-                self.character = Character(
-                    x=initial_x,
-                    y=self.screen_height - 100,
-                    width=50,
-                    height=50,
-                    color='RED'
-                )
-                
-                # Recreate character controller
-                self.character_controller = CharacterController(
-                    character=self.character,
-                    lane_manager=self.lane_manager,
-                    settings=self.settings
-                )
-                
-            except Exception as character_error:
-                debug.error('game', f"Character reinitialization failed: {character_error}")
+        except Exception as character_error:
+            debug.error('game', f"Character reinitialization failed: {character_error}")
+            return False
+        
+        # Optional: Level-specific initialization
+        # You could add level-specific settings or difficulty here
+        if level == 2:
+            self.game_speed = 4.0  # Faster for level 2
+            self.item_spawner.difficulty_multiplier = 1.2
+        elif level == 3:
+            self.game_speed = 5.0  # Even faster for level 3
+            self.item_spawner.difficulty_multiplier = 1.5
+        
+        if self.record_replays:
+            self.replay_recorder = ReplayRecorder(
+                self.session_seed, level, 1 / self.settings.simulation_rate
+            )
+        
+        return True
+
+    def start_game(self, level):
+        """
+        Initialize and start the game for a specific level with full reset
+        
+        Args:
+            level (int or str): The selected game level
+        
+        Returns:
+            str: Game result ('quit', 'restart', 'main_menu', 'level_selection')
+        """
+        debug.log('game', f"START GAME: Attempting to start level {level}")
+        try:
+            if not self.setup_level(level):
                 return 'main_menu'
-            
-            # Optional: Level-specific initialization
-            # You could add level-specific settings or difficulty here
-            if level == 2:
-                self.game_speed = 4.0  # Faster for level 2
-                self.item_spawner.difficulty_multiplier = 1.2
-            elif level == 3:
-                self.game_speed = 5.0  # Even faster for level 3
-                self.item_spawner.difficulty_multiplier = 1.5
+            music_manager.play(f"level_{int(level)}")
+            ResourceManager.get_instance().pin_screen_assets(
+                'game',
+                images=['character_idle', 'character_run'],
+                animations=['character_run'],
+                sounds=['collect_good_item', 'collect_bad_item']
+            )
             
             # Actual game loop
-            result = self.game_loop()
+            try:
+                result = self.game_loop()
+            finally:
+                # Save the replay if the session was left without a result
+                self.finish_replay()
+                self.frame_profiler.report()
             
             # Log the result with full tracing
             debug.log('game', f"START GAME: Game loop completed with result: {result}")
@@ -548,6 +867,7 @@ class Game:
         is_good = color != (255, 0, 0)  # Red items are not good
         new_item = Item(lane, color, is_good=is_good)
         self.items.append(new_item)
+        self.item_index.add(new_item)
         debug.log('items', f"New item spawned in lane {lane} with color {color}")
     
     def update_items(self):
@@ -556,8 +876,8 @@ class Game:
             item.fall()
             if item.y > self.screen_height:
                 items_to_remove.append(item)
-        for item in items_to_remove:
-            self.items.remove(item)
+        self.item_index.refresh()
+        self.remove_items(items_to_remove)
         debug.log('items', "Items updated")
     
     
@@ -626,34 +946,52 @@ class Game:
         try:
             safe_game_speed = max(0.1, self.game_speed)
             
-            # Update existing items and track minimum fall speed
-            updated_items = []
-            for item in self.items:
-                if item.update(safe_game_speed * dt, self.screen_height):
-                    updated_items.append(item)
-                    
-                    # Track minimum fall speed
-                    if hasattr(item, 'speed'):
-                        if minimum_fall_speed == 0 or item.speed < minimum_fall_speed:
-                            minimum_fall_speed = item.speed
-            
-            self.items = updated_items
+            if self.item_store is not None:
+                # Move, cull and find the minimum speed of all items at once
+                offscreen_items, minimum_fall_speed = self.item_store.update(
+                    safe_game_speed * dt, self.screen_height
+                )
+                self.item_index.refresh()
+                self.remove_items(offscreen_items)
+            else:
+                # Update existing items and track minimum fall speed
+                updated_items = []
+                offscreen_items = []
+                for item in self.items:
+                    if item.update(safe_game_speed * dt, self.screen_height):
+                        updated_items.append(item)
+                        
+                        # Track minimum fall speed
+                        if hasattr(item, 'speed'):
+                            if minimum_fall_speed == 0 or item.speed < minimum_fall_speed:
+                                minimum_fall_speed = item.speed
+                    else:
+                        offscreen_items.append(item)
+                
+                self.items = updated_items
+                
+                # Items moved: restore the y order of the broad phase, then drop culled items
+                self.item_index.refresh()
+                for item in offscreen_items:
+                    self.item_index.remove(item)
+                self.item_pool.release_many(offscreen_items)
         except Exception as items_update_error:
             debug.error('game', f"Error updating items: {items_update_error}")
             self.items = []  # Reset items list in case of critical error
+            self.item_index.clear()
+            if self.item_store is not None:
+                self.item_store.clear()
             minimum_fall_speed = self.game_speed  # Fallback to game speed
         
         # Spawn items with robust error handling
         try:
             # Pass current items to item spawner
-            safe_game_speed = max(0.1, self.game_speed)
-            
-            # Create a method in Game class to pass current items
-            new_items = self.item_spawner.update(safe_game_speed * dt, self.items)
+            new_items = self.item_spawner.update(self.items, dt)
             
             # Add any newly spawned items to the game items list
             if new_items:
                 self.items.extend(new_items)
+                self.item_index.add_many(new_items)
                 
                 # Update minimum fall speed with newly spawned items
                 for item in new_items:
@@ -683,18 +1021,17 @@ class Game:
             debug.error('game', f"Error updating character controller: {e}")
 
         # Log the minimum fall speed and game state
-        debug.log('game', 
-            f"Game state updated. "
-            f"Speed: {self.game_speed:.2f}, "
-            f"Minimum Fall Speed: {minimum_fall_speed:.2f}, "
-            f"Items: {len(self.items)}"
-        )
+        if __debug__ and game_log.enabled:
+            game_log.log(
+                "Game state updated. Speed: %.2f, Minimum Fall Speed: %.2f, Items: %d",
+                self.game_speed, minimum_fall_speed, len(self.items)
+            )
 
         return minimum_fall_speed
     
     def apply_settings(self):
         # Apply music volume
-        pygame.mixer.music.set_volume(self.settings.bg_music_volume / 100)
+        music_manager.set_volume(self.settings.bg_music_volume / 100)
         
         # Apply window mode
         if self.settings.window_mode:
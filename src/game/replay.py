@@ -0,0 +1,166 @@
+# src/game/replay.py
+"""
+Compact session replays: the RNG seed, the fixed simulation step and the
+gameplay key presses with the step that applied them. Together with the
+seeded session RNG this is enough to re-run a session exactly, whatever the
+frame rate it was played at, e.g. with HeadlessSimulation.from_replay.
+"""
+import os
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+import pygame
+from src.utils.debug_section import debug
+from src.system.input_system import InputFrame
+
+REPLAY_FORMAT_VERSION = 3
+
+# Input bits recorded for the gameplay keys
+INPUT_LEFT = 1 << 0
+INPUT_RIGHT = 1 << 1
+
+INPUT_KEYS = (
+    (INPUT_LEFT, pygame.K_LEFT),
+    (INPUT_RIGHT, pygame.K_RIGHT)
+)
+
+KEY_BITS = {key: bit for bit, key in INPUT_KEYS}
+
+def mask_to_keys(mask: int) -> Tuple[int, ...]:
+    """
+    Decode an input bitmask into key codes
+
+    Args:
+        mask (int): Input bitmask
+
+    Returns:
+        Tuple[int, ...]: Pygame key codes
+    """
+    return tuple(key for bit, key in INPUT_KEYS if mask & bit)
+
+class ReplayRecorder:
+    """Records the gameplay key presses of one level session"""
+
+    def __init__(self, seed: int, level: int, step_dt: float = 1 / 60):
+        """
+        Args:
+            seed (int): Seed of the session random stream
+            level (int): Level being played
+            step_dt (float): Fixed simulation step in seconds
+        """
+        self.seed = seed
+        self.level = level
+        self.step_dt = step_dt
+        self.step_count = 0
+        self.final_score = None
+        self.outcome = None
+
+        # [step, key_bit] entries, one per press in the order they were applied
+        self.presses: List[List[int]] = []
+
+    def record_step(self, step_input: InputFrame):
+        """
+        Record the input of one simulation step
+
+        Args:
+            step_input (InputFrame): Input the step acted on
+        """
+        for key in step_input.pressed:
+            bit = KEY_BITS.get(key)
+            if bit:
+                self.presses.append([self.step_count, bit])
+        self.step_count += 1
+
+    def finish(self, outcome: Optional[str], final_score: int):
+        """
+        Store the session result so replays can be verified
+
+        Args:
+            outcome (str, optional): 'win', 'game_over' or None if play was interrupted
+            final_score (int): Score at the end of the session
+        """
+        self.outcome = outcome
+        self.final_score = final_score
+
+    def to_dict(self) -> dict:
+        return {
+            'version': REPLAY_FORMAT_VERSION,
+            'seed': self.seed,
+            'level': self.level,
+            'step_dt': self.step_dt,
+            'step_count': self.step_count,
+            'outcome': self.outcome,
+            'final_score': self.final_score,
+            'presses': self.presses
+        }
+
+    def save(self, directory: str = 'replays') -> Optional[str]:
+        """
+        Write the replay as JSON
+
+        Args:
+            directory (str): Output directory
+
+        Returns:
+            str or None: Path of the file, or None if saving failed
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            path = os.path.join(directory, f"level{self.level}_{self.seed}_{timestamp}.json")
+            with open(path, 'w') as replay_file:
+                json.dump(self.to_dict(), replay_file, separators=(',', ':'))
+            debug.log('game', f"Replay saved to {path} ({self.step_count} steps)")
+            return path
+        except (OSError, TypeError) as e:
+            debug.error('game', f"Failed to save replay: {e}")
+            return None
+
+class Replay:
+    """A loaded replay that can drive a simulation step by step"""
+
+    def __init__(self, data: dict):
+        """
+        Args:
+            data (dict): Replay dictionary as produced by ReplayRecorder.to_dict
+        """
+        if data.get('version') != REPLAY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+
+        self.seed = data['seed']
+        self.level = data['level']
+        self.step_dt = data['step_dt']
+        self.outcome = data.get('outcome')
+        self.final_score = data.get('final_score')
+
+        # Index the presses by step so steps can be looked up directly
+        self.presses: Dict[int, List[int]] = {}
+        self.step_count = data['step_count']
+        for step, bit in data['presses']:
+            self.presses.setdefault(step, []).extend(mask_to_keys(bit))
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """
+        Load a replay file
+
+        Args:
+            path (str): Path to a replay JSON file
+
+        Returns:
+            Replay: Loaded replay
+        """
+        with open(path) as replay_file:
+            return cls(json.load(replay_file))
+
+    def input_for_step(self, step: int) -> InputFrame:
+        """
+        Get the input a simulation step acted on
+
+        Args:
+            step (int): Step number
+
+        Returns:
+            InputFrame: Keys pressed before the step
+        """
+        return InputFrame(self.presses.get(step, ()))
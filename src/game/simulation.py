@@ -0,0 +1,300 @@
+# src/game/simulation.py
+"""
+Headless, fixed-timestep gameplay simulation.
+
+Runs the gameplay update path (Game.step_simulation: input, character
+controller, item spawning and movement, collisions) without a window, frame
+limiter or keyboard, as fast as the CPU allows. Because the game itself
+advances in the same fixed steps, a simulation matches real play at any frame
+rate. Used for balancing runs and regression checks:
+
+    python -m src.game.simulation --level 3 --minutes 60
+    python -m src.game.simulation --replay replays/level1_1234_20240101_120000.json
+"""
+import io
+import os
+import time
+import contextlib
+import random
+import argparse
+from typing import Callable, Iterable, Optional
+import pygame
+from config.setting import current_settings
+from src.utils.debug_section import debug
+from src.game.replay import Replay
+from src.system.input_system import InputFrame
+from src.utils.resource_manager import ResourceManager
+
+def alternating_lane_script(period_frames: int = 90, hold_frames: int = 6) -> Callable[[int], Iterable[int]]:
+    """
+    Build an input script that taps left and right in turn
+
+    Args:
+        period_frames (int): Frames between two taps
+        hold_frames (int): Frames each tap is held down
+
+    Returns:
+        callable: Maps a frame number to the keys held during that frame
+    """
+    def script(frame: int) -> Iterable[int]:
+        phase = frame % (period_frames * 2)
+        if phase < hold_frames:
+            return (pygame.K_LEFT,)
+        if period_frames <= phase < period_frames + hold_frames:
+            return (pygame.K_RIGHT,)
+        return ()
+    return script
+
+class HeadlessSimulation:
+    """Steps the gameplay loop with a fixed timestep and scripted input"""
+
+    def __init__(
+        self,
+        level: int = 1,
+        fixed_dt: Optional[float] = None,
+        input_script: Optional[Callable[[int], Iterable[int]]] = None,
+        input_frames: Optional[Callable[[int], InputFrame]] = None,
+        render: bool = False,
+        restart_on_finish: bool = True,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the simulation
+
+        Args:
+            level (int): Level to simulate
+            fixed_dt (float, optional): Simulation timestep in seconds, defaults to the game's step
+            input_script (callable, optional): Maps a frame number to held key codes
+            input_frames (callable, optional): Maps a frame number to recorded step input,
+                used instead of input_script
+            render (bool): Also draw every frame onto the (dummy) display surface
+            restart_on_finish (bool): Restart the level after a win or game over
+            seed (int, optional): Seed of the first level session (random if omitted)
+        """
+        # No window and no audio device; must be set before pygame initializes
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+        # Imported here so the dummy drivers are in place first
+        from src.game.game import Game
+
+        self.level = level
+        self.fixed_dt = fixed_dt if fixed_dt is not None else 1 / current_settings.simulation_rate
+        self.input_script = input_script
+        self.input_frames = input_frames
+        self.held_keys = frozenset()
+        self.render = render
+        self.restart_on_finish = restart_on_finish
+
+        # The first session uses the given seed, restarts draw new seeds from it
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.seed_stream = random.Random(self.seed)
+        self.next_seed = self.seed
+
+        # Simulated clock
+        self.frame = 0
+        self.sim_time = 0.0
+
+        # Outcome statistics
+        self.wins = 0
+        self.losses = 0
+        self.finished = False
+        self.level_start_time = 0.0
+        self.level_durations = []
+        self.last_outcome = None
+
+        self.game = Game()
+        self.game.record_replays = False
+        self._start_level()
+
+    @classmethod
+    def from_replay(cls, replay: Replay, render: bool = False) -> 'HeadlessSimulation':
+        """
+        Build a simulation that re-runs a recorded session exactly
+
+        Args:
+            replay (Replay): Loaded replay
+            render (bool): Also draw every frame
+
+        Returns:
+            HeadlessSimulation: Simulation driven by the replay input at its recorded step
+        """
+        return cls(
+            level=replay.level,
+            fixed_dt=replay.step_dt,
+            input_frames=replay.input_for_step,
+            render=render,
+            restart_on_finish=False,
+            seed=replay.seed
+        )
+
+    def _start_level(self):
+        seed = self.next_seed
+        self.next_seed = self.seed_stream.randrange(2 ** 32)
+        if not self.game.setup_level(self.level, seed=seed):
+            raise RuntimeError(f"Could not set up level {self.level}")
+        self.level_start_time = self.sim_time
+
+    def step(self) -> Optional[str]:
+        """
+        Advance the simulation by one fixed timestep
+
+        Returns:
+            str or None: 'win' or 'game_over' if the level ended this step
+        """
+        game = self.game
+        self.sim_time += self.fixed_dt
+
+        outcome = game.step_simulation(self.fixed_dt, self._next_input())
+
+        if self.render:
+            game.draw_game_state()
+
+        self.frame += 1
+
+        if outcome:
+            self._finish_level(outcome)
+        return outcome
+
+    def _next_input(self) -> InputFrame:
+        """
+        Input of the current step, from the replay or the input script
+
+        The script's held keys are turned into key events and go through the
+        game's input system, exactly like keyboard input in the game loop.
+
+        Returns:
+            InputFrame: Input for Game.step_simulation
+        """
+        if self.input_frames:
+            return self.input_frames(self.frame)
+
+        held = frozenset(self.input_script(self.frame)) if self.input_script else frozenset()
+        events = [pygame.event.Event(pygame.KEYUP, key=key) for key in sorted(self.held_keys - held)]
+        events += [pygame.event.Event(pygame.KEYDOWN, key=key) for key in sorted(held - self.held_keys)]
+        self.held_keys = held
+
+        input_system = self.game.input_system
+        input_system.process_events(events)
+        return input_system.take_frame()
+
+    def _finish_level(self, outcome: str):
+        if outcome == 'win':
+            self.wins += 1
+        else:
+            self.losses += 1
+        self.level_durations.append(self.sim_time - self.level_start_time)
+        self.last_outcome = outcome
+        debug.log('game', f"SIMULATION: Level {self.level} ended with {outcome} at frame {self.frame}")
+
+        if self.restart_on_finish:
+            self._start_level()
+        else:
+            self.finished = True
+
+    def run(self, frames: Optional[int] = None, seconds: Optional[float] = None) -> dict:
+        """
+        Run the simulation for a number of frames or simulated seconds
+
+        Args:
+            frames (int, optional): Number of timesteps to simulate
+            seconds (float, optional): Simulated time to cover (used if frames is None)
+
+        Returns:
+            dict: Simulation statistics
+        """
+        if frames is None:
+            frames = int(round((seconds or 60.0) / self.fixed_dt))
+
+        start_frame = self.frame
+        start_time = self.sim_time
+        start_wall = time.perf_counter()
+        while self.frame - start_frame < frames and not self.finished:
+            self.step()
+        wall_seconds = time.perf_counter() - start_wall
+
+        simulated_seconds = self.sim_time - start_time
+        return {
+            'level': self.level,
+            'seed': self.seed,
+            'frames': self.frame - start_frame,
+            'simulated_seconds': simulated_seconds,
+            'wall_seconds': wall_seconds,
+            'speedup': simulated_seconds / wall_seconds if wall_seconds > 0 else float('inf'),
+            'wins': self.wins,
+            'losses': self.losses,
+            'level_durations': list(self.level_durations),
+            'last_outcome': self.last_outcome,
+            'score': self.game.score_ui.total_score,
+            'items_on_screen': len(self.game.items),
+            'item_pool': self.game.item_pool.get_stats(),
+            'resources': ResourceManager.get_instance().get_cache_stats()
+        }
+
+def run_from_args(args) -> dict:
+    """
+    Run the simulation selected on the command line
+
+    Args:
+        args (argparse.Namespace): Parsed command line
+
+    Returns:
+        dict: Simulation statistics, with 'replay_matches' for replays that store a result
+    """
+    if args.replay:
+        replay = Replay.load(args.replay)
+        simulation = HeadlessSimulation.from_replay(replay, render=args.render)
+        stats = simulation.run(frames=replay.step_count)
+        if replay.final_score is not None:
+            stats['replay_matches'] = (
+                stats['score'] == replay.final_score and stats['last_outcome'] == replay.outcome
+            )
+            stats['recorded_score'] = replay.final_score
+            stats['recorded_outcome'] = replay.outcome
+        return stats
+
+    simulation = HeadlessSimulation(
+        level=args.level,
+        fixed_dt=args.dt,
+        input_script=None if args.idle else alternating_lane_script(),
+        render=args.render,
+        seed=args.seed
+    )
+    return simulation.run(seconds=args.minutes * 60)
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a headless CollectCat simulation')
+    parser.add_argument('--level', type=int, default=1, help='Level to simulate (1-3)')
+    parser.add_argument('--minutes', type=float, default=10.0, help='Simulated minutes of play')
+    parser.add_argument('--dt', type=float, default=None, help='Fixed timestep in seconds (default: the game step)')
+    parser.add_argument('--idle', action='store_true', help='Never press any key')
+    parser.add_argument('--render', action='store_true', help='Draw every frame to a dummy display')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the session random stream')
+    parser.add_argument('--replay', default=None, help='Re-run a recorded replay file')
+    parser.add_argument('--verbose', action='store_true', help='Also print the debug log while simulating')
+    args = parser.parse_args()
+
+    # Gameplay logs a line per collision; keep it in the log file and show only the report
+    quiet = not args.verbose
+    if quiet:
+        debug.set_console_output(False)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            stats = run_from_args(args)
+    finally:
+        # Records still queued for the writer thread must not reach the console either
+        debug.flush()
+        debug.set_console_output(True)
+
+    if 'replay_matches' in stats:
+        print(f"Replay {'matches' if stats.pop('replay_matches') else 'DIFFERS from'} the recorded session "
+              f"(recorded score {stats.pop('recorded_score')}, outcome {stats.pop('recorded_outcome')})")
+
+    for key, value in stats.items():
+        if key == 'level_durations':
+            value = len(value)
+            key = 'levels_finished'
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,16 @@
 # src/game/world.py
 import pygame
 import src.utils.debug_section as debug_section
+from src.utils.asset_baker import asset_baker
+from src.utils.surface_cache import SurfaceCache
+
+# Cached section handle for per-frame logging
+world_log = debug_section.debug.section('world')
+
+# Zoom factors are rounded to this step before looking up the background cache
+ZOOM_STEP = 0.01
+
+BACKGROUND_IMAGE_PATH = 'assets/Image/Background/3.jpg'
 
 class World:
     def __init__(self, screen_width, screen_height):
@@ -16,23 +26,34 @@ class World:
         self.scroll_acceleration = 0.1
         self.current_scroll_speed = self.base_scroll_speed
 
-        # Background image handling
+        # Background image handling; bg_version counts every bg_image assignment
+        self.bg_version = 0
         try:
-            self.bg_image = pygame.image.load('assets/Image/Background/3.jpg').convert()
-            self.original_bg_image = self.bg_image  # Keep original image for scaling
-            self.bg_image = pygame.transform.scale(self.bg_image, (screen_width, screen_height * 2))
+            # Pre-scaled pixels come from the baked cache; the full-size original
+            # is only decoded if a zoom level needs rescaling
+            self._set_background(asset_baker.load(
+                BACKGROUND_IMAGE_PATH, (screen_width, screen_height * 2), alpha=False
+            ).convert())
+            self.original_bg_image = None
             self.using_image = True
         except (pygame.error, FileNotFoundError) as e:
             print(f"Warning: Could not load background image. Using white background instead. Error: {e}")
-            self.bg_image = pygame.Surface((screen_width, screen_height * 2))
-            self.bg_image.fill((255, 255, 255))  # RGB for white
+            fallback = pygame.Surface((screen_width, screen_height * 2))
+            fallback.fill((255, 255, 255))  # RGB for white
+            self._set_background(fallback)
+            self.original_bg_image = fallback
             self.using_image = False
         
-        self.bg_rect = self.bg_image.get_rect()
         self.scroll = 0
+        self.previous_scroll = 0  # Scroll before the last simulation step, for interpolated drawing
         self.zoom_factor = 1.0  # Default zoom
         self.tiles = []
 
+        # Pre-scaled backgrounds keyed by quantized zoom level
+        self.bg_cache = SurfaceCache(max_entries=8, max_bytes=32 * 1024 * 1024, name='world_background')
+        self.cached_zoom_key = self._quantize_zoom(self.zoom_factor)
+        self.bg_cache.put(self.cached_zoom_key, self.bg_image)
+
     def update(self, dt: float, level: int = 1, settings=None, zoom_factor: float = 1.0):
         """
         Update world scroll with level-based progression and zoom factor.
@@ -44,6 +65,8 @@ class World:
             zoom_factor (float): Desired zoom level for the background
         """
         try:
+            self.previous_scroll = self.scroll
+            
             # Use settings to get level multiplier if provided
             level_multiplier = 1.0
             if settings:
@@ -70,45 +93,135 @@ class World:
             if self.scroll >= self.bg_rect.height:
                 self.scroll = 0
             
-            # Update zoom factor and rescale background
+            # Update zoom factor, rescaling only when the quantized zoom changes
             self.zoom_factor = zoom_factor
-            self.bg_image = pygame.transform.scale(
-                self.original_bg_image, 
-                (int(self.screen_width * self.zoom_factor), int(self.screen_height * 2 * self.zoom_factor))
-            )
-            self.bg_rect = self.bg_image.get_rect()
-
-            debug_section.debug.log('world', 
-                f"World scroll update: "
-                f"speed={self.current_scroll_speed:.2f}, "
-                f"level_multiplier={level_multiplier:.2f}, "
-                f"current_scroll={self.scroll:.2f}, "
-                f"zoom_factor={self.zoom_factor:.2f}"
-            )
+            zoom_key = self._quantize_zoom(zoom_factor)
+            if zoom_key != self.cached_zoom_key:
+                self._set_background(self.bg_cache.get(zoom_key, lambda: self._scale_background(zoom_key)))
+                self.cached_zoom_key = zoom_key
+
+            if __debug__ and world_log.enabled:
+                world_log.log(
+                    "World scroll update: speed=%.2f, level_multiplier=%.2f, "
+                    "current_scroll=%.2f, zoom_factor=%.2f",
+                    self.current_scroll_speed, level_multiplier, self.scroll, self.zoom_factor
+                )
         except Exception as e:
             debug_section.debug.error('world', f"Error updating world scroll: {e}")
 
-    def draw(self, screen):
+    @staticmethod
+    def _quantize_zoom(zoom_factor: float) -> int:
+        """
+        Convert a zoom factor to an integer cache key
+        
+        Args:
+            zoom_factor (float): Requested zoom factor
+        
+        Returns:
+            int: Zoom factor expressed in ZOOM_STEP units
+        """
+        return max(1, int(round(zoom_factor / ZOOM_STEP)))
+
+    def _scale_background(self, zoom_key: int) -> pygame.Surface:
+        """
+        Scale the original background for a quantized zoom level
+        
+        Args:
+            zoom_key (int): Zoom factor in ZOOM_STEP units
+        
+        Returns:
+            pygame.Surface: Scaled background in display format
+        """
+        zoom = zoom_key * ZOOM_STEP
+        if self.original_bg_image is None:
+            self.original_bg_image = pygame.image.load(BACKGROUND_IMAGE_PATH).convert()
+        scaled = pygame.transform.scale(
+            self.original_bg_image, 
+            (int(self.screen_width * zoom), int(self.screen_height * 2 * zoom))
+        )
+        if pygame.display.get_surface() is not None:
+            scaled = scaled.convert()
+        debug_section.debug.log('world', f"Background rescaled for zoom {zoom:.2f}")
+        return scaled
+
+    def draw(self, screen, alpha=1.0):
         """
         Draw the scrolling background with zoom effect.
         
         Args:
             screen (pygame.Surface): Screen to draw background on
+            alpha (float): Interpolation between the previous (0) and the current (1) simulation step
         """
         try:
-            # Calculate offsets for centering the zoomed image
-            offset_x = (self.screen_width - self.bg_rect.width) // 2
-            offset_y = (self.screen_height - self.bg_rect.height) // 2
-
             # Draw background tiles to create continuous scrolling effect
-            for i in range(3):
-                screen.blit(
-                    self.bg_image, 
-                    (offset_x, -self.bg_rect.height + i * self.bg_rect.height + self.scroll + offset_y)
-                )
+            for position in self.get_tile_positions(alpha):
+                screen.blit(self.bg_image, position)
         except Exception as e:
             debug_section.debug.error('world', f"Error drawing world background: {e}")
 
+    def get_scroll(self, alpha=1.0):
+        """
+        Get the scroll offset between the previous and the current simulation step
+
+        Args:
+            alpha (float): Interpolation between the previous (0) and the current (1) step
+
+        Returns:
+            float: Scroll offset to draw with
+        """
+        if alpha >= 1.0:
+            return self.scroll
+        scroll = self.scroll
+        if scroll < self.previous_scroll:
+            # Wrapped around during the step; the tiles repeat every image height
+            scroll += self.bg_rect.height
+        return self.previous_scroll + (scroll - self.previous_scroll) * alpha
+
+    def get_tile_positions(self, alpha=1.0):
+        """
+        Get the positions of the three background tiles
+
+        Args:
+            alpha (float): Interpolation between the previous (0) and the current (1) simulation step
+
+        Returns:
+            list: (x, y) blit position of each tile
+        """
+        # Calculate offsets for centering the zoomed image
+        offset_x = (self.screen_width - self.bg_rect.width) // 2
+        offset_y = (self.screen_height - self.bg_rect.height) // 2
+        scroll = self.get_scroll(alpha)
+        return [
+            (offset_x, -self.bg_rect.height + i * self.bg_rect.height + scroll + offset_y)
+            for i in range(3)
+        ]
+
+    def _set_background(self, image):
+        """
+        Swap in a new background image and bump its version
+
+        Args:
+            image (pygame.Surface): Background image to draw
+        """
+        self.bg_image = image
+        self.bg_rect = image.get_rect()
+        self.bg_version += 1
+
+    def get_render_key(self, alpha=1.0):
+        """
+        Get a key that changes whenever the drawn background would change
+
+        Args:
+            alpha (float): Interpolation between the previous (0) and the current (1) simulation step
+
+        Returns:
+            tuple: Background version and the whole-pixel tile positions
+        """
+        # The version rather than id(): a surface evicted from bg_cache can be
+        # freed and its id handed to the next rescaled background.
+        # Blit truncates float positions, so sub-pixel scrolling leaves the pixels unchanged
+        return (self.bg_version,) + tuple((int(x), int(y)) for x, y in self.get_tile_positions(alpha))
+
     def set_base_scroll_speed(self, speed: float):
         """
         Manually set the base scroll speed
@@ -1,5 +1,9 @@
 # src/items/__init__.py
-from .item import Item
+from .item import Item, ItemType
+from .item_atlas import ItemAtlas, item_atlas
 from .item_spawner import ItemSpawner
+from .spawn_scheduler import SpawnEvent, SpawnScheduler
+from .item_pool import ItemPool
+from .item_store import ItemStore, ItemView, NUMPY_AVAILABLE
 
-__all__ = ['Item', 'ItemSpawner']
\ No newline at end of file
+__all__ = ['Item', 'ItemType', 'ItemAtlas', 'item_atlas', 'ItemSpawner', 'SpawnEvent', 'SpawnScheduler', 'ItemPool', 'ItemStore', 'ItemView', 'NUMPY_AVAILABLE']
\ No newline at end of file
@@ -1,7 +1,8 @@
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 import pygame
 from src.utils.debug_section import debug
+from src.items.item_atlas import item_atlas
 
 class ItemType:
     """Enum-like class to define item types"""
@@ -41,8 +42,24 @@ class ItemType:
         'size': 80
     }
 
+    @classmethod
+    def all_types(cls):
+        """
+        Get every item type definition
+        
+        Returns:
+            list: All item type dictionaries
+        """
+        return [cls.GOOD_GREEN, cls.GOOD_BLUE, cls.BAD_RED, cls.BAD_YELLOW, cls.GOOD_PURPLE]
+
 class Item:
     """Represents a game item that falls from the top of the screen"""
+
+    # Fixed attribute layout: smaller instances that ItemPool can recycle
+    __slots__ = (
+        'lane', 'x', 'y', 'previous_y', 'color', 'is_good', 'size',
+        'base_speed', 'level', 'speed', 'image_path', 'image'
+    )
     
     def __init__(
         self, 
@@ -51,7 +68,8 @@ class Item:
         is_good: bool = True, 
         size: int = 40,
         fall_speed: float = 5,
-        level: int = 1
+        level: int = 1,
+        rng: Optional[random.Random] = None
     ):
         """
         Initialize an item with specific properties
@@ -63,43 +81,75 @@ class Item:
             size (int): Size of the item
             fall_speed (float): Base speed of falling
             level (int): Current game level
+            rng (random.Random, optional): Random stream, defaults to the global one
+        """
+        self.reset(lane, color, is_good, size, fall_speed, level, rng)
+
+    def reset(
+        self, 
+        lane: int, 
+        color: Tuple[int, int, int] = ItemType.GOOD_GREEN['color'], 
+        is_good: bool = True, 
+        size: int = 40,
+        fall_speed: float = 5,
+        level: int = 1,
+        rng: Optional[random.Random] = None
+    ):
         """
+        (Re)initialize every item property, used when a pooled item is reused
+        
+        Args:
+            Same as __init__
+        """
+        rng = rng or random
         self.lane = lane
         self.x = 0  # Will be set by spawner
         self.y = 0  # Will be set by spawner
+        self.previous_y = 0  # Position before the last simulation step, for interpolated drawing
         self.color = color
         self.is_good = is_good
         self.size = size
         
         self.base_speed = fall_speed
         self.level = level
-        self.speed = self._calculate_dynamic_speed()
+        self.speed = self._calculate_dynamic_speed(rng)
 
         # โหลดรูปภาพจาก ItemType (เลือกภาพตามประเภทของไอเท็ม)
-        if self.is_good:
-            self.image_path = ItemType.GOOD_GREEN['image'] if random.choice([True, False]) else ItemType.GOOD_BLUE['image']
-        else:
-            self.image_path = ItemType.BAD_RED['image']
+        image_paths = self.image_paths_for(self.is_good)
+        self.image_path = image_paths[0] if len(image_paths) == 1 or rng.choice([True, False]) else image_paths[1]
 
-        self.image = pygame.image.load(self.image_path)
+        # Shared texture from the atlas (already color-keyed and scaled to the item size)
+        self.image = item_atlas.get(self.image_path, self.size, self.color)
 
-        # ลบพื้นหลังสีขาวออก (สีขาว RGB คือ (255, 255, 255))
-        self.image.set_colorkey((255, 255, 255))  # ใช้สีขาวเป็นคีย์เพื่อให้โปร่งใส
+    @staticmethod
+    def image_paths_for(is_good: bool) -> Tuple[str, ...]:
+        """
+        Images an item of the given kind may be drawn with
 
-        # ปรับขนาดของรูปภาพตามขนาดไอเท็ม
-        self.image = pygame.transform.scale(self.image, (self.size, self.size))  
+        Args:
+            is_good (bool): Whether the item is beneficial
 
-    def _calculate_dynamic_speed(self) -> float:
+        Returns:
+            Tuple[str, ...]: Image paths, one of which reset() picks
+        """
+        if is_good:
+            return (ItemType.GOOD_GREEN['image'], ItemType.GOOD_BLUE['image'])
+        return (ItemType.BAD_RED['image'],)
+
+    def _calculate_dynamic_speed(self, rng=random) -> float:
         """
         Calculate fall speed with level-based progression
         
+        Args:
+            rng (random.Random): Random stream for the speed variation
+        
         Returns:
             float: Dynamically calculated speed
         """
         try:
             # Exponential speed increase with level
             level_multiplier = 1 + (self.level * 0.5)
-            speed_variation = random.uniform(0.9, 1.1)
+            speed_variation = rng.uniform(0.9, 1.1)
             
             calculated_speed = self.base_speed * level_multiplier * speed_variation
             
@@ -122,6 +172,7 @@ class Item:
         """
         try:
             safe_game_speed = max(0.1, game_speed)
+            self.previous_y = self.y
             self.y += self.speed * safe_game_speed
             return self.y < screen_height
         except Exception as e:
@@ -149,11 +200,19 @@ class Item:
             # Bad items remain the same
             return -100 if self.color == (255, 255, 0) else -5
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the item on the screen
         
         Args:
             screen (pygame.Surface): Surface to draw on
+            alpha (float): Interpolation between the previous (0) and the current (1) simulation step
+
+        Returns:
+            pygame.Rect: Screen area touched by the item
         """
-        screen.blit(self.image, (self.x - self.size // 2, self.y - self.size // 2))  # วาดภาพที่ตำแหน่ง (x, y) 
+        y = self.y
+        if alpha < 1.0:
+            previous_y = self.previous_y
+            y = previous_y + (y - previous_y) * alpha
+        return screen.blit(self.image, (self.x - self.size // 2, y - self.size // 2))  # วาดภาพที่ตำแหน่ง (x, y) 
@@ -0,0 +1,88 @@
+import os
+from typing import Callable, Dict, Iterable, Tuple
+import pygame
+from src.utils.debug_section import debug
+
+class ItemAtlas:
+    """Shared, pre-scaled item textures built once and reused by every Item"""
+
+    def __init__(self, colorkey: Tuple[int, int, int] = (255, 255, 255)):
+        """
+        Initialize an empty atlas
+
+        Args:
+            colorkey (Tuple[int,int,int]): Color treated as transparent in item images
+        """
+        self.colorkey = colorkey
+        self.textures: Dict[Tuple[str, int], pygame.Surface] = {}
+        self.is_built = False
+
+    def build(self, item_types: Iterable[dict], image_paths_for: Callable[[bool], Iterable[str]]):
+        """
+        Load and scale the textures items are drawn with up front
+
+        Args:
+            item_types (Iterable[dict]): ItemType definitions with 'is_good', 'size' and 'color'
+            image_paths_for (callable): Maps is_good to the images an item of that kind may use
+        """
+        for item_type in item_types:
+            for image_path in image_paths_for(item_type['is_good']):
+                self.get(image_path, item_type['size'], item_type.get('color'))
+        self.is_built = True
+        debug.log('items', f"Item atlas built with {len(self.textures)} textures")
+
+    def get(self, image_path: str, size: int, fallback_color: Tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        Get the shared texture for an image at a given size
+
+        Args:
+            image_path (str): Path to the item image
+            size (int): Width and height of the item in pixels
+            fallback_color (Tuple[int,int,int], optional): Fill color if the image cannot be loaded
+
+        Returns:
+            pygame.Surface: Pre-scaled texture (shared, do not modify)
+        """
+        key = (image_path, size)
+        texture = self.textures.get(key)
+        if texture is None:
+            texture = self._load_texture(image_path, size, fallback_color)
+            self.textures[key] = texture
+        return texture
+
+    def _load_texture(self, image_path: str, size: int, fallback_color: Tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        Decode, key out the background and scale a single item image
+
+        Args:
+            image_path (str): Path to the item image
+            size (int): Target size in pixels
+            fallback_color (Tuple[int,int,int], optional): Fill color if loading fails
+
+        Returns:
+            pygame.Surface: Texture ready to blit
+        """
+        try:
+            if not os.path.exists(image_path):
+                raise FileNotFoundError(image_path)
+
+            image = pygame.image.load(image_path)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+
+            # Use white as the transparent color, matching the source art
+            image.set_colorkey(self.colorkey)
+            return pygame.transform.scale(image, (size, size))
+        except (pygame.error, FileNotFoundError) as e:
+            debug.warning('items', f"Failed to load item image {image_path}: {e}")
+            fallback = pygame.Surface((size, size))
+            fallback.fill(fallback_color or (255, 0, 255))
+            return fallback
+
+    def clear(self):
+        """Drop all textures, e.g. after the display mode changes"""
+        self.textures.clear()
+        self.is_built = False
+
+# Create a global instance
+item_atlas = ItemAtlas()
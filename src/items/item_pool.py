@@ -0,0 +1,102 @@
+from typing import Callable, List, Optional
+from src.items.item import Item
+from src.utils.debug_section import debug
+
+class ItemPool:
+    """
+    Recycles Item objects so steady-state spawning allocates nothing.
+
+    Items that leave the game are released into the pool and reinitialized
+    on the next acquire instead of being garbage collected.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 64,
+        create: Optional[Callable[..., Item]] = None,
+        recycle: Optional[Callable[..., Item]] = None
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            max_size (int): Maximum number of idle items kept for reuse
+            create (callable, optional): Builds a new item from Item arguments, defaults to Item
+            recycle (callable, optional): Reinitializes an idle item as recycle(item, *args, **kwargs),
+                defaults to Item.reset
+        """
+        self.max_size = max_size
+        self.create = create or Item
+        self.recycle = recycle or self._reset_item
+        self.free_items: List[Item] = []
+
+        # Statistics
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+
+    @staticmethod
+    def _reset_item(item: Item, *args, **kwargs) -> Item:
+        item.reset(*args, **kwargs)
+        return item
+
+    def acquire(self, *args, **kwargs) -> Item:
+        """
+        Get an item, reusing an idle one when possible (ItemSpawner item factory)
+
+        Args:
+            *args, **kwargs: Item constructor arguments
+
+        Returns:
+            Item: Initialized item
+        """
+        if self.free_items:
+            self.reused += 1
+            return self.recycle(self.free_items.pop(), *args, **kwargs)
+
+        self.created += 1
+        return self.create(*args, **kwargs)
+
+    def release(self, item: Item):
+        """
+        Return an item that left the game
+
+        Args:
+            item (Item): Item no longer referenced by the game
+        """
+        self.released += 1
+        if len(self.free_items) < self.max_size:
+            self.free_items.append(item)
+        else:
+            self.discarded += 1
+
+    def release_many(self, items: List[Item]):
+        """
+        Return several items
+
+        Args:
+            items (List[Item]): Items no longer referenced by the game
+        """
+        for item in items:
+            self.release(item)
+
+    def get_stats(self) -> dict:
+        """
+        Get pool statistics
+
+        Returns:
+            dict: Idle item count, cap and allocation counters
+        """
+        return {
+            'idle': len(self.free_items),
+            'max_size': self.max_size,
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'discarded': self.discarded
+        }
+
+    def log_stats(self):
+        """Write the pool statistics to the debug log"""
+        debug.log('items', f"Item pool: {self.get_stats()}")
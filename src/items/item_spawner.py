@@ -1,18 +1,31 @@
 
 import random
-from typing import List, Optional
+from collections import deque
+from typing import Callable, List, Optional, Tuple
 from src.items.item import Item, ItemType
+from src.items.item_atlas import item_atlas
+from src.items.spawn_scheduler import SpawnEvent, SpawnScheduler
 from src.utils.debug_section import debug
 
 class ItemSpawner:
-    """Manages spawning of items during gameplay"""
+    """
+    Manages spawning of items during gameplay.
+
+    Waves are planned ahead on a spawn clock measured in seconds, from the
+    level's bad item rate and the difficulty multiplier, and kept in a
+    SpawnScheduler. The textures of the items due within `prepare_ahead`
+    seconds are loaded before they spawn, so a new item type never costs a
+    decode in the frame it appears.
+    """
     
     def __init__(
         self, 
         screen_width: int, 
         screen_height: int, 
         num_lanes: int = 3,
-        current_level: int = 1
+        current_level: int = 1,
+        rng: Optional[random.Random] = None,
+        item_factory: Optional[Callable[..., Item]] = None
     ):
         """
         Initialize the ItemSpawner
@@ -22,7 +35,11 @@ class ItemSpawner:
             screen_height (int): Game screen height
             num_lanes (int): Number of game lanes
             current_level (int): Current game level
+            rng (random.Random, optional): Session random stream, for reproducible runs
+            item_factory (callable, optional): Builds items from Item arguments, defaults to Item
         """
+        self.rng = rng or random.Random()
+        self.item_factory = item_factory or Item
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.num_lanes = num_lanes
@@ -37,11 +54,14 @@ class ItemSpawner:
         
         # Spawn configuration
         self.max_items = 10
-        self.spawn_timer = 0
-        self.spawn_interval = 120
+        self.max_items_per_wave = 2
+        self.wave_interval = 2.0  # Seconds between waves at difficulty 1.0
+        self.plan_ahead = 10.0  # Seconds of waves kept planned in the schedule
+        self.prepare_ahead = 3.0  # Seconds ahead whose item textures are warmed up
+        self.minimum_fall_speed = 0
         
         # Difficulty progression
-        self.difficulty_multiplier = 1.0
+        self._difficulty_multiplier = 1.0
         
         # Level-based bad item spawn rates
         self.bad_item_spawn_rates = {
@@ -50,50 +70,106 @@ class ItemSpawner:
             3: 0.7,   # 40% chance of bad items in level 3
         }
 
-    def update(self, game_speed: float, current_items: List[Item] = None) -> Optional[List[Item]]:
+        # Spawn schedule, planned lazily on the first update so the level setup
+        # can still adjust the difficulty
+        self.scheduler = SpawnScheduler()
+        self.clock = 0.0  # Spawn time elapsed in seconds; holds while the screen is full
+        self.planned_until = 0.0  # Time of the last planned wave
+        self.waves_planned = 0
+        self._unprepared = deque()  # Planned events whose assets are not warmed up yet, in time order
+
+    @property
+    def difficulty_multiplier(self) -> float:
+        """Wave frequency factor of the level (1.0 = one wave per wave_interval)"""
+        return self._difficulty_multiplier
+
+    @difficulty_multiplier.setter
+    def difficulty_multiplier(self, value: float):
+        self._difficulty_multiplier = max(0.1, value)
+        if len(self.scheduler):
+            # Waves planned at the old difficulty no longer apply
+            self.replan()
+
+    def replan(self):
+        """Drop the planned waves; they are planned again from the current spawn time"""
+        self.scheduler.clear()
+        self._unprepared.clear()
+        self.planned_until = self.clock
+
+    def update(self, current_items: List[Item] = None, dt: float = 1 / 60) -> Optional[List[Item]]:
         """
-        Update spawner and potentially spawn new items
+        Advance the spawn clock and spawn the waves that are due
+
+        The spawn clock runs in real seconds; the game speed only affects how
+        fast spawned items fall, not how often waves arrive.
         
         Args:
-            game_speed (float): Current game speed
             current_items (List[Item], optional): Current items on screen
+            dt (float): Time step in seconds
         
         Returns:
             Optional[List[Item]]: Newly spawned items
         """
         current_items = current_items or []
-        
-        # Validate game speed
-        safe_game_speed = max(0.1, game_speed)
         self.minimum_fall_speed = 0
+        self.clock += max(0.0, dt)
+
+        self._plan_until(self.clock + self.plan_ahead)
+        self._prepare_until(self.clock + self.prepare_ahead)
+
+        new_items = []
+        while True:
+            due = self.scheduler.next_time()
+            # The epsilon keeps a wave exactly on a step boundary from slipping a step
+            if due is None or due > self.clock + 1e-9:
+                break
+            if len(current_items) + len(new_items) >= self.max_items:
+                # Screen is full: the wave waits for room and later waves queue behind it
+                self.clock = due
+                break
+            new_items.extend(self._spawn_wave(self.scheduler.pop_wave()))
         
-        # Increment spawn timer
-        self.spawn_timer += 1
+        return new_items or None
+
+    def get_upcoming_spawns(self, seconds: float) -> List[SpawnEvent]:
+        """
+        Look ahead at the planned spawns
         
-        # Check spawn conditions
-        if (self.spawn_timer >= self.spawn_interval and 
-            len(current_items) < self.max_items):
-            
-            self.spawn_timer = 0
-            return self._spawn_items(safe_game_speed)
+        Args:
+            seconds (float): How far ahead of the spawn clock to look
         
-        return None
+        Returns:
+            List[SpawnEvent]: Planned events in spawn order
+        """
+        self._plan_until(self.clock + seconds)
+        return self.scheduler.upcoming(self.clock + seconds)
 
-    def _spawn_items(self, game_speed: float) -> List[Item]:
+    def _plan_until(self, horizon: float):
         """
-        Spawn items with randomized properties
+        Plan waves up to a spawn time
         
         Args:
-            game_speed (float): Current game speed
+            horizon (float): Latest wave time to plan
+        """
+        interval = self.wave_interval / self._difficulty_multiplier
+        while self.planned_until + interval <= horizon + 1e-9:
+            self.planned_until += interval
+            self.waves_planned += 1
+            self._plan_wave(self.planned_until, self.waves_planned)
+
+    def _plan_wave(self, time: float, wave: int):
+        """
+        Plan one wave: 1-2 items in distinct lanes with randomized types
         
-        Returns:
-            List[Item]: Newly spawned items
+        Args:
+            time (float): Spawn time of the wave
+            wave (int): Wave number
         """
-        new_items = []
         used_lanes = set()
+        wave_minimum_speed = 0
         
         # Randomize number of items
-        num_items = random.randint(1, min(2, self.max_items))
+        num_items = self.rng.randint(1, self.max_items_per_wave)
         
         for _ in range(num_items):
             # Select an unused lane
@@ -105,27 +181,25 @@ class ItemSpawner:
             if not available_lanes:
                 break
             
-            lane = random.choice(available_lanes)
+            lane = self.rng.choice(available_lanes)
             used_lanes.add(lane)
             
-            # Create and configure item
-            new_item = self._create_item(lane)
-            new_item.x = self.lane_positions[lane]
-            new_item.y = 0
+            item_type, fall_speed, base_speed = self._plan_item()
+            if wave_minimum_speed == 0 or base_speed < wave_minimum_speed:
+                wave_minimum_speed = base_speed
+            if item_type is ItemType.BAD_YELLOW:
+                fall_speed = wave_minimum_speed * 10  # Set yellow item speed to 10 times the minimum speed
             
-            new_items.append(new_item)
-        
-        return new_items
+            event = SpawnEvent(time, wave, lane, item_type, fall_speed, base_speed)
+            self.scheduler.schedule(event)
+            self._unprepared.append(event)
 
-    def _create_item(self, lane: int) -> Item:
+    def _plan_item(self) -> Tuple[dict, float, float]:
         """
-        Create an item with weighted randomization based on level
-        
-        Args:
-            lane (int): Lane for the item
+        Pick the type and speed of an item with weighted randomization based on level
         
         Returns:
-            Item: Newly created item
+            Tuple[dict, float, float]: Item type, its fall speed and the level speed it was derived from
         """
         # Get the bad item spawn rate for the current level
         bad_item_rate = self.bad_item_spawn_rates.get(
@@ -136,37 +210,72 @@ class ItemSpawner:
         # Calculate dynamic fall speed
         base_speed = 5
         level_speed_multiplier = 1 + (self.current_level * 0.5)
-        speed_variation = random.uniform(0.9, 1.1)
+        speed_variation = self.rng.uniform(0.9, 1.1)
         fall_speed = base_speed * level_speed_multiplier * speed_variation
-
-        # Update minimum fall speed tracking
-        if self.minimum_fall_speed == 0 or fall_speed < self.minimum_fall_speed:
-            self.minimum_fall_speed = fall_speed
+        level_speed = fall_speed
 
         # Determine item type based on probability
-        item_type_choice = random.random()
+        item_type_choice = self.rng.random()
         if item_type_choice < bad_item_rate:
-            # Spawn a bad item (red or yellow)
-            if random.random() < 0.7:  # Increased chance for red item
+            # Spawn a bad item (red or yellow); the yellow speed is set from the wave minimum
+            if self.rng.random() < 0.7:  # Increased chance for red item
                 item_type = ItemType.BAD_RED
-                fall_speed = fall_speed  # Use the calculated fall speed for the red item
             else:
                 item_type = ItemType.BAD_YELLOW
-                fall_speed = self.minimum_fall_speed * 10  # Set yellow item speed to 10 times the minimum speed
         elif item_type_choice < bad_item_rate + 0.05:  # Decreased chance for purple item
             item_type = ItemType.GOOD_PURPLE
         else:
             # Spawn a good item (green or blue)
-            item_type = random.choice([ItemType.GOOD_GREEN, ItemType.GOOD_BLUE])
-        
-        return Item(
-            lane=lane,
-            color=item_type['color'],
-            is_good=item_type['is_good'],
-            size=item_type['size'],
-            fall_speed=fall_speed,
-            level=self.current_level
-        )
+            item_type = self.rng.choice([ItemType.GOOD_GREEN, ItemType.GOOD_BLUE])
+        
+        return item_type, fall_speed, level_speed
+
+    def _prepare_until(self, until: float):
+        """
+        Warm up the textures of the items planned up to a spawn time
+        
+        Args:
+            until (float): Latest spawn time to prepare
+        """
+        while self._unprepared and self._unprepared[0].time <= until:
+            event = self._unprepared.popleft()
+            item_type = event.item_type
+            for image_path in Item.image_paths_for(item_type['is_good']):
+                item_atlas.get(image_path, item_type['size'], item_type['color'])
+            event.prepared = True
+
+    def _spawn_wave(self, events: List[SpawnEvent]) -> List[Item]:
+        """
+        Create the items of a due wave at the top of their lanes
+        
+        Args:
+            events (List[SpawnEvent]): Events of the wave
+        
+        Returns:
+            List[Item]: Newly spawned items
+        """
+        new_items = []
+        for event in events:
+            item_type = event.item_type
+            new_item = self.item_factory(
+                lane=event.lane,
+                color=item_type['color'],
+                is_good=item_type['is_good'],
+                size=item_type['size'],
+                fall_speed=event.fall_speed,
+                level=self.current_level,
+                rng=self.rng
+            )
+            new_item.x = self.lane_positions[event.lane]
+            new_item.y = 0
+            
+            # Track the level speed; the yellow item's 10x speed is not the pace of the wave
+            if self.minimum_fall_speed == 0 or event.base_speed < self.minimum_fall_speed:
+                self.minimum_fall_speed = event.base_speed
+            
+            new_items.append(new_item)
+        
+        return new_items
             
     def get_minimum_fall_speed(self) -> float:
         """
@@ -189,7 +298,7 @@ class ItemSpawner:
             dict: Selected item type
         """
         total_weight = sum(item['weight'] for item in item_types)
-        r = random.uniform(0, total_weight)
+        r = self.rng.uniform(0, total_weight)
         
         cumulative_weight = 0
         for item_type in item_types:
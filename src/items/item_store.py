@@ -0,0 +1,238 @@
+from typing import List, Optional, Tuple
+from src.items.item import Item, ItemType
+from src.utils.debug_section import debug
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # NumPy is optional; Game falls back to plain Item objects
+    np = None
+    NUMPY_AVAILABLE = False
+
+class ItemView(Item):
+    """
+    Item whose position, speed and lane live in an ItemStore slot.
+
+    Behaves like a regular Item for drawing, collisions and scoring; only the
+    per-frame movement is done by the store for all items at once.
+    """
+
+    __slots__ = ('_store', '_slot')
+
+    def __init__(self, store: 'ItemStore', slot: int, *args, **kwargs):
+        """
+        Args:
+            store (ItemStore): Store holding the item state
+            slot (int): Index of the item in the store arrays
+            *args, **kwargs: Item constructor arguments
+        """
+        self._store = store
+        self._slot = slot
+        super().__init__(*args, **kwargs)
+
+    @property
+    def x(self) -> float:
+        return float(self._store.x[self._slot])
+
+    @x.setter
+    def x(self, value: float):
+        self._store.x[self._slot] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._store.y[self._slot])
+
+    @y.setter
+    def y(self, value: float):
+        self._store.y[self._slot] = value
+
+    @property
+    def previous_y(self) -> float:
+        return float(self._store.previous_y[self._slot])
+
+    @previous_y.setter
+    def previous_y(self, value: float):
+        self._store.previous_y[self._slot] = value
+
+    @property
+    def speed(self) -> float:
+        return float(self._store.speed[self._slot])
+
+    @speed.setter
+    def speed(self, value: float):
+        self._store.speed[self._slot] = value
+
+    @property
+    def lane(self) -> int:
+        return int(self._store.lane[self._slot])
+
+    @lane.setter
+    def lane(self, value: int):
+        self._store.lane[self._slot] = value
+
+class ItemStore:
+    """
+    Structure-of-arrays storage for falling items.
+
+    Parallel NumPy arrays hold x, y (and y before the last step), speed, lane,
+    type id and an alive mask, so moving all items, culling off-screen ones
+    and finding the minimum fall speed are a few vectorized operations per
+    frame.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize the store
+
+        Args:
+            capacity (int): Initial number of slots (grows on demand)
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("ItemStore requires NumPy")
+
+        self.capacity = 0
+        self.x = np.zeros(0, dtype=np.float64)
+        self.y = np.zeros(0, dtype=np.float64)
+        self.previous_y = np.zeros(0, dtype=np.float64)
+        self.speed = np.zeros(0, dtype=np.float64)
+        self.lane = np.zeros(0, dtype=np.int16)
+        self.type_id = np.zeros(0, dtype=np.int16)
+        self.alive = np.zeros(0, dtype=bool)
+        self.views: List[Optional[ItemView]] = []
+
+        # Slots below high_water may be in use; freed ones are reused first
+        self.high_water = 0
+        self.free_slots: List[int] = []
+
+        # Item types are identified by their color
+        self.type_ids = {item_type['color']: index for index, item_type in enumerate(ItemType.all_types())}
+
+        self._grow(capacity)
+
+    def _grow(self, capacity: int):
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+        self.x = np.concatenate((self.x, np.zeros(extra, dtype=np.float64)))
+        self.y = np.concatenate((self.y, np.zeros(extra, dtype=np.float64)))
+        self.previous_y = np.concatenate((self.previous_y, np.zeros(extra, dtype=np.float64)))
+        self.speed = np.concatenate((self.speed, np.zeros(extra, dtype=np.float64)))
+        self.lane = np.concatenate((self.lane, np.zeros(extra, dtype=np.int16)))
+        self.type_id = np.concatenate((self.type_id, np.full(extra, -1, dtype=np.int16)))
+        self.alive = np.concatenate((self.alive, np.zeros(extra, dtype=bool)))
+        self.views.extend([None] * extra)
+        self.capacity = capacity
+        debug.log('items', f"Item store grown to {capacity} slots")
+
+    def _allocate_slot(self) -> int:
+        if self.free_slots:
+            return self.free_slots.pop()
+        if self.high_water == self.capacity:
+            self._grow(max(64, self.capacity * 2))
+        slot = self.high_water
+        self.high_water += 1
+        return slot
+
+    def create(self, *args, **kwargs) -> ItemView:
+        """
+        Create an item stored in this store (ItemSpawner item factory)
+
+        Args:
+            *args, **kwargs: Item constructor arguments
+
+        Returns:
+            ItemView: The new item
+        """
+        slot = self._allocate_slot()
+        item = ItemView(self, slot, *args, **kwargs)
+        self.type_id[slot] = self.type_ids.get(item.color, -1)
+        self.alive[slot] = True
+        self.views[slot] = item
+        return item
+
+    def recycle(self, item: ItemView, *args, **kwargs) -> ItemView:
+        """
+        Give a released item a new slot and reinitialize it (ItemPool recycle hook)
+
+        Args:
+            item (ItemView): Previously released item of this store
+            *args, **kwargs: Item constructor arguments
+
+        Returns:
+            ItemView: The same item, alive again
+        """
+        slot = self._allocate_slot()
+        item._store = self
+        item._slot = slot
+        item.reset(*args, **kwargs)
+        self.type_id[slot] = self.type_ids.get(item.color, -1)
+        self.alive[slot] = True
+        self.views[slot] = item
+        return item
+
+    def release(self, item: Item) -> bool:
+        """
+        Free the slot of an item that left the game
+
+        Args:
+            item (Item): Item to release
+
+        Returns:
+            bool: Whether the item belonged to this store and was still alive
+        """
+        slot = getattr(item, '_slot', None)
+        if slot is None or getattr(item, '_store', None) is not self or self.views[slot] is not item:
+            return False
+        self.alive[slot] = False
+        self.views[slot] = None
+        self.free_slots.append(slot)
+        return True
+
+    def update(self, game_speed: float, screen_height: int) -> Tuple[List[ItemView], float]:
+        """
+        Move every item, then cull the ones that left the screen
+
+        Matches Item.update applied to each item.
+
+        Args:
+            game_speed (float): Current game speed (already scaled by frame time)
+            screen_height (int): Screen height
+
+        Returns:
+            Tuple[List[ItemView], float]: Culled items, and the minimum fall speed of
+            the remaining items (0 if there are none)
+        """
+        count = self.high_water
+        alive = self.alive[:count]
+        if not alive.any():
+            return [], 0
+
+        safe_game_speed = max(0.1, game_speed)
+        y = self.y[:count]
+        speed = self.speed[:count]
+        self.previous_y[:count] = y
+        np.add(y, speed * safe_game_speed, out=y, where=alive)
+
+        offscreen = alive & ~(y < screen_height)
+        culled = []
+        if offscreen.any():
+            for slot in np.flatnonzero(offscreen).tolist():
+                culled.append(self.views[slot])
+                self.views[slot] = None
+                self.free_slots.append(slot)
+            alive &= ~offscreen
+
+        remaining_speeds = speed[alive]
+        minimum_fall_speed = float(remaining_speeds.min()) if remaining_speeds.size else 0
+        return culled, minimum_fall_speed
+
+    def clear(self):
+        """Release every item"""
+        self.alive[:] = False
+        self.type_id[:] = -1
+        self.views = [None] * self.capacity
+        self.high_water = 0
+        self.free_slots = []
+
+    def __len__(self) -> int:
+        return int(self.alive[:self.high_water].sum())
@@ -0,0 +1,103 @@
+# src/items/spawn_scheduler.py
+import heapq
+import itertools
+from typing import List, Optional
+
+class SpawnEvent:
+    """One planned item spawn: when, where and what"""
+    __slots__ = ('time', 'wave', 'lane', 'item_type', 'fall_speed', 'base_speed', 'prepared')
+
+    def __init__(
+        self,
+        time: float,
+        wave: int,
+        lane: int,
+        item_type: dict,
+        fall_speed: float,
+        base_speed: Optional[float] = None
+    ):
+        """
+        Initialize the event
+
+        Args:
+            time (float): Spawn clock time in seconds at which the item appears
+            wave (int): Number of the wave the item belongs to
+            lane (int): Lane of the item
+            item_type (dict): ItemType entry of the item
+            fall_speed (float): Base fall speed passed to the item
+            base_speed (float, optional): Level speed the fall speed was derived from,
+                before any per-type override; defaults to fall_speed
+        """
+        self.time = time
+        self.wave = wave
+        self.lane = lane
+        self.item_type = item_type
+        self.fall_speed = fall_speed
+        self.base_speed = fall_speed if base_speed is None else base_speed
+        self.prepared = False  # Set once the item's assets have been warmed up
+
+class SpawnScheduler:
+    """
+    Priority queue of upcoming spawn events, ordered by spawn time.
+
+    Events of the same wave share a time and leave the queue together.
+    Events with equal times keep the order they were scheduled in, so a
+    seeded plan always plays back the same way.
+    """
+
+    def __init__(self):
+        """Initialize an empty schedule"""
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def schedule(self, event: SpawnEvent):
+        """
+        Add an event to the queue
+
+        Args:
+            event (SpawnEvent): Event to add
+        """
+        heapq.heappush(self._heap, (event.time, next(self._sequence), event))
+
+    def next_time(self) -> Optional[float]:
+        """
+        Time of the earliest event
+
+        Returns:
+            Optional[float]: Spawn time, or None if nothing is scheduled
+        """
+        return self._heap[0][0] if self._heap else None
+
+    def pop_wave(self) -> List[SpawnEvent]:
+        """
+        Remove the earliest wave
+
+        Returns:
+            List[SpawnEvent]: Every event sharing the earliest time, in scheduling order
+        """
+        if not self._heap:
+            return []
+        time = self._heap[0][0]
+        events = []
+        while self._heap and self._heap[0][0] == time:
+            events.append(heapq.heappop(self._heap)[2])
+        return events
+
+    def upcoming(self, until: float) -> List[SpawnEvent]:
+        """
+        Events due up to a time, without removing them
+
+        Args:
+            until (float): Latest spawn time to include
+
+        Returns:
+            List[SpawnEvent]: Events in spawn order
+        """
+        return [entry[2] for entry in sorted(entry for entry in self._heap if entry[0] <= until)]
+
+    def clear(self):
+        """Drop every scheduled event"""
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -1,16 +1,130 @@
 # src/game/collision.py
 import pygame
-from typing import List, Optional
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, List, Optional, Sequence
 from src.character.character import Character
 from src.items.item import Item
 from src.utils.debug_section import debug
 from src.utils.resource_manager import ResourceManager
 
+def _item_y(item: Item) -> float:
+    return item.y
+
+class LaneItemIndex:
+    """
+    Collision broad phase: items bucketed by lane, each bucket sorted by y.
+
+    Items only fall straight down their lane, so a bucket stays sorted apart
+    from items of different speeds overtaking each other; refresh() restores
+    the order once per frame in near-linear time.
+    """
+
+    def __init__(self, lane_positions: Sequence[int]):
+        """
+        Initialize an empty index
+
+        Args:
+            lane_positions (Sequence[int]): X coordinate of the items in each lane
+        """
+        self.lane_positions = list(lane_positions)
+        self.buckets: List[List[Item]] = [[] for _ in self.lane_positions]
+        self.max_item_size = 0
+
+    def add(self, item: Item):
+        """
+        Add an item to the bucket of its lane
+
+        Args:
+            item (Item): Item to index
+        """
+        insort(self.buckets[item.lane], item, key=_item_y)
+        if item.size > self.max_item_size:
+            self.max_item_size = item.size
+
+    def add_many(self, items: Iterable[Item]):
+        """
+        Add several items
+
+        Args:
+            items (Iterable[Item]): Items to index
+        """
+        for item in items:
+            self.add(item)
+
+    def remove(self, item: Item) -> bool:
+        """
+        Remove an item, located by binary search on its current y
+
+        Args:
+            item (Item): Item to remove
+
+        Returns:
+            bool: Whether the item was indexed
+        """
+        bucket = self.buckets[item.lane]
+        index = bisect_left(bucket, item.y, key=_item_y)
+        while index < len(bucket) and bucket[index].y == item.y:
+            if bucket[index] is item:
+                del bucket[index]
+                return True
+            index += 1
+
+        # Order not refreshed since the item moved; fall back to a scan
+        for index, candidate in enumerate(bucket):
+            if candidate is item:
+                del bucket[index]
+                return True
+        return False
+
+    def refresh(self):
+        """Restore the y order of every bucket after items have moved"""
+        for bucket in self.buckets:
+            bucket.sort(key=_item_y)
+
+    def clear(self):
+        """Remove every item"""
+        for bucket in self.buckets:
+            bucket.clear()
+        self.max_item_size = 0
+
+    def candidates(self, rect: pygame.Rect) -> List[Item]:
+        """
+        Get the items that may overlap a rectangle
+
+        Only lanes whose items can reach the rectangle horizontally are
+        searched (the current lane, plus the neighbour during a lane switch),
+        and only within the y-window where an item could touch it.
+
+        Args:
+            rect (pygame.Rect): Area to test, usually the character rect
+
+        Returns:
+            List[Item]: Items to pass to the exact (narrow phase) test
+        """
+        # One extra pixel on each side covers Rect truncating float positions
+        reach = self.max_item_size + 1
+        top = rect.top - reach
+        bottom = rect.bottom + 1
+
+        found = []
+        for lane_x, bucket in zip(self.lane_positions, self.buckets):
+            if not bucket or lane_x >= rect.right + 1 or lane_x + reach <= rect.left:
+                continue
+            low = bisect_right(bucket, top, key=_item_y)
+            high = bisect_left(bucket, bottom, key=_item_y)
+            if low < high:
+                found.extend(bucket[low:high])
+        return found
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.buckets)
+
 class CollisionManager:
     @staticmethod
     def check_item_collisions(
         character: Character, 
-        items: List[Item]
+        items: List[Item],
+        lane_index: Optional[LaneItemIndex] = None
     ) -> Optional[dict]:
         """
         Check collisions between character and items
@@ -18,6 +132,7 @@ class CollisionManager:
         Args:
             character (Character): Game character
             items (List[Item]): List of game items
+            lane_index (LaneItemIndex, optional): Broad phase; only its candidates are tested
         
         Returns:
             Optional[dict]: Collision result with score change and items to remove
@@ -41,7 +156,12 @@ class CollisionManager:
             'items_to_remove': []
         }
 
-        for item in items[:]:
+        if lane_index is not None:
+            candidates = lane_index.candidates(char_rect)
+        else:
+            candidates = items[:]
+
+        for item in candidates:
             item_rect = pygame.Rect(
                 item.x, 
                 item.y, 
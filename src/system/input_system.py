@@ -0,0 +1,153 @@
+# src/system/input_system.py
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+import pygame
+from src.utils.debug_section import debug
+
+input_log = debug.section('input')
+
+# Keys whose presses drive gameplay (lane switching)
+GAMEPLAY_KEYS = (pygame.K_LEFT, pygame.K_RIGHT)
+
+class InputAction:
+    """A buffered gameplay key press"""
+    __slots__ = ('key', 'time')
+
+    def __init__(self, key: int, time: int):
+        """
+        Args:
+            key (int): Pygame key code
+            time (int): Time of the press in milliseconds
+        """
+        self.key = key
+        self.time = time
+
+class InputFrame:
+    """The input one simulation step acts on"""
+    __slots__ = ('pressed',)
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        """
+        Args:
+            pressed (Iterable[int]): Gameplay keys pressed since the previous step, in order
+        """
+        self.pressed = tuple(pressed)
+
+class InputSystem:
+    """
+    Single owner of the event queue during gameplay.
+
+    poll() drains the queue once per frame and passes each event to the
+    subscribers of its type. Gameplay key presses are buffered as
+    timestamped actions until a simulation step takes them with
+    take_frame(), so a tap that goes down and up within one frame still
+    switches lanes. Scripted runs feed synthetic events through
+    process_events() and go through the same path.
+    """
+
+    def __init__(
+        self,
+        action_keys: Sequence[int] = GAMEPLAY_KEYS,
+        buffer_size: int = 32,
+        time_source: Optional[Callable[[], int]] = None
+    ):
+        """
+        Initialize the input system
+
+        Args:
+            action_keys (Sequence[int]): Keys whose presses are buffered as actions
+            buffer_size (int): Most actions kept; the oldest are dropped beyond it
+            time_source (callable, optional): Returns the time in milliseconds, defaults to pygame ticks
+        """
+        self.action_keys = frozenset(action_keys)
+        self.buffer = deque()
+        self.buffer_size = buffer_size
+        self.time_source = time_source or pygame.time.get_ticks
+        self.subscribers: Dict[int, List[Callable[[pygame.event.Event], bool]]] = {}
+
+        # Statistics
+        self.dropped_actions = 0
+        self.last_latency_ms = 0
+
+    def subscribe(self, event_type: int, callback: Callable[[pygame.event.Event], bool]):
+        """
+        Receive the events of a type
+
+        Args:
+            event_type (int): Pygame event type
+            callback (callable): Called with each event; returning True consumes it
+        """
+        self.subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, event_type: int, callback: Callable[[pygame.event.Event], bool]):
+        """
+        Stop receiving the events of a type
+
+        Args:
+            event_type (int): Pygame event type
+            callback (callable): Callback passed to subscribe
+        """
+        callbacks = self.subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def poll(self) -> List[pygame.event.Event]:
+        """
+        Drain the pygame event queue
+
+        Returns:
+            List[pygame.event.Event]: Events no subscriber consumed
+        """
+        return self.process_events(pygame.event.get())
+
+    def process_events(self, events: Iterable[pygame.event.Event]) -> List[pygame.event.Event]:
+        """
+        Buffer the gameplay key presses of events and dispatch them
+
+        Args:
+            events (Iterable[pygame.event.Event]): Events in queue order
+
+        Returns:
+            List[pygame.event.Event]: Events no subscriber consumed
+        """
+        now = None
+        unhandled = []
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key in self.action_keys:
+                if now is None:
+                    now = self.time_source()
+                self._buffer_action(InputAction(event.key, now))
+
+            callbacks = self.subscribers.get(event.type)
+            if callbacks and any(callback(event) for callback in callbacks):
+                continue
+            unhandled.append(event)
+        return unhandled
+
+    def _buffer_action(self, action: InputAction):
+        if len(self.buffer) >= self.buffer_size:
+            self.buffer.popleft()
+            self.dropped_actions += 1
+            debug.warning('input', f"Input buffer full, dropped the oldest of {self.buffer_size} actions")
+        self.buffer.append(action)
+
+    def take_frame(self) -> InputFrame:
+        """
+        Take the buffered actions for one simulation step
+
+        Returns:
+            InputFrame: Keys pressed since the previous step
+        """
+        if not self.buffer:
+            return InputFrame()
+
+        actions = list(self.buffer)
+        self.buffer.clear()
+        self.last_latency_ms = self.time_source() - actions[0].time
+        if __debug__ and input_log.enabled:
+            input_log.log("%d action(s) applied after %d ms", len(actions), self.last_latency_ms)
+        return InputFrame(action.key for action in actions)
+
+    def clear(self):
+        """Forget buffered actions (e.g. after a menu owned the event queue)"""
+        self.buffer.clear()
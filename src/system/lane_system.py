@@ -12,7 +12,6 @@ class LaneManager:
         self.num_lanes = num_lanes
         self.lane_width = screen_width // num_lanes
         self.current_lane = 1  # Start in the middle lane (0-based index)
-        self.can_switch = True  # Flag to prevent multiple switches
         
         # Keep both methods for backward compatibility
         self.lanes = [Lane(self.get_lane_center(i, 0), self.lane_width) for i in range(num_lanes)]
@@ -47,22 +46,14 @@ class LaneManager:
 
     def switch_lane(self, direction):
         """Switch to the adjacent lane in the specified direction."""
-        if not self.can_switch:
-            return False
-        
         new_lane = self.current_lane + direction
         
         # Check if the new lane index is valid
         if 0 <= new_lane < self.num_lanes:
             self.current_lane = new_lane
-            self.can_switch = False  # Prevent switching until key is released
             return True
         return False
 
-    def set_can_switch(self, can_switch):
-        """Set the lane switching flag."""
-        self.can_switch = can_switch
-
     def is_lane_occupied(self, lane_index):
         """Check if the specified lane is occupied."""
         if 0 <= lane_index < self.num_lanes:
@@ -4,32 +4,17 @@ from src.character.character import Character
 import pygame
 from src.utils.debug_section import debug
 
-def move_character(character, keys_pressed, lane_manager, settings):
+def move_character(character, lane_manager, settings):
     """
-    Legacy function for character movement
+    Legacy function for character movement towards the current lane
     
     :param character: The character object to move
-    :param keys_pressed: Pygame key press state
     :param lane_manager: Lane management object
     :param settings: Game settings
     """
-    # Check for lane switching
-    if not (keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_RIGHT]):
-        lane_manager.can_switch = True  # Reset the switch flag when keys are released
-    
-    if keys_pressed[pygame.K_LEFT] and lane_manager.can_switch:
-        if lane_manager.switch_lane(-1):
-            character.is_switching_lanes = True
-            character.target_x = lane_manager.get_current_lane_position
-    
-    elif keys_pressed[pygame.K_RIGHT] and lane_manager.can_switch:
-        if lane_manager.switch_lane(1):
-            character.is_switching_lanes = True
-            character.target_x = lane_manager.get_current_lane_position
-    
     try:
         character.target_x = lane_manager.current_lane_position
-        debug.log('movement', f"Character target X set to: {character.target_x}")
+        debug.log('movement', "Character target X set to: %s", character.target_x)
     except Exception as e:
         debug.error('movement', f"Error in move_character: {e}")
         # Fallback logic if needed
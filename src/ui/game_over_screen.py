@@ -4,7 +4,11 @@ import sys
 import time
 from src.utils.constant import Colors
 from src.utils.debug_section import debug
-from src.utils.resource_manager import ResourceManager
+from src.utils.resource_manager import ResourceManager, MENU_FONT_PATH
+from src.ui.text_cache import text_cache
+from src.ui.static_layer import StaticLayerCache
+from src.ui.menu_loop import IdleMenuLoop
+from src.utils.music_manager import music_manager
 
 class GameOverScreen:
     def __init__(self, screen, is_win=False, level=1):
@@ -31,16 +35,10 @@ class GameOverScreen:
             'text_hover': (255, 255, 255)
         }
 
-        # Fonts with custom loading
-        try:
-            self.title_font = pygame.font.Font('assets/font/River Adventurer.ttf', 64)
-            self.subtitle_font = pygame.font.Font('assets/font/River Adventurer.ttf', 36)
-            self.button_font = pygame.font.Font('assets/font/River Adventurer.ttf', 40)
-        except Exception as e:
-            debug.warning('game_over', f"Failed to load custom font: {e}")
-            self.title_font = pygame.font.Font(None, 64)
-            self.subtitle_font = pygame.font.Font(None, 36)
-            self.button_font = pygame.font.Font(None, 40)
+        # Fonts from the registry (fall back to the default font)
+        self.title_font = self.resource_manager.get_font(MENU_FONT_PATH, 64)
+        self.subtitle_font = self.resource_manager.get_font(MENU_FONT_PATH, 36)
+        self.button_font = self.resource_manager.get_font(MENU_FONT_PATH, 40)
         
         # Current level
         self.current_level = level
@@ -72,18 +70,30 @@ class GameOverScreen:
         self.input_cooldown = 250
         self.last_input_time = 0
 
+        # Background, title and subtitle are rendered once
+        self.static_layers = StaticLayerCache()
+
         # Play appropriate sound effect
+        self.resource_manager.pin_screen_assets(
+            'game_over', sounds=['win_sound', 'applause', 'lost_sound', 'failing']
+        )
         self._play_game_result_sound()
 
     def display(self):
+        # Only redraws on input; reports the frames and CPU time it saved
+        self.menu_loop = IdleMenuLoop('game_over')
+        try:
+            return self._run_display(self.menu_loop)
+        finally:
+            self.menu_loop.report()
+
+    def _run_display(self, menu_loop):
         # Ensure music is paused during game over screen
-        pygame.mixer.music.pause()
-        
-        clock = pygame.time.Clock()
+        music_manager.pause()
         
         while True:
-            # Handle input
-            action = self.handle_input()
+            # Handle input (blocks while the screen is idle)
+            action = self.handle_input(menu_loop.wait_events())
             
             # Check for specific actions with additional safeguard
             if action:
@@ -97,38 +107,22 @@ class GameOverScreen:
                     debug.log('game_over', f"Progressing to level {next_level}")
                     
                     # Resume background music
-                    pygame.mixer.music.unpause()
+                    music_manager.resume()
                     return next_level
                 
                 # Resume background music for other actions
-                pygame.mixer.music.unpause()
+                music_manager.resume()
                 return action
             
-            # Clear screen
-            self.screen.fill(self.BACKGROUND_COLOR)
-            
-            # Determine title based on win/lose status
-            if self.is_win:
-                title_text = "CONGRATULATIONS!"
-                subtitle_text = f"Level {self.current_level} Completed!"
-            else:
-                title_text = "GAME OVER"
-                subtitle_text = "Better luck next time!"
-            
-            # Render title with shadow effect
-            title = self.title_font.render(title_text, True, self.TEXT_COLOR)
-            shadow = self.title_font.render(title_text, True, (50, 50, 50))
-            title_rect = title.get_rect(centerx=self.screen_width//2, centery=100)
-            shadow_rect = shadow.get_rect(centerx=self.screen_width//2 + 3, centery=103)
-            
-            # Draw shadow first, then title
-            self.screen.blit(shadow, shadow_rect)
-            self.screen.blit(title, title_rect)
+            # Nothing changed since the last frame
+            if not menu_loop.should_redraw():
+                continue
             
-            # Subtitle
-            subtitle = self.subtitle_font.render(subtitle_text, True, self.TEXT_COLOR)
-            subtitle_rect = subtitle.get_rect(centerx=self.screen_width // 2, centery=200)
-            self.screen.blit(subtitle, subtitle_rect)
+            # Background, title and subtitle (pre-rendered)
+            self.screen.blit(
+                self.static_layers.get('background', self.screen.get_size(), self._draw_static_layer, theme=self.is_win),
+                (0, 0)
+            )
             
             # Draw buttons
             for i, button_info in enumerate(self.buttons):
@@ -142,7 +136,40 @@ class GameOverScreen:
 
             # Update the display
             pygame.display.flip()
-            clock.tick(60)
+            menu_loop.frame_drawn()
+
+    def _draw_static_layer(self, surface):
+        """
+        Draw the parts of the screen that never change while it is shown
+        
+        Args:
+            surface (pygame.Surface): Screen-sized layer to draw on
+        """
+        # Clear screen
+        surface.fill(self.BACKGROUND_COLOR)
+        
+        # Determine title based on win/lose status
+        if self.is_win:
+            title_text = "CONGRATULATIONS!"
+            subtitle_text = f"Level {self.current_level} Completed!"
+        else:
+            title_text = "GAME OVER"
+            subtitle_text = "Better luck next time!"
+        
+        # Render title with shadow effect
+        title = text_cache.render(self.title_font, title_text, self.TEXT_COLOR)
+        shadow = text_cache.render(self.title_font, title_text, (50, 50, 50))
+        title_rect = title.get_rect(centerx=surface.get_width()//2, centery=100)
+        shadow_rect = shadow.get_rect(centerx=surface.get_width()//2 + 3, centery=103)
+        
+        # Draw shadow first, then title
+        surface.blit(shadow, shadow_rect)
+        surface.blit(title, title_rect)
+        
+        # Subtitle
+        subtitle = text_cache.render(self.subtitle_font, subtitle_text, self.TEXT_COLOR)
+        subtitle_rect = subtitle.get_rect(centerx=surface.get_width() // 2, centery=200)
+        surface.blit(subtitle, subtitle_rect)
 
     def calculate_button_y(self, index):
         """
@@ -156,14 +183,19 @@ class GameOverScreen:
         """
         return 300 + index * (self.button_height + self.button_spacing)
 
-    def handle_input(self):
+    def handle_input(self, events=None):
         """
         Handle user input for navigating the game over screen
         
+        Args:
+            events (list, optional): Events to handle, defaults to the pygame event queue
+        
         Returns:
             str: Action to be taken based on input
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 return 'quit'
             
@@ -263,7 +295,7 @@ class GameOverScreen:
         )
         
         # Render button text with custom font
-        text_surface = self.button_font.render(text, True, text_color)
+        text_surface = text_cache.render(self.button_font, text, text_color)
         text_rect = text_surface.get_rect(center=button_rect.center)
         
         # Slight text offset when selected/hovered for press effect
@@ -4,8 +4,12 @@ import time
 from src.game.game_state import current_game_state
 from config.setting import current_settings
 from src.utils.constant import Colors
-from src.utils.resource_manager import ResourceManager  # Make sure to import ResourceManager
+from src.utils.resource_manager import ResourceManager, MENU_FONT_PATH  # Make sure to import ResourceManager
 from src.utils.debug_section import debug
+from src.ui.text_cache import text_cache
+from src.ui.static_layer import StaticLayerCache
+from src.ui.menu_loop import IdleMenuLoop
+from src.utils.music_manager import music_manager
 
 import logging
 import re
@@ -23,6 +27,28 @@ class Menu:
     def __init__(self, screen):
         self.screen = screen
         self.resource_manager = ResourceManager.get_instance()  # Get the ResourceManager instance
+        # Pre-rendered static layers, rebuilt only on resize or theme change
+        self.static_layers = StaticLayerCache()
+        # Pacing of the last display() call, kept for its statistics
+        self.menu_loop = None
+
+    def run_menu_loop(self, name, run, animation_interval=None):
+        """
+        Run a menu loop with event-driven pacing and report its statistics
+        
+        Args:
+            name (str): Menu name for the report
+            run (callable): Loop body taking the IdleMenuLoop, returns the menu result
+            animation_interval (float, optional): Seconds between animation redraws
+        
+        Returns:
+            The result of run
+        """
+        self.menu_loop = IdleMenuLoop(name, animation_interval=animation_interval)
+        try:
+            return run(self.menu_loop)
+        finally:
+            self.menu_loop.report()
 
     def draw_button(self, 
                     text,  # First parameter is now the text
@@ -62,7 +88,7 @@ class Menu:
         pygame.draw.rect(self.screen, current_color, button_rect)
         
         # Render text
-        font = pygame.font.Font(None, 36)
+        font = self.resource_manager.get_font(None, 36)
         text_surface = font.render(text, True, (0, 0, 0))
         text_rect = text_surface.get_rect(center=button_rect.center)
         
@@ -91,15 +117,9 @@ class MainMenu(Menu):
         self.button_clicked = False
         self.screen = screen
         
-        # Load custom font for buttons and title
-        try:
-            self.title_font = pygame.font.Font('assets/font/River Adventurer.ttf', 100)
-            self.button_font = pygame.font.Font('assets/font/River Adventurer.ttf', 50)
-        except Exception as e:
-            debug.warning('menu', f"Failed to load custom font: {e}")
-            # Fallback to default font
-            self.title_font = pygame.font.Font(None, 100)
-            self.button_font = pygame.font.Font(None, 50)
+        # Load custom font for buttons and title (falls back to the default font)
+        self.title_font = self.resource_manager.get_font(MENU_FONT_PATH, 100)
+        self.button_font = self.resource_manager.get_font(MENU_FONT_PATH, 50)
         
         # Button configuration
         self.buttons = [
@@ -121,8 +141,13 @@ class MainMenu(Menu):
         ]
 
     def display(self):
+        music_manager.play('background-menu')
+        self.resource_manager.pin_screen_assets('main_menu', images=['main_background'])
+        # The title blinks every half second
+        return self.run_menu_loop('main_menu', self._run_display, animation_interval=0.5)
+
+    def _run_display(self, menu_loop):
         current_game_state.set_screen('main_menu')
-        clock = pygame.time.Clock()
         
         try:
             background_image = self.resource_manager.get_image('main_background')
@@ -133,8 +158,8 @@ class MainMenu(Menu):
         while True:
             current_time = pygame.time.get_ticks()
             
-            # Event handling
-            for event in pygame.event.get():
+            # Event handling (blocks while the menu is idle)
+            for event in menu_loop.wait_events():
                 if event.type == pygame.QUIT:
                     return 'quit'
                 if event.type == pygame.KEYDOWN:
@@ -155,19 +180,19 @@ class MainMenu(Menu):
                         pygame.time.delay(200)
                         return action
 
-            # Clear screen
-            self.screen.fill(Colors.WHITE)
+            # Nothing changed since the last frame
+            if not menu_loop.should_redraw():
+                continue
 
-            # Draw background if available
-            if background_image:
-                self.screen.blit(background_image, (0, 0))
+            # Background (pre-rendered)
+            self.screen.blit(self._get_background_layer(background_image), (0, 0))
 
             screen_width = self.screen.get_width()
             
             # Title with blinking effect
-            title_text = self.title_font.render('Collect Cat', True, pygame.Color(139, 69, 19))
+            title_text = text_cache.render(self.title_font, 'Collect Cat', (139, 69, 19))
             if int(time.time() * 2) % 2 == 0:
-                title_text = self.title_font.render('Collect Cat', True, pygame.Color(50, 50, 50))
+                title_text = text_cache.render(self.title_font, 'Collect Cat', (50, 50, 50))
             
             title_rect = title_text.get_rect(center=(screen_width // 2, 100))
             self.screen.blit(title_text, title_rect)
@@ -184,38 +209,8 @@ class MainMenu(Menu):
                 # Calculate button position
                 button_y = start_button_y + i * (button_height + spacing)
                 
-                # Create button surface
-                button_surface = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-                
-                # Define colors
-                base_color = (200, 200, 200, 200)  # Semi-transparent light gray
-                hover_color = (180, 180, 180, 230)  # Semi-transparent darker gray
-                text_color = Colors.BLACK
-                
-                # Apply hover effect
-                current_color = hover_color if button['hover'] else base_color
-                
-                # Draw button background with rounded corners
-                pygame.draw.rect(
-                    button_surface, 
-                    current_color, 
-                    button_surface.get_rect(), 
-                    border_radius=15
-                )
-                
-                # Add border
-                pygame.draw.rect(
-                    button_surface, 
-                    Colors.BLACK, 
-                    button_surface.get_rect(), 
-                    2, 
-                    border_radius=15
-                )
-                
-                # Render button text
-                text_surface = self.button_font.render(button['text'], True, text_color)
-                text_rect = text_surface.get_rect(center=(button_width // 2, button_height // 2))
-                button_surface.blit(text_surface, text_rect)
+                # Pre-rendered normal and hover variants of the button
+                button_surface = self._get_button_layer(button, button_width, button_height)
                 
                 # Store button rect for click detection
                 button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
@@ -225,7 +220,74 @@ class MainMenu(Menu):
                 self.screen.blit(button_surface, button_rect)
 
             pygame.display.flip()
-            clock.tick(60)
+            menu_loop.frame_drawn()
+
+    def _get_background_layer(self, background_image):
+        """
+        Get the pre-rendered menu background
+        
+        Args:
+            background_image (pygame.Surface or None): Background picture
+        
+        Returns:
+            pygame.Surface: Screen-sized background layer
+        """
+        def build(surface):
+            surface.fill(Colors.WHITE)
+            if background_image:
+                surface.blit(background_image, (0, 0))
+        
+        return self.static_layers.get('background', self.screen.get_size(), build)
+
+    def _get_button_layer(self, button, button_width, button_height):
+        """
+        Get the pre-rendered surface of a button in its current hover state
+        
+        Args:
+            button (dict): Button configuration
+            button_width (int): Button width
+            button_height (int): Button height
+        
+        Returns:
+            pygame.Surface: Button surface with its text
+        """
+        def build(button_surface):
+            # Define colors
+            base_color = (200, 200, 200, 200)  # Semi-transparent light gray
+            hover_color = (180, 180, 180, 230)  # Semi-transparent darker gray
+            text_color = Colors.BLACK
+            
+            # Apply hover effect
+            current_color = hover_color if button['hover'] else base_color
+            
+            # Draw button background with rounded corners
+            pygame.draw.rect(
+                button_surface, 
+                current_color, 
+                button_surface.get_rect(), 
+                border_radius=15
+            )
+            
+            # Add border
+            pygame.draw.rect(
+                button_surface, 
+                Colors.BLACK, 
+                button_surface.get_rect(), 
+                2, 
+                border_radius=15
+            )
+            
+            # Render button text
+            text_surface = text_cache.render(self.button_font, button['text'], text_color)
+            text_rect = text_surface.get_rect(center=(button_width // 2, button_height // 2))
+            button_surface.blit(text_surface, text_rect)
+        
+        return self.static_layers.get(
+            ('button', button['text'], button['hover']),
+            (button_width, button_height),
+            build,
+            alpha=True
+        )
 
     def _handle_mouse_hover(self, mouse_pos):
         """
@@ -284,8 +346,12 @@ class LevelSelectionMenu(Menu):
         }
 
     def display(self):
+        music_manager.play('background-menu')
+        self.resource_manager.pin_screen_assets('level_selection', images=['main_background'])
+        return self.run_menu_loop('level_selection', self._run_display)
+
+    def _run_display(self, menu_loop):
         current_game_state.set_screen('level_selection')
-        clock = pygame.time.Clock()
         
         # Load background image
         try:
@@ -295,8 +361,8 @@ class LevelSelectionMenu(Menu):
             background_image = None
 
         while True:
-            # Event handling
-            for event in pygame.event.get():
+            # Event handling (blocks while the menu is idle)
+            for event in menu_loop.wait_events():
                 if event.type == pygame.QUIT:
                     return 'quit'
                 
@@ -319,80 +385,21 @@ class LevelSelectionMenu(Menu):
                     if back_button_rect.collidepoint(mouse_pos):
                         return 'main_menu'
             
-            # Clear screen
-            self.screen.fill(Colors.WHITE)
-
-            # Draw background if available
-            if background_image:
-                self.screen.blit(background_image, (0, 0))
+            # Nothing changed since the last frame
+            if not menu_loop.should_redraw():
+                continue
+            
+            # Background, title and level buttons (pre-rendered)
+            self.screen.blit(self._get_background_layer(background_image), (0, 0))
 
             # Screen dimensions
             screen_width = self.screen.get_width()
             screen_height = self.screen.get_height()
 
-            # Title
-            title_font = pygame.font.Font('assets/font/River Adventurer.ttf', 64)
-            title_text = title_font.render('Select Level', True, Colors.BLACK)
-            title_rect = title_text.get_rect(center=(screen_width // 2, 80))
-            self.screen.blit(title_text, title_rect)
-
-            # Level button positioning (ROW pattern)
-            button_width = 250
-            button_height = 80
-            spacing = (screen_width - (3 * button_width)) // 4
-            start_y = 200
-
-            # Draw level selection buttons
-            for i in range(1, 4):
-                # Button surface
-                level_surface = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-                
-                # Background color
-                level_details = self.level_details[i]
-                base_color = level_details['background_color']
-                
-                # Create gradient background
-                for y in range(button_height):
-                    r = int(base_color[0] * (1 - y / button_height))
-                    g = int(base_color[1] * (1 - y / button_height))
-                    b = int(base_color[2] * (1 - y / button_height))
-                    pygame.draw.line(level_surface, (r, g, b), (0, y), (button_width, y))
-                
-                # Add border
-                pygame.draw.rect(level_surface, Colors.BLACK, level_surface.get_rect(), 2)
-                
-                # Level number (smaller and centered)
-                number_font = pygame.font.Font('assets/font/River Adventurer.ttf', 40)
-                number_text = number_font.render(str(i), True, Colors.WHITE)
-                number_rect = number_text.get_rect(center=(button_width // 2, button_height // 2))
-                level_surface.blit(number_text, number_rect)
-                
-                # Position and draw the button (ROW pattern)
-                button_rect = level_surface.get_rect(
-                    center=((spacing * i) + (button_width * (i - 0.5)), start_y)
-                )
-                self.screen.blit(level_surface, button_rect)
-
             # Description Area
             if self.hover_level is not None:
-                # Description background
-                desc_surface = pygame.Surface((screen_width - 100, 100), pygame.SRCALPHA)
-                desc_surface.fill((200, 200, 200, 200))
-                pygame.draw.rect(desc_surface, Colors.BLACK, desc_surface.get_rect(), 2)
-                
-                # Description text (smaller font)
-                desc_font = pygame.font.Font(None, 20)
-                details = self.level_details[self.hover_level]
-                
-                # Render multiple lines of description
-                name_text = desc_font.render(f"Level {self.hover_level}: {details['name']}", True, Colors.BLACK)
-                difficulty_text = desc_font.render(f"Difficulty: {details['difficulty']}", True, Colors.BLACK)
-                desc_text = desc_font.render(details['description'], True, Colors.BLACK)
-                
-                # Blit description texts (centered)
-                desc_surface.blit(name_text, (desc_surface.get_width()//2 - name_text.get_width()//2, 10))
-                desc_surface.blit(difficulty_text, (desc_surface.get_width()//2 - difficulty_text.get_width()//2, 40))
-                desc_surface.blit(desc_text, (desc_surface.get_width()//2 - desc_text.get_width()//2, 70))
+                # Pre-rendered description panel of the hovered level
+                desc_surface = self._get_description_layer(self.hover_level)
                 
                 # Position description
                 desc_rect = desc_surface.get_rect(
@@ -442,14 +449,11 @@ class LevelSelectionMenu(Menu):
                 border_radius=15
             )
 
-            # Load custom font or fallback
-            try:
-                back_font = pygame.font.Font('assets/font/River Adventurer.ttf', 36)
-            except Exception:
-                back_font = pygame.font.Font(None, 36)
+            # Custom font (or its fallback) from the font registry
+            back_font = self.resource_manager.get_font(MENU_FONT_PATH, 36)
 
             # Render text
-            back_text = back_font.render("Back", True, text_color)
+            back_text = text_cache.render(back_font, "Back", text_color)
             text_rect = back_text.get_rect(center=back_button_rect.center)
 
             # Draw text
@@ -457,8 +461,108 @@ class LevelSelectionMenu(Menu):
 
             # Update display
             pygame.display.flip()
-            clock.tick(60)
+            menu_loop.frame_drawn()
+
+    def _get_background_layer(self, background_image):
+        """
+        Get the pre-rendered background with the title and level buttons
+        
+        Args:
+            background_image (pygame.Surface or None): Background picture
+        
+        Returns:
+            pygame.Surface: Screen-sized static layer
+        """
+        def build(surface):
+            # Clear screen
+            surface.fill(Colors.WHITE)
+
+            # Draw background if available
+            if background_image:
+                surface.blit(background_image, (0, 0))
+
+            screen_width = surface.get_width()
+
+            # Title
+            title_font = self.resource_manager.get_font(MENU_FONT_PATH, 64)
+            title_text = title_font.render('Select Level', True, Colors.BLACK)
+            title_rect = title_text.get_rect(center=(screen_width // 2, 80))
+            surface.blit(title_text, title_rect)
+
+            # Level button positioning (ROW pattern)
+            button_width = 250
+            button_height = 80
+            spacing = (screen_width - (3 * button_width)) // 4
+            start_y = 200
+
+            # Draw level selection buttons
+            for i in range(1, 4):
+                # Button surface
+                level_surface = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
+                
+                # Background color
+                level_details = self.level_details[i]
+                base_color = level_details['background_color']
+                
+                # Create gradient background
+                for y in range(button_height):
+                    r = int(base_color[0] * (1 - y / button_height))
+                    g = int(base_color[1] * (1 - y / button_height))
+                    b = int(base_color[2] * (1 - y / button_height))
+                    pygame.draw.line(level_surface, (r, g, b), (0, y), (button_width, y))
+                
+                # Add border
+                pygame.draw.rect(level_surface, Colors.BLACK, level_surface.get_rect(), 2)
+                
+                # Level number (smaller and centered)
+                number_font = self.resource_manager.get_font(MENU_FONT_PATH, 40)
+                number_text = number_font.render(str(i), True, Colors.WHITE)
+                number_rect = number_text.get_rect(center=(button_width // 2, button_height // 2))
+                level_surface.blit(number_text, number_rect)
+                
+                # Position and draw the button (ROW pattern)
+                button_rect = level_surface.get_rect(
+                    center=((spacing * i) + (button_width * (i - 0.5)), start_y)
+                )
+                surface.blit(level_surface, button_rect)
+        
+        return self.static_layers.get('background', self.screen.get_size(), build)
 
+    def _get_description_layer(self, level):
+        """
+        Get the pre-rendered description panel of a level
+        
+        Args:
+            level (int): Level shown in the panel
+        
+        Returns:
+            pygame.Surface: Semi-transparent description panel
+        """
+        def build(desc_surface):
+            # Description background
+            desc_surface.fill((200, 200, 200, 200))
+            pygame.draw.rect(desc_surface, Colors.BLACK, desc_surface.get_rect(), 2)
+            
+            # Description text (smaller font)
+            desc_font = self.resource_manager.get_font(None, 20)
+            details = self.level_details[level]
+            
+            # Render multiple lines of description
+            name_text = desc_font.render(f"Level {level}: {details['name']}", True, Colors.BLACK)
+            difficulty_text = desc_font.render(f"Difficulty: {details['difficulty']}", True, Colors.BLACK)
+            desc_text = desc_font.render(details['description'], True, Colors.BLACK)
+            
+            # Blit description texts (centered)
+            desc_surface.blit(name_text, (desc_surface.get_width()//2 - name_text.get_width()//2, 10))
+            desc_surface.blit(difficulty_text, (desc_surface.get_width()//2 - difficulty_text.get_width()//2, 40))
+            desc_surface.blit(desc_text, (desc_surface.get_width()//2 - desc_text.get_width()//2, 70))
+        
+        return self.static_layers.get(
+            ('description', level),
+            (self.screen.get_width() - 100, 100),
+            build,
+            alpha=True
+        )
 
     def _handle_mouse_hover(self, mouse_pos):
         """
@@ -579,14 +683,11 @@ class LevelSelectionMenu(Menu):
             border_radius=15
         )
 
-        # Load custom font or fallback
-        try:
-            back_font = pygame.font.Font('assets/font/River Adventurer.ttf', 36)
-        except Exception:
-            back_font = pygame.font.Font(None, 36)
+        # Custom font (or its fallback) from the font registry
+        back_font = self.resource_manager.get_font(MENU_FONT_PATH, 36)
 
         # Render text
-        back_text = back_font.render("Back", True, text_color)
+        back_text = text_cache.render(back_font, "Back", text_color)
         text_rect = back_text.get_rect(center=back_button_rect.center)
 
         # Draw text
@@ -662,21 +763,12 @@ class SettingsMenu(Menu):
             }
         ]
         
-        # Fonts
-        try:
-            self.title_font = pygame.font.Font('assets/font/River Adventurer.ttf', 48)
-            self.label_font = pygame.font.Font('assets/font/River Adventurer.ttf', 36)
-            self.input_font = pygame.font.Font('assets/font/River Adventurer.ttf', 32)
-            self.description_font = pygame.font.Font('assets/font/River Adventurer.ttf', 24)
-            self.button_font = pygame.font.Font('assets/font/River Adventurer.ttf', 30)
-        except Exception as e:
-            debug.warning('settings', f"Failed to load custom font: {e}")
-            # Fallback to default fonts
-            self.title_font = pygame.font.Font(None, 48)
-            self.label_font = pygame.font.Font(None, 36)
-            self.input_font = pygame.font.Font(None, 32)
-            self.description_font = pygame.font.Font(None, 24)
-            self.button_font = pygame.font.Font(None, 30)
+        # Fonts (fall back to the default font)
+        self.title_font = self.resource_manager.get_font(MENU_FONT_PATH, 48)
+        self.label_font = self.resource_manager.get_font(MENU_FONT_PATH, 36)
+        self.input_font = self.resource_manager.get_font(MENU_FONT_PATH, 32)
+        self.description_font = self.resource_manager.get_font(MENU_FONT_PATH, 24)
+        self.button_font = self.resource_manager.get_font(MENU_FONT_PATH, 30)
 
     def _render_settings_fields(self):
         """
@@ -839,11 +931,12 @@ class SettingsMenu(Menu):
             return getattr(self.settings, self.current_input_field), False
 
     def display(self):
-        clock = pygame.time.Clock()
+        return self.run_menu_loop('settings', self._run_display)
 
+    def _run_display(self, menu_loop):
         while True:
-            # Event handling
-            for event in pygame.event.get():
+            # Event handling (blocks while the menu is idle)
+            for event in menu_loop.wait_events():
                 if event.type == pygame.QUIT:
                     return 'quit'
 
@@ -862,6 +955,10 @@ class SettingsMenu(Menu):
                     if back_button_rect.collidepoint(event.pos):
                         return self.handle_exit()
 
+            # Nothing changed since the last frame
+            if not menu_loop.should_redraw():
+                continue
+
             # Clear screen
             self.screen.fill(Colors.WHITE)
 
@@ -912,14 +1009,11 @@ class SettingsMenu(Menu):
                 border_radius=15
             )
 
-            # Load custom font or fallback
-            try:
-                back_font = pygame.font.Font('assets/font/River Adventurer.ttf', 36)
-            except Exception:
-                back_font = pygame.font.Font(None, 36)
+            # Custom font (or its fallback) from the font registry
+            back_font = self.resource_manager.get_font(MENU_FONT_PATH, 36)
 
             # Render text
-            back_text = back_font.render("Back", True, text_color)
+            back_text = text_cache.render(back_font, "Back", text_color)
             text_rect = back_text.get_rect(center=back_button_rect.center)
 
             # Draw text
@@ -927,7 +1021,7 @@ class SettingsMenu(Menu):
 
             # Update display
             pygame.display.flip()
-            clock.tick(60)
+            menu_loop.frame_drawn()
 
     def handle_exit(self):
         """
@@ -1264,7 +1358,7 @@ class SettingsMenu(Menu):
             pygame.draw.rect(self.screen, color, button_rect)
         
         # Render button text
-        font = pygame.font.Font(None, 36)
+        font = self.resource_manager.get_font(None, 36)
         text_surface = font.render(text, True, Colors.BLACK)
         text_rect = text_surface.get_rect(center=button_rect.center)
         self.screen.blit(text_surface, text_rect)
@@ -1307,14 +1401,9 @@ class PauseMenu(Menu):
             'text_hover': (200, 200, 255)
         }
         
-        # Fonts
-        try:
-            self.title_font = pygame.font.Font('assets/font/River Adventurer.ttf', 72)
-            self.button_font = pygame.font.Font('assets/font/River Adventurer.ttf', 48)
-        except Exception as e:
-            debug.warning('pause_menu', f"Failed to load custom font: {e}")
-            self.title_font = pygame.font.Font(None, 72)
-            self.button_font = pygame.font.Font(None, 48)
+        # Fonts (fall back to the default font)
+        self.title_font = self.resource_manager.get_font(MENU_FONT_PATH, 72)
+        self.button_font = self.resource_manager.get_font(MENU_FONT_PATH, 48)
         
         # Button Configuration
         self.button_width = 300
@@ -1352,46 +1441,69 @@ class PauseMenu(Menu):
             self.button_rects.append(pygame.Rect(x, y, self.button_width, self.button_height))
     
     def display(self):
-        clock = pygame.time.Clock()
-        
+        return self.run_menu_loop('pause_menu', self._run_display)
+
+    def _run_display(self, menu_loop):
         while True:
-            # Handle input
-            action = self.handle_input()
+            # Handle input (blocks while the menu is idle)
+            action = self.handle_input(menu_loop.wait_events())
             
             if action:
                 pygame.time.delay(250)
                 debug.log('pause_menu', f"Selected action: {action}")
                 return action
             
-            # Clear screen with gradient background
-            self.draw_gradient_background()
+            # Nothing changed since the last frame
+            if not menu_loop.should_redraw():
+                continue
             
-            # Draw title
-            self.draw_title()
+            # Pre-rendered gradient background and title
+            self.draw_static_layer()
             
             # Draw buttons
             self.draw_buttons()
             
             pygame.display.flip()
-            clock.tick(60)
+            menu_loop.frame_drawn()
+    
+    def draw_static_layer(self):
+        """Blit the gradient background and title, rendering them once per screen size"""
+        def build(surface):
+            self.draw_gradient_background(surface)
+            self.draw_title(surface)
+        
+        self.screen.blit(self.static_layers.get('background', self.screen.get_size(), build), (0, 0))
     
-    def draw_gradient_background(self):
-        """Create a gradient background"""
-        for y in range(self.screen_height):
+    def draw_gradient_background(self, surface=None):
+        """
+        Create a gradient background
+        
+        Args:
+            surface (pygame.Surface, optional): Target surface, defaults to the screen
+        """
+        surface = surface or self.screen
+        width, height = surface.get_size()
+        for y in range(height):
             # Create a gradient from dark blue to dark purple
-            r = int(40 * (1 - y / self.screen_height) + 40)
-            g = int(40 * (1 - y / self.screen_height) + 40)
-            b = int(60 * (1 - y / self.screen_height) + 60)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.screen_width, y))
+            r = int(40 * (1 - y / height) + 40)
+            g = int(40 * (1 - y / height) + 40)
+            b = int(60 * (1 - y / height) + 60)
+            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
     
-    def draw_title(self):
-        """Draw the pause menu title"""
-        title_text = self.title_font.render("PAUSED", True, (255, 255, 255))
+    def draw_title(self, surface=None):
+        """
+        Draw the pause menu title
+        
+        Args:
+            surface (pygame.Surface, optional): Target surface, defaults to the screen
+        """
+        surface = surface or self.screen
+        title_text = text_cache.render(self.title_font, "PAUSED", (255, 255, 255))
         title_rect = title_text.get_rect(
-            centerx=self.screen_width // 2, 
+            centerx=surface.get_width() // 2, 
             centery=100
         )
-        self.screen.blit(title_text, title_rect)
+        surface.blit(title_text, title_rect)
     
     def draw_buttons(self):
         """Draw interactive buttons with hover effects"""
@@ -1414,13 +1526,20 @@ class PauseMenu(Menu):
             # Button text
             text_color = (self.BUTTON_COLORS['text_hover'] if is_hover 
                           else self.BUTTON_COLORS['text_normal'])
-            text_surface = self.button_font.render(button['text'], True, text_color)
+            text_surface = text_cache.render(self.button_font, button['text'], text_color)
             text_rect = text_surface.get_rect(center=button_rect.center)
             self.screen.blit(text_surface, text_rect)
     
-    def handle_input(self):
-        """Handle user input with keyboard and mouse support"""
-        for event in pygame.event.get():
+    def handle_input(self, events=None):
+        """
+        Handle user input with keyboard and mouse support
+        
+        Args:
+            events (list, optional): Events to handle, defaults to the pygame event queue
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 return 'main_menu'
             
@@ -0,0 +1,81 @@
+# src/ui/loading_screen.py
+import pygame
+from src.utils.constant import Colors
+from src.utils.debug_section import debug
+from src.utils.resource_manager import ResourceManager, MENU_FONT_PATH
+from src.ui.text_cache import text_cache
+
+class LoadingScreen:
+    """
+    Progress screen shown while the asset loader decodes files.
+
+    It only waits for one loading group (e.g. 'menu'); the remaining groups
+    keep decoding in the background after the screen returns.
+    """
+
+    def __init__(self, screen, asset_loader=None):
+        """
+        Initialize the loading screen
+
+        Args:
+            screen (pygame.Surface): Display surface
+            asset_loader (AssetLoader, optional): Loader to report, defaults to the ResourceManager's
+        """
+        self.screen = screen
+        self.resource_manager = ResourceManager.get_instance()
+        self.asset_loader = asset_loader or self.resource_manager.asset_loader
+
+        self.BACKGROUND_COLOR = (40, 40, 60)
+        self.TEXT_COLOR = Colors.WHITE
+        self.BAR_COLOR = Colors.LIGHTGRAY
+        self.font = self.resource_manager.get_font(MENU_FONT_PATH, 40)
+
+    def draw(self, progress):
+        """
+        Draw the title and the progress bar
+
+        Args:
+            progress (float): Loading progress from 0.0 to 1.0
+        """
+        width, height = self.screen.get_size()
+        self.screen.fill(self.BACKGROUND_COLOR)
+
+        title = text_cache.render(self.font, "Loading...", self.TEXT_COLOR)
+        self.screen.blit(title, title.get_rect(center=(width // 2, height // 2 - 40)))
+
+        bar_rect = pygame.Rect(0, 0, width // 2, 24)
+        bar_rect.center = (width // 2, height // 2 + 20)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(self.screen, self.BAR_COLOR, fill_rect)
+        pygame.draw.rect(self.screen, self.TEXT_COLOR, bar_rect, 2)
+
+    def run(self, group='menu', max_fps=30):
+        """
+        Show progress until every asset of a group is ready
+
+        Args:
+            group (str): Loading group to wait for
+            max_fps (int): Frame rate of the progress screen
+
+        Returns:
+            str: 'ready', or 'quit' if the window was closed
+        """
+        clock = pygame.time.Clock()
+        frames = 0
+        while not self.asset_loader.is_done(group):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    debug.log('resources', "Window closed while loading")
+                    # Leave the event queued so the first menu quits right away
+                    pygame.event.post(event)
+                    return 'quit'
+
+            self.asset_loader.poll()
+            self.draw(self.asset_loader.get_progress())
+            pygame.display.flip()
+            frames += 1
+            clock.tick(max_fps)
+
+        debug.log('resources', f"Loading screen done for '{group}' after {frames} frames")
+        return 'ready'
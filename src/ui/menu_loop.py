@@ -0,0 +1,162 @@
+import time
+import pygame
+from typing import List, Optional
+from config.setting import current_settings
+from src.utils.debug_section import debug
+from src.utils.music_manager import music_manager
+
+performance_log = debug.section('performance')
+
+class IdleMenuLoop:
+    """
+    Event-driven frame pacing for menu screens.
+
+    Instead of redrawing at a fixed 60 FPS, the loop blocks in
+    pygame.event.wait until input arrives or the next animation tick is due,
+    and the menu only redraws when something may have changed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_fps: int = 60,
+        animation_interval: Optional[float] = None,
+        idle_timeout: float = 1.0,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize the loop
+
+        Args:
+            name (str): Menu name used in the report
+            max_fps (int): Frame rate cap while redrawing (e.g. during mouse movement)
+            animation_interval (float, optional): Seconds between animation ticks (wall-clock aligned)
+            idle_timeout (float): Longest time to block without any event
+            enabled (bool, optional): Event-driven mode, defaults to the event_driven_menus setting
+        """
+        self.name = name
+        self.max_fps = max_fps
+        self.animation_interval = animation_interval
+        self.idle_timeout = idle_timeout
+        self.enabled = current_settings.event_driven_menus if enabled is None else enabled
+
+        self.clock = pygame.time.Clock()
+        self.redraw_needed = True
+        self.animation_tick = self._current_animation_tick()
+
+        # Statistics
+        self.frames_drawn = 0
+        self.wakeups = 0
+        self.draw_seconds = 0.0
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        self._frame_start = None
+        self.last_stats = None
+
+    def _current_animation_tick(self) -> Optional[int]:
+        if not self.animation_interval:
+            return None
+        return int(time.time() // self.animation_interval)
+
+    def _seconds_to_next_tick(self) -> float:
+        if not self.animation_interval:
+            return self.idle_timeout
+        now = time.time()
+        next_tick = (int(now // self.animation_interval) + 1) * self.animation_interval
+        return min(self.idle_timeout, max(0.0, next_tick - now))
+
+    def wait_events(self) -> List[pygame.event.Event]:
+        """
+        Get the pending events, blocking while the menu is idle
+
+        Returns:
+            List[pygame.event.Event]: Events to handle this iteration
+        """
+        if not self.enabled:
+            return pygame.event.get()
+
+        events = pygame.event.get()
+        if not events and not self.redraw_needed:
+            timeout_ms = max(1, int(self._seconds_to_next_tick() * 1000) + 1)
+            event = pygame.event.wait(timeout_ms)
+            self.wakeups += 1
+            if event.type != pygame.NOEVENT:
+                events = [event] + pygame.event.get()
+
+        # Track switches wake the loop but do not need a redraw
+        events = [event for event in events if not music_manager.handle_event(event)]
+        if events:
+            self.redraw_needed = True
+
+        tick = self._current_animation_tick()
+        if tick != self.animation_tick:
+            self.animation_tick = tick
+            self.redraw_needed = True
+
+        return events
+
+    def should_redraw(self) -> bool:
+        """
+        Check whether the menu has to draw a frame this iteration
+
+        Returns:
+            bool: True after input, an animation tick, or always when disabled
+        """
+        if not self.enabled or self.redraw_needed:
+            self._frame_start = time.perf_counter()
+            return True
+        return False
+
+    def request_redraw(self):
+        """Force a redraw on the next iteration (e.g. after a state change)"""
+        self.redraw_needed = True
+
+    def frame_drawn(self):
+        """Call after flipping a drawn frame; caps the redraw rate"""
+        self.frames_drawn += 1
+        if self._frame_start is not None:
+            self.draw_seconds += time.perf_counter() - self._frame_start
+            self._frame_start = None
+        self.redraw_needed = False
+        self.clock.tick(self.max_fps)
+
+    def get_stats(self) -> dict:
+        """
+        Get frame and CPU statistics of the menu session
+
+        Returns:
+            dict: Frames drawn versus a fixed-rate loop and estimated CPU time saved
+        """
+        wall_seconds = time.perf_counter() - self.start_wall
+        cpu_seconds = time.process_time() - self.start_cpu
+        fixed_rate_frames = int(wall_seconds * self.max_fps)
+        frame_cost = self.draw_seconds / self.frames_drawn if self.frames_drawn else 0.0
+        frames_skipped = max(0, fixed_rate_frames - self.frames_drawn)
+        return {
+            'menu': self.name,
+            'event_driven': self.enabled,
+            'wall_seconds': wall_seconds,
+            'cpu_seconds': cpu_seconds,
+            'frames_drawn': self.frames_drawn,
+            'fixed_rate_frames': fixed_rate_frames,
+            'wakeups': self.wakeups,
+            'cpu_seconds_saved': frames_skipped * frame_cost
+        }
+
+    def report(self) -> dict:
+        """
+        Log the statistics of the menu session
+
+        Returns:
+            dict: Same as get_stats
+        """
+        stats = self.get_stats()
+        self.last_stats = stats
+        if __debug__ and performance_log.enabled:
+            performance_log.log(
+                "Menu %s: drew %d frames in %.1fs (%d at %d FPS), CPU %.2fs, ~%.2fs CPU saved",
+                self.name, stats['frames_drawn'], stats['wall_seconds'],
+                stats['fixed_rate_frames'], self.max_fps, stats['cpu_seconds'],
+                stats['cpu_seconds_saved']
+            )
+        return stats
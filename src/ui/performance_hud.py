@@ -0,0 +1,125 @@
+# src/ui/performance_hud.py
+import pygame
+from config.setting import current_settings
+from src.utils.constant import Colors
+from src.utils.resource_manager import ResourceManager
+from src.utils.frame_profiler import FrameProfiler, HISTOGRAM_BOUNDS_MS
+
+class PerformanceHUD:
+    """
+    Overlay with frame-time percentiles, the slowest phases and a histogram.
+
+    Visibility follows the show_fps setting (toggled in game with F3). The
+    panel is rebuilt a few times per second, not every frame, so the HUD
+    itself barely shows up in the numbers it reports.
+    """
+
+    TOGGLE_KEY = pygame.K_F3
+
+    def __init__(self, profiler: FrameProfiler, refresh_frames: int = 30, max_phases: int = 6):
+        """
+        Initialize the HUD
+
+        Args:
+            profiler (FrameProfiler): Profiler to display
+            refresh_frames (int): Frames between panel rebuilds
+            max_phases (int): Number of phases listed, slowest (p95) first
+        """
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.max_phases = max_phases
+        self.font = ResourceManager.get_instance().get_font(None, 20)
+        self.panel_surface = None
+        self.frames_since_refresh = 0
+
+        self.BACKGROUND_COLOR = (0, 0, 0, 160)
+        self.TEXT_COLOR = Colors.WHITE
+        self.BAR_COLOR = (120, 200, 120)
+        self.SLOW_BAR_COLOR = (220, 120, 80)
+
+    @property
+    def visible(self) -> bool:
+        return current_settings.show_fps
+
+    def toggle(self):
+        """Show or hide the HUD"""
+        current_settings.show_fps = not current_settings.show_fps
+        self.panel_surface = None
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Toggle the HUD on its key
+
+        Args:
+            event (pygame.event.Event): Event to check
+
+        Returns:
+            bool: True if the event toggled the HUD
+        """
+        if event.type == pygame.KEYDOWN and event.key == self.TOGGLE_KEY:
+            self.toggle()
+            return True
+        return False
+
+    def _build_panel(self) -> pygame.Surface:
+        stats = self.profiler.get_stats()
+        frame = stats['frame']
+        work = stats['work']
+        fps = 1000.0 / frame['mean_ms'] if frame['mean_ms'] else 0.0
+
+        lines = [
+            f"FPS {fps:5.1f}   frames {stats['frames']}",
+            f"frame p50/95/99 {frame['p50_ms']:.1f}/{frame['p95_ms']:.1f}/{frame['p99_ms']:.1f} ms",
+            f"work  p50/95/99 {work['p50_ms']:.2f}/{work['p95_ms']:.2f}/{work['p99_ms']:.2f} ms"
+        ]
+        phases = sorted(
+            (item for item in stats['phases'].items() if item[0] != self.profiler.idle_phase),
+            key=lambda item: item[1]['p95_ms'], reverse=True
+        )
+        for phase, summary in phases[:self.max_phases]:
+            lines.append(f"  {phase:<16} {summary['p50_ms']:.2f}/{summary['p95_ms']:.2f} ms")
+
+        line_height = self.font.get_linesize()
+        text_surfaces = [self.font.render(line, True, self.TEXT_COLOR) for line in lines]
+        histogram = list(stats['histogram'].values())
+        histogram_height = 40
+        width = max(220, max(surface.get_width() for surface in text_surfaces) + 16)
+        height = len(lines) * line_height + histogram_height + 20
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(self.BACKGROUND_COLOR)
+        for i, surface in enumerate(text_surfaces):
+            panel.blit(surface, (8, 6 + i * line_height))
+
+        # Frame-time histogram; buckets over 16.7 ms (below 60 FPS) in a warning color
+        on_time_buckets = sum(1 for bound in HISTOGRAM_BOUNDS_MS if bound <= 16.7)
+        top = 10 + len(lines) * line_height
+        bar_width = (width - 16) // len(histogram)
+        most = max(histogram) or 1
+        for i, count in enumerate(histogram):
+            bar_height = int(histogram_height * count / most)
+            color = self.BAR_COLOR if i < on_time_buckets else self.SLOW_BAR_COLOR
+            pygame.draw.rect(
+                panel, color,
+                (8 + i * bar_width, top + histogram_height - bar_height, bar_width - 2, bar_height)
+            )
+        return panel
+
+    def draw(self, screen: pygame.Surface):
+        """
+        Draw the HUD in the top-left corner if it is visible
+
+        Args:
+            screen (pygame.Surface): Target surface
+
+        Returns:
+            pygame.Rect or None: Screen area touched by the HUD
+        """
+        if not self.visible:
+            return None
+
+        self.frames_since_refresh += 1
+        if self.panel_surface is None or self.frames_since_refresh >= self.refresh_frames:
+            self.panel_surface = self._build_panel()
+            self.frames_since_refresh = 0
+        return screen.blit(self.panel_surface, (10, 10))
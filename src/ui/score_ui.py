@@ -1,11 +1,12 @@
 import pygame
 from src.utils.debug_section import debug
+from src.utils.resource_manager import ResourceManager
 from src.game.game_state import current_game_state
+from src.ui.text_cache import text_cache, DigitGlyphs
 class ScoreUI:
     def __init__(self, screen_width, screen_height):
-        # Initialize font
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 36)
+        # Shared default font from the font registry
+        self.font = ResourceManager.get_instance().get_font(None, 36)
         
         # Screen dimensions
         self.screen_width = screen_width
@@ -19,6 +20,12 @@ class ScoreUI:
         self.text_color = (255, 215, 0)  # Gold color
         self.background_color = (0, 0, 0)  # Black background
 
+        # Pre-rendered label and digits; the panel is rebuilt only when the shown number changes
+        self.label_surface = text_cache.render(self.font, 'Score: ', self.text_color)
+        self.digits = DigitGlyphs(self.font, self.text_color)
+        self.panel_surface = None
+        self.panel_score = None
+
         # Win scores for each level
         self.win_scores = {
             1: 100,
@@ -43,23 +50,41 @@ class ScoreUI:
         self.total_score = 0
         self.visible_score = 0
     
-    def draw(self, screen):
-        """Draw score on the screen"""
-        # Create score text surface
-        score_text = self.font.render(f'Score: {int(self.visible_score)}', True, self.text_color)
+    def _build_panel(self, score_text):
+        """
+        Compose the score panel: semi-transparent background, label and digits
         
-        # Position the score text
-        text_rect = score_text.get_rect(center=(self.screen_width // 2, 50))
+        Args:
+            score_text (str): Score to show
+        
+        Returns:
+            pygame.Surface: Panel surface
+        """
+        digits_width, digits_height = self.digits.measure(score_text)
+        text_width = self.label_surface.get_width() + digits_width
+        text_height = max(self.label_surface.get_height(), digits_height)
         
-        # Optional: Draw a semi-transparent background
-        background_rect = pygame.Rect(text_rect.left - 10, text_rect.top - 5, 
-                                      text_rect.width + 20, text_rect.height + 10)
-        s = pygame.Surface(background_rect.size, pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))  # Semi-transparent black
-        screen.blit(s, background_rect)
+        panel = pygame.Surface((text_width + 20, text_height + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 128))  # Semi-transparent black
+        panel.blit(self.label_surface, (10, 5))
+        self.digits.draw(panel, score_text, (10 + self.label_surface.get_width(), 5))
+        return panel
+    
+    def draw(self, screen):
+        """
+        Draw score on the screen
+
+        Returns:
+            pygame.Rect: Screen area touched by the score panel
+        """
+        shown_score = int(self.visible_score)
+        if shown_score != self.panel_score or self.panel_surface is None:
+            self.panel_surface = self._build_panel(str(shown_score))
+            self.panel_score = shown_score
         
-        # Draw the score text
-        screen.blit(score_text, text_rect)
+        # Center the panel where the score text used to be
+        panel_rect = self.panel_surface.get_rect(center=(self.screen_width // 2, 50))
+        return screen.blit(self.panel_surface, panel_rect)
     
     def is_winning_score(self, current_level):
         """
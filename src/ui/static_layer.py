@@ -0,0 +1,66 @@
+import pygame
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+class StaticLayerCache:
+    """
+    Pre-rendered static parts of a screen (backgrounds, gradients, borders, titles).
+
+    Each layer is drawn once and rebuilt only when its size or theme changes
+    (e.g. after a resize), so a frame only composites the dynamic state on top.
+    """
+
+    def __init__(self):
+        self._layers: Dict[Hashable, Tuple[Hashable, pygame.Surface]] = {}
+
+    def get(
+        self,
+        name: Hashable,
+        size: Tuple[int, int],
+        build: Callable[[pygame.Surface], None],
+        theme: Hashable = None,
+        alpha: bool = False,
+        colorkey: Optional[Tuple[int, int, int]] = None
+    ) -> pygame.Surface:
+        """
+        Get a layer, building it when missing or stale
+
+        Args:
+            name (Hashable): Layer name
+            size (Tuple[int, int]): Layer size in pixels
+            build (callable): Draws the layer onto the surface it is given
+            theme (Hashable, optional): Anything the look depends on besides the size
+            alpha (bool): Whether the layer needs per-pixel transparency
+            colorkey (tuple, optional): Transparent color for sparse overlays, which blit
+                much faster than full per-pixel alpha layers
+
+        Returns:
+            pygame.Surface: The pre-rendered layer
+        """
+        key = (tuple(size), theme)
+        cached = self._layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        if colorkey is not None:
+            surface.fill(colorkey)
+        build(surface)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        if colorkey is not None:
+            # Run-length encoding lets blits skip the transparent spans
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        self._layers[name] = (key, surface)
+        return surface
+
+    def invalidate(self, name: Optional[Hashable] = None):
+        """
+        Drop one layer, or all of them (e.g. after a theme change)
+
+        Args:
+            name (Hashable, optional): Layer to drop, None for every layer
+        """
+        if name is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(name, None)
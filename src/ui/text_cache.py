@@ -0,0 +1,113 @@
+import pygame
+from typing import Dict, Optional, Tuple
+from src.utils.surface_cache import SurfaceCache
+
+class TextCache:
+    """
+    Cache of rendered text surfaces keyed by font, string, color and antialias.
+
+    Menus and HUD elements redraw the same strings every frame; with the cache
+    each distinct string is rendered once and afterwards costs a single blit.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024):
+        """
+        Initialize the text cache
+
+        Args:
+            max_entries (int): Maximum number of cached text surfaces
+            max_bytes (int): Memory budget for cached text surfaces in bytes
+        """
+        self.surfaces = SurfaceCache(max_entries=max_entries, max_bytes=max_bytes, name='text')
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color,
+        antialias: bool = True
+    ) -> pygame.Surface:
+        """
+        Get the rendered surface for a string, rendering it on first use
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color: Text color (tuple or pygame.Color)
+            antialias (bool): Whether to antialias the text
+
+        Returns:
+            pygame.Surface: Rendered text (shared, do not draw on it)
+        """
+        color = tuple(color)
+        key = (font, text, color, antialias)
+        return self.surfaces.get(key, lambda: font.render(text, antialias, color))
+
+    def clear(self):
+        """Drop every cached text surface"""
+        self.surfaces.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Statistics of the underlying surface cache
+        """
+        return self.surfaces.get_stats()
+
+class DigitGlyphs:
+    """
+    Composes numeric counters from pre-rendered digit glyphs.
+
+    A counter that changes every frame (e.g. an animated score) only needs a
+    few glyph blits instead of a font.render call per frame.
+    """
+
+    GLYPHS = '0123456789-'
+
+    def __init__(self, font: pygame.font.Font, color, antialias: bool = True, cache: Optional[TextCache] = None):
+        """
+        Render the glyph set
+
+        Args:
+            font (pygame.font.Font): Font of the counter
+            color: Text color
+            antialias (bool): Whether to antialias the glyphs
+            cache (TextCache, optional): Cache to take the glyphs from, defaults to text_cache
+        """
+        cache = cache or text_cache
+        self.glyphs: Dict[str, pygame.Surface] = {
+            char: cache.render(font, char, color, antialias) for char in self.GLYPHS
+        }
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def measure(self, number_text: str) -> Tuple[int, int]:
+        """
+        Get the size of a composed number
+
+        Args:
+            number_text (str): Digits (and an optional minus sign)
+
+        Returns:
+            Tuple[int, int]: Width and height in pixels
+        """
+        return sum(self.glyphs[char].get_width() for char in number_text), self.height
+
+    def draw(self, surface: pygame.Surface, number_text: str, position: Tuple[int, int]):
+        """
+        Blit a number glyph by glyph
+
+        Args:
+            surface (pygame.Surface): Target surface
+            number_text (str): Digits (and an optional minus sign)
+            position (Tuple[int, int]): Top-left corner of the number
+        """
+        x, y = position
+        for char in number_text:
+            glyph = self.glyphs[char]
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+# Global text cache shared by the HUD and the menus
+text_cache = TextCache()
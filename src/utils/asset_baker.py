@@ -0,0 +1,176 @@
+import hashlib
+import io
+import os
+import struct
+import pygame
+from typing import Optional, Tuple
+from config.setting import current_settings
+from src.utils.debug_section import debug
+
+# Directory of the baked pixel buffers (safe to delete at any time)
+ASSET_CACHE_DIR = '.asset_cache'
+
+class AssetBaker:
+    """
+    Cache of decoded, pre-scaled images stored as raw pixel buffers.
+
+    The first load of an image decodes and scales it as usual and writes the
+    pixels to ASSET_CACHE_DIR, keyed by a hash of the source file, the
+    target size and the pixel format. Later launches read the buffer back
+    with pygame.image.frombuffer and skip decoding and scaling. Editing a
+    source file changes its hash, so stale buffers are never used.
+    """
+
+    MAGIC = b'CCB1'
+    HEADER = struct.Struct('<4sII')  # magic, width, height
+
+    def __init__(self, cache_dir: str = ASSET_CACHE_DIR):
+        """
+        Initialize the baker
+
+        Args:
+            cache_dir (str): Directory of the baked buffers
+        """
+        self.cache_dir = cache_dir
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+
+    def _buffer_path(self, digest: str, size: Optional[Tuple[int, int]], mode: str) -> str:
+        size_tag = f"{size[0]}x{size[1]}" if size else 'source'
+        return os.path.join(self.cache_dir, f"{digest}_{size_tag}_{mode}.raw")
+
+    def load(self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True) -> pygame.Surface:
+        """
+        Load an image, scaled to a size, from its baked buffer when possible
+
+        Safe to call from worker threads; the result is not display-converted.
+
+        Args:
+            path (str): Path to the source image
+            size (Tuple[int, int], optional): Size to scale the image to
+            alpha (bool): Keep per-pixel alpha (RGBA) instead of RGB
+
+        Returns:
+            pygame.Surface: Decoded and scaled image
+
+        Raises:
+            FileNotFoundError, pygame.error: If the source image cannot be read
+        """
+        if not current_settings.baked_asset_cache:
+            image = pygame.image.load(path)
+            return pygame.transform.scale(image, size) if size else image
+
+        with open(path, 'rb') as source_file:
+            source = source_file.read()
+        mode = 'RGBA' if alpha else 'RGB'
+        buffer_path = self._buffer_path(hashlib.sha1(source).hexdigest(), size, mode)
+
+        image = self._read_buffer(buffer_path, mode)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = pygame.image.load(io.BytesIO(source), os.path.basename(path))
+        if size:
+            image = pygame.transform.scale(image, size)
+        self._write_buffer(buffer_path, image, mode)
+        return image
+
+    def _read_buffer(self, buffer_path: str, mode: str) -> Optional[pygame.Surface]:
+        try:
+            with open(buffer_path, 'rb') as buffer_file:
+                data = buffer_file.read()
+        except OSError:
+            return None
+
+        if len(data) < self.HEADER.size:
+            return None
+        magic, width, height = self.HEADER.unpack_from(data)
+        pixels = memoryview(data)[self.HEADER.size:]
+        if magic != self.MAGIC or len(pixels) != width * height * len(mode):
+            debug.warning('resources', f"Ignoring damaged baked asset {buffer_path}")
+            return None
+
+        # The surface shares the buffer; copy so it owns its pixels
+        return pygame.image.frombuffer(pixels, (width, height), mode).copy()
+
+    def _write_buffer(self, buffer_path: str, image: pygame.Surface, mode: str):
+        temp_path = f"{buffer_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as buffer_file:
+                buffer_file.write(self.HEADER.pack(self.MAGIC, *image.get_size()))
+                buffer_file.write(pygame.image.tobytes(image, mode))
+            # Readers never see a half-written buffer
+            os.replace(temp_path, buffer_path)
+            debug.log('resources', f"Baked {buffer_path}")
+        except OSError as e:
+            self.write_errors += 1
+            debug.warning('resources', f"Could not write baked asset {buffer_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def clear(self) -> int:
+        """
+        Delete every baked buffer
+
+        Returns:
+            int: Number of files removed
+        """
+        removed = 0
+        if not os.path.isdir(self.cache_dir):
+            return removed
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.raw'):
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
+
+    def get_stats(self) -> dict:
+        """
+        Get baking statistics
+
+        Returns:
+            dict: Cache hits, misses (decoded and baked) and failed writes
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'write_errors': self.write_errors}
+
+# Global baked asset cache
+asset_baker = AssetBaker()
+
+def main():
+    """Bake the startup images ahead of time (e.g. after changing the assets)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bake CollectCat images into raw pixel buffers')
+    parser.add_argument('--clear', action='store_true', help='Delete existing baked buffers first')
+    args = parser.parse_args()
+
+    # Under `python -m` this module runs as __main__; use the instance the game imports
+    from src.utils.asset_baker import asset_baker
+    from src.utils.resource_manager import ResourceManager
+    from src.game.world import World
+
+    if args.clear:
+        print(f"Removed {asset_baker.clear()} baked buffers")
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((800, 600))
+
+    # Loading the startup assets once bakes everything that is missing
+    ResourceManager.get_instance().asset_loader.wait_all()
+    World(800, 600)
+
+    stats = asset_baker.get_stats()
+    print(f"Baked {stats['misses']} images, {stats['hits']} already up to date")
+
+if __name__ == '__main__':
+    main()
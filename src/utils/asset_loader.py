@@ -0,0 +1,201 @@
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from src.utils.debug_section import debug
+
+class _LoadTask:
+    __slots__ = ('kind', 'key', 'group', 'future', 'finalize')
+
+    def __init__(self, kind: str, key: Hashable, group: str, future: Future, finalize: Callable[[Any], None]):
+        self.kind = kind
+        self.key = key
+        self.group = group
+        self.future = future
+        self.finalize = finalize
+
+class AssetLoader:
+    """
+    Decodes asset files on worker threads.
+
+    Workers only read and decode files. Publishing the results (e.g.
+    converting images to the display format) runs on the main thread, either
+    in poll() or when an asset is requested before it was published.
+    Tasks are grouped (e.g. 'menu', 'game', 'audio') so a screen can start
+    as soon as its own group is ready.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Initialize the loader
+
+        Args:
+            max_workers (int): Worker threads, 0 decodes synchronously on submit
+        """
+        self.executor = None
+        if max_workers > 0:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='asset-loader')
+
+        self.pending: Dict[Tuple[str, Hashable], _LoadTask] = {}
+        self.group_totals = defaultdict(int)
+        self.group_done = defaultdict(int)
+        self.group_ready_seconds: Dict[str, float] = {}
+        self.failed = 0
+        self.start_time = time.perf_counter()
+
+    def submit(
+        self,
+        kind: str,
+        key: Hashable,
+        decode: Callable[[], Any],
+        finalize: Callable[[Any], None],
+        group: str = 'game'
+    ):
+        """
+        Queue an asset
+
+        Args:
+            kind (str): Asset kind ('image', 'animation', 'sound', ...)
+            key (Hashable): Asset key within its kind
+            decode (callable): Reads and decodes the file on a worker thread
+            finalize (callable): Publishes the decoded data on the main thread
+            group (str): Loading group the asset belongs to
+        """
+        # A newer request for the same asset replaces the pending one
+        self.wait_for(kind, key)
+
+        if self.executor is not None:
+            future = self.executor.submit(decode)
+        else:
+            future = Future()
+            try:
+                future.set_result(decode())
+            except Exception as e:
+                future.set_exception(e)
+
+        self.pending[(kind, key)] = _LoadTask(kind, key, group, future, finalize)
+        self.group_totals[group] += 1
+
+    def _finish(self, task: _LoadTask):
+        del self.pending[(task.kind, task.key)]
+        try:
+            task.finalize(task.future.result())
+        except Exception as e:
+            self.failed += 1
+            debug.log('resources', f"Failed to load {task.kind} {task.key}: {e}")
+
+        self.group_done[task.group] += 1
+        if self.group_done[task.group] == self.group_totals[task.group]:
+            self.group_ready_seconds[task.group] = time.perf_counter() - self.start_time
+            debug.log('resources', f"Asset group '{task.group}' ready after {self.group_ready_seconds[task.group]:.3f}s")
+
+    def is_pending(self, kind: str, key: Hashable) -> bool:
+        """
+        Check whether an asset is queued but not yet published
+
+        Args:
+            kind (str): Asset kind
+            key (Hashable): Asset key
+
+        Returns:
+            bool: True while the asset is loading
+        """
+        return (kind, key) in self.pending
+
+    def wait_for(self, kind: str, key: Hashable):
+        """
+        Block until an asset is published (no-op if it is not pending)
+
+        Args:
+            kind (str): Asset kind
+            key (Hashable): Asset key
+        """
+        task = self.pending.get((kind, key))
+        if task is not None:
+            self._finish(task)
+
+    def poll(self, max_tasks: Optional[int] = None) -> int:
+        """
+        Publish assets whose decoding has finished, without blocking
+
+        Args:
+            max_tasks (int, optional): Limit of assets to publish in this call
+
+        Returns:
+            int: Number of assets published
+        """
+        finished = [task for task in self.pending.values() if task.future.done()]
+        if max_tasks is not None:
+            finished = finished[:max_tasks]
+        for task in finished:
+            self._finish(task)
+        return len(finished)
+
+    def wait_group(self, group: str):
+        """
+        Block until every asset of a group is published
+
+        Args:
+            group (str): Loading group
+        """
+        for task in [task for task in self.pending.values() if task.group == group]:
+            self._finish(task)
+
+    def wait_all(self):
+        """Block until every queued asset is published"""
+        for task in list(self.pending.values()):
+            self._finish(task)
+
+    def is_done(self, group: Optional[str] = None) -> bool:
+        """
+        Check whether a group (or everything) is published
+
+        Args:
+            group (str, optional): Loading group, None for all groups
+
+        Returns:
+            bool: True when nothing of the group is pending
+        """
+        if group is None:
+            return not self.pending
+        return self.group_done[group] >= self.group_totals[group]
+
+    def get_progress(self, group: Optional[str] = None) -> float:
+        """
+        Get the share of decoded assets, counting finished worker jobs
+
+        Args:
+            group (str, optional): Loading group, None for all groups
+
+        Returns:
+            float: Progress from 0.0 to 1.0
+        """
+        groups = [group] if group is not None else list(self.group_totals)
+        total = sum(self.group_totals[name] for name in groups)
+        if not total:
+            return 1.0
+        decoding = sum(
+            1 for task in self.pending.values()
+            if task.group in groups and not task.future.done()
+        )
+        return (total - decoding) / total
+
+    def get_stats(self) -> dict:
+        """
+        Get loading statistics
+
+        Returns:
+            dict: Queued, pending and failed counts and group ready times in seconds
+        """
+        return {
+            'queued': sum(self.group_totals.values()),
+            'pending': len(self.pending),
+            'failed': self.failed,
+            'ready_seconds': dict(self.group_ready_seconds)
+        }
+
+    def shutdown(self):
+        """Publish everything still queued and stop the worker threads"""
+        self.wait_all()
+        if self.executor is not None:
+            self.executor.shutdown()
@@ -12,6 +12,7 @@ class Colors:
     YELLOW = (255, 255, 0)
     PURPLE = (128, 0, 128)
     LIGHTGRAY = (211, 211, 211)
+    MAGENTA = (255, 0, 255)  # Transparent color key of pre-rendered overlays
     @classmethod
     def get(cls, color_name):
         """
@@ -1,26 +1,106 @@
+import atexit
 import datetime
+import time
 import traceback
 import sys
 import os
 import logging
-from typing import Optional, Dict, Union
+from typing import Any, Callable, Optional, Dict, Union
+from src.utils.log_writer import (
+    AsyncLogWriter,
+    BatchRotatingFileHandler,
+    LogRingBuffer,
+    RingBufferHandler,
+    write_crash_dump
+)
+
+# Production runs (python -O or COLLECTCAT_PRODUCTION=1) turn section logging into no-ops
+PRODUCTION_MODE = (not __debug__) or os.environ.get('COLLECTCAT_PRODUCTION', '0') == '1'
+
+def _noop(*args, **kwargs):
+    """Stand-in for disabled logging calls"""
+    return None
+
+class SectionLogger:
+    """
+    Cheap handle for one debug section.
+    
+    ``enabled`` is a cached flag call sites can test before building a message,
+    and ``log``/``warning`` are bound to no-ops while the section is disabled.
+    """
+    __slots__ = ('name', 'enabled', 'log', 'warning', '_owner')
+
+    def __init__(self, owner: 'DebugLogger', name: str):
+        self._owner = owner
+        self.name = name
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the section state from the owning logger"""
+        self.enabled = self._owner.is_debug_mode(self.name)
+        if self.enabled:
+            self.log = self._log
+            self.warning = self._warning
+        else:
+            self.log = _noop
+            self.warning = _noop
+
+    def _log(self, message: Union[str, Callable[[], str]], *args: Any):
+        self._owner._emit(logging.INFO, self.name, message, args)
+
+    def _warning(self, message: Union[str, Callable[[], str]], *args: Any):
+        self._owner._emit(logging.WARNING, self.name, message, args)
 
 class DebugLogger:
     """
     Advanced debugging and logging utility with granular control
     """
     
+    # Logger currently owning the root logging handlers
+    _active_instance = None
+
     def __init__(self, 
                  enabled: bool = True, 
-                 log_level: int = logging.DEBUG):
+                 log_level: int = logging.DEBUG,
+                 production: bool = PRODUCTION_MODE,
+                 log_file: Optional[str] = 'logs/game_debug.log',
+                 max_log_bytes: int = 1024 * 1024,
+                 log_backup_count: int = 3,
+                 buffer_size: int = 10000,
+                 async_logging: bool = True,
+                 crash_dump_seconds: float = 10.0):
         """
         Initialize the debug logger with configurable settings
         
         Args:
             enabled (bool): Global debug mode toggle
             log_level (int): Logging level from logging module
+            production (bool): Compile section logging down to no-ops
+            log_file (str, optional): Rotating log file, None for console only
+            max_log_bytes (int): Size at which the log file is rotated
+            log_backup_count (int): Number of rotated log files to keep
+            buffer_size (int): Capacity of the in-memory record ring buffer
+            async_logging (bool): Write records from a background thread
+            crash_dump_seconds (float): Window of recent records dumped on a crash
         """
-        self.enabled = enabled
+        self._enabled = enabled
+        self.production = production
+        
+        # Log output configuration
+        self.log_file = log_file
+        self.max_log_bytes = max_log_bytes
+        self.log_backup_count = log_backup_count
+        self.buffer_size = buffer_size
+        self.async_logging = async_logging
+        self.crash_dump_seconds = crash_dump_seconds
+        self._handlers = []
+        self._console_handler = None
+        self._queue_handler = None
+        self._writer = None
+        
+        # Cached section handles and the set of sections that currently log
+        self._section_loggers: Dict[str, SectionLogger] = {}
+        self._active_sections = frozenset()
         
         # Configurable debug sections with more flexibility
         self.sections: Dict[str, bool] = {
@@ -32,25 +112,226 @@ class DebugLogger:
             'collision': True,
             'settings': True,
             'performance': False,
-            'resources': True
+            'resources': True,
+            'input': False
         }
         
+        self._refresh_sections()
+        
         # Configure logging
         self._configure_logging(log_level)
+        
+        # In production mode disabled calls cost a single no-op call
+        if self.production:
+            self.log = _noop
+            self.warning = _noop
+            self.debug_print = _noop
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+        self._refresh_sections()
+
+    def _refresh_sections(self):
+        """Rebuild cached section flags after a configuration change"""
+        if self._enabled and not self.production:
+            self._active_sections = frozenset(
+                name for name, is_on in self.sections.items() if is_on
+            )
+        else:
+            self._active_sections = frozenset()
+        
+        for section_logger in self._section_loggers.values():
+            section_logger.refresh()
+
+    def section(self, name: str) -> SectionLogger:
+        """
+        Get a cached handle for a debug section
+        
+        Args:
+            name (str): Debug section
+        
+        Returns:
+            SectionLogger: Handle whose ``enabled`` flag tracks the section state
+        """
+        section_logger = self._section_loggers.get(name)
+        if section_logger is None:
+            section_logger = SectionLogger(self, name)
+            self._section_loggers[name] = section_logger
+        return section_logger
+
+    def is_enabled(self, section: str) -> bool:
+        """
+        Fast check whether a section currently logs
+        
+        Args:
+            section (str): Debug section
+        
+        Returns:
+            bool: True if messages for the section are emitted
+        """
+        return section in self._active_sections
+
+    @staticmethod
+    def _format(message: Union[str, Callable[[], str]], args: tuple) -> str:
+        """
+        Build the final message text, deferring all work until it is needed
+        
+        Args:
+            message (str or callable): Message, format string or message factory
+            args (tuple): Arguments for %-style formatting
+        
+        Returns:
+            str: Formatted message
+        """
+        if callable(message):
+            return message()
+        if args:
+            return message % args
+        return message
+
+    def _emit(self, level: int, section: str, message: Union[str, Callable[[], str]], args: tuple = ()):
+        logging.log(level, f"[{section.upper()}] {self._format(message, args)}")
     
     def _configure_logging(self, log_level: int):
         """
-        Configure logging with console handler only
+        Configure console and rotating file output.
+        
+        With async logging, callers only push records into a ring buffer and
+        a background thread writes them in batches.
         
         Args:
             log_level (int): Logging level
         """
-        # Configure logging to output to console only
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s [%(levelname)s] %(message)s',
+        # Only one logger owns the root handlers at a time
+        if DebugLogger._active_instance is not None:
+            DebugLogger._active_instance.shutdown()
+        DebugLogger._active_instance = self
+        
+        self.formatter = logging.Formatter(
+            '%(asctime)s [%(levelname)s] %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        
+        self._console_handler = logging.StreamHandler()
+        self._handlers = [self._console_handler]
+        if self.log_file:
+            try:
+                # The file and its directory are only created once a record is written
+                self._handlers.append(BatchRotatingFileHandler(
+                    self.log_file,
+                    maxBytes=self.max_log_bytes,
+                    backupCount=self.log_backup_count,
+                    encoding='utf-8',
+                    delay=True
+                ))
+            except OSError as e:
+                print(f"Warning: Could not open log file {self.log_file}: {e}")
+        
+        for handler in self._handlers:
+            handler.setFormatter(self.formatter)
+        
+        root_logger = logging.getLogger()
+        root_logger.setLevel(log_level)
+        
+        if self.async_logging:
+            log_buffer = LogRingBuffer(self.buffer_size)
+            self._writer = AsyncLogWriter(log_buffer, self._handlers)
+            # Importing a game module must not spawn a thread: the writer starts with the first record
+            self._queue_handler = RingBufferHandler(log_buffer, on_first_record=self._start_writer)
+            root_logger.addHandler(self._queue_handler)
+        else:
+            for handler in self._handlers:
+                root_logger.addHandler(handler)
+
+    def _start_writer(self):
+        """Start the writer thread and have pending records written at exit"""
+        if self._writer is not None and not self._writer.is_alive():
+            self._writer.start()
+            atexit.register(self.shutdown)
+
+    def flush(self):
+        """Block until buffered records have been written"""
+        if self._writer is not None and self._writer.is_alive():
+            deadline = time.time() + 2.0
+            while self._writer.buffer.unfinished and time.time() < deadline:
+                time.sleep(0.01)
+        for handler in self._handlers:
+            handler.flush()
+
+    def shutdown(self):
+        """Detach handlers, write remaining records and stop the writer thread"""
+        root_logger = logging.getLogger()
+        if self._queue_handler is not None:
+            root_logger.removeHandler(self._queue_handler)
+        for handler in self._handlers:
+            root_logger.removeHandler(handler)
+        
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = []
+        self._console_handler = None
+        
+        if DebugLogger._active_instance is self:
+            DebugLogger._active_instance = None
+
+    def set_console_output(self, enabled: bool):
+        """
+        Echo log records to the console or write them to the log file only
+        
+        Args:
+            enabled (bool): Whether records are printed to the console
+        """
+        if self._console_handler is not None:
+            self._console_handler.setLevel(logging.NOTSET if enabled else logging.CRITICAL + 1)
+
+    def get_log_stats(self) -> dict:
+        """
+        Get statistics of the asynchronous log pipeline
+        
+        Returns:
+            dict: Buffered and dropped record counts
+        """
+        if self._writer is None:
+            return {'buffered': 0, 'dropped': 0}
+        return {
+            'buffered': len(self._writer.buffer),
+            'dropped': self._writer.buffer.dropped
+        }
+
+    def dump_recent_logs(self, seconds: Optional[float] = None, path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the records of the last few seconds to a crash dump file
+        
+        Args:
+            seconds (float, optional): Time window, defaults to crash_dump_seconds
+            path (str, optional): Output file, defaults to logs/crash_<timestamp>.log
+        
+        Returns:
+            str or None: Path of the dump, or None if no history is kept
+        """
+        if self._queue_handler is None:
+            return None
+        
+        seconds = self.crash_dump_seconds if seconds is None else seconds
+        if path is None:
+            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join('logs', f'crash_{timestamp}.log')
+        
+        try:
+            records = self._queue_handler.recent_records(seconds, time.time())
+            return write_crash_dump(records, self.formatter, path)
+        except OSError as e:
+            print(f"Warning: Could not write crash dump {path}: {e}")
+            return None
 
     def debug_print(self, message: str):
         """
@@ -62,16 +343,20 @@ class DebugLogger:
         if self.enabled:
             logging.debug(message)
 
-    def log(self, section: str, message: str):
+    def log(self, section: str, message: Union[str, Callable[[], str]], *args: Any):
         """
-        Log message for a specific section
+        Log message for a specific section.
+        
+        Formatting is deferred: pass %-style arguments or a callable
+        returning the message, and nothing is built while the section is off.
         
         Args:
             section (str): Debug section
-            message (str): Log message
+            message (str or callable): Log message, format string or message factory
+            *args: Arguments for %-style formatting
         """
-        if self.enabled and self.sections.get(section, False):
-            logging.info(f"[{section.upper()}] {message}")
+        if section in self._active_sections:
+            self._emit(logging.INFO, section, message, args)
 
     def error(self, 
               section: str, 
@@ -95,16 +380,17 @@ class DebugLogger:
             elif isinstance(exc_info, Exception):
                 logging.error(traceback.format_exc())
 
-    def warning(self, section: str, message: str):
+    def warning(self, section: str, message: Union[str, Callable[[], str]], *args: Any):
         """
         Log a warning message for a specific section
         
         Args:
             section (str): Debug section
-            message (str): Warning message
+            message (str or callable): Warning message, format string or message factory
+            *args: Arguments for %-style formatting
         """
-        if self.enabled and self.sections.get(section, False):
-            logging.warning(f"[{section.upper()}] {message}")
+        if section in self._active_sections:
+            self._emit(logging.WARNING, section, message, args)
 
     def error_print(self, message: str):
         """
@@ -127,7 +413,7 @@ class DebugLogger:
         """
         if section is None:
             return self.enabled
-        return self.enabled and self.sections.get(section, False)
+        return self.enabled and not self.production and self.sections.get(section, False)
 
     def set_section_debug(self, section: str, enabled: bool):
         """
@@ -139,6 +425,7 @@ class DebugLogger:
         """
         if section in self.sections:
             self.sections[section] = enabled
+            self._refresh_sections()
         else:
             logging.warning(f"Section {section} not found in debug sections")
 
@@ -156,9 +443,16 @@ def global_exception_handler(exctype, value, tb):
     """
     debug.error(
         'global', 
-        f"Uncaught exception: {exctype.__name__}: {value}", 
-        exc_info=True
+        f"Uncaught exception: {exctype.__name__}: {value}\n"
+        f"{''.join(traceback.format_exception(exctype, value, tb))}"
     )
+    
+    # Dump the last seconds of logging next to the regular log
+    dump_path = debug.dump_recent_logs()
+    if dump_path:
+        print(f"Recent log records written to {dump_path}", file=sys.stderr)
+    debug.flush()
+    
     # Call the default exception handler
     sys.__excepthook__(exctype, value, tb)
 
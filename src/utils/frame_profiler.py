@@ -0,0 +1,174 @@
+import time
+from bisect import bisect_right
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from src.utils.debug_section import debug
+
+performance_log = debug.section('performance')
+
+# Upper bounds (ms) of the frame-time histogram buckets; the last bucket is open-ended
+HISTOGRAM_BOUNDS_MS = (4.0, 8.0, 12.0, 16.7, 20.0, 25.0, 33.3, 50.0)
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list
+
+    Args:
+        sorted_values (List[float]): Values in ascending order
+        fraction (float): Percentile as a fraction (e.g. 0.95)
+
+    Returns:
+        float: The percentile, 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class FrameProfiler:
+    """
+    Per-frame phase timer with rolling percentiles and frame-time histograms.
+
+    The game loop calls begin_frame() at the top of a frame, mark(phase)
+    after each phase (the time since the previous mark is charged to that
+    phase) and end_frame() at the bottom. A phase marked several times in
+    a frame, e.g. once per simulation step, is charged the sum. The last
+    `window` samples of every phase are kept for p50/p95/p99; the histogram
+    counts every frame of the session.
+    """
+
+    def __init__(self, window: int = 600, idle_phase: str = 'frame_limit'):
+        """
+        Initialize the profiler
+
+        Args:
+            window (int): Number of recent frames used for percentiles
+            idle_phase (str): Phase spent waiting for the frame limiter, excluded from work time
+        """
+        self.window = window
+        self.idle_phase = idle_phase
+
+        self.samples: Dict[str, Deque[int]] = {}  # phase -> recent durations in ns
+        self.frame_samples: Deque[int] = deque(maxlen=window)
+        self.work_samples: Deque[int] = deque(maxlen=window)
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+        self.frames = 0
+        self.discarded_frames = 0
+        self._frame_start: Optional[int] = None
+        self._last_mark = 0
+        self._idle_ns = 0
+        self._frame_phases: Dict[str, int] = {}  # phase -> time charged in the current frame
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        self._frame_start = self._last_mark = time.perf_counter_ns()
+        self._idle_ns = 0
+        self._frame_phases.clear()
+
+    def mark(self, phase: str):
+        """
+        Charge the time since the previous mark to a phase
+
+        Args:
+            phase (str): Phase that just finished
+        """
+        if self._frame_start is None:
+            return
+        now = time.perf_counter_ns()
+        elapsed = now - self._last_mark
+        self._last_mark = now
+
+        self._frame_phases[phase] = self._frame_phases.get(phase, 0) + elapsed
+        if phase == self.idle_phase:
+            self._idle_ns += elapsed
+
+    def discard_frame(self):
+        """Drop the current frame from the frame-time stats (e.g. it waited in the pause menu)"""
+        if self._frame_start is not None:
+            self._frame_start = None
+            self.discarded_frames += 1
+
+    def end_frame(self):
+        """Finish the frame and record its total and work time"""
+        if self._frame_start is None:
+            return
+        frame_ns = time.perf_counter_ns() - self._frame_start
+        self._frame_start = None
+
+        for phase, elapsed in self._frame_phases.items():
+            phase_samples = self.samples.get(phase)
+            if phase_samples is None:
+                phase_samples = self.samples[phase] = deque(maxlen=self.window)
+            phase_samples.append(elapsed)
+
+        self.frames += 1
+        self.frame_samples.append(frame_ns)
+        self.work_samples.append(frame_ns - self._idle_ns)
+        self.histogram[bisect_right(HISTOGRAM_BOUNDS_MS, frame_ns / 1e6)] += 1
+
+    @staticmethod
+    def _summarize(samples) -> dict:
+        values = sorted(samples)
+        to_ms = 1e-6
+        return {
+            'mean_ms': sum(values) / len(values) * to_ms if values else 0.0,
+            'p50_ms': percentile(values, 0.50) * to_ms,
+            'p95_ms': percentile(values, 0.95) * to_ms,
+            'p99_ms': percentile(values, 0.99) * to_ms,
+            'max_ms': values[-1] * to_ms if values else 0.0
+        }
+
+    def get_histogram(self) -> Dict[str, int]:
+        """
+        Get the frame-time histogram of the session
+
+        Returns:
+            Dict[str, int]: Bucket label (e.g. '<16.7ms') to frame count
+        """
+        labels = [f"<{bound:g}ms" for bound in HISTOGRAM_BOUNDS_MS]
+        labels.append(f">={HISTOGRAM_BOUNDS_MS[-1]:g}ms")
+        return dict(zip(labels, self.histogram))
+
+    def get_stats(self) -> dict:
+        """
+        Get rolling percentiles of the frame, the work time and every phase
+
+        Returns:
+            dict: Frame counts, 'frame' and 'work' summaries, per-phase summaries and the histogram
+        """
+        return {
+            'frames': self.frames,
+            'discarded_frames': self.discarded_frames,
+            'frame': self._summarize(self.frame_samples),
+            'work': self._summarize(self.work_samples),
+            'phases': {phase: self._summarize(samples) for phase, samples in self.samples.items()},
+            'histogram': self.get_histogram()
+        }
+
+    def report(self):
+        """Write a summary of the recent frames to the performance log"""
+        if __debug__ and performance_log.enabled and self.frames:
+            stats = self.get_stats()
+            performance_log.log(
+                "Frames: %d, frame p50/p95/p99 %.2f/%.2f/%.2f ms, work p50/p95/p99 %.2f/%.2f/%.2f ms",
+                stats['frames'],
+                stats['frame']['p50_ms'], stats['frame']['p95_ms'], stats['frame']['p99_ms'],
+                stats['work']['p50_ms'], stats['work']['p95_ms'], stats['work']['p99_ms']
+            )
+            for phase, summary in stats['phases'].items():
+                performance_log.log(
+                    "  %-16s p50 %.3f ms, p95 %.3f ms, p99 %.3f ms",
+                    phase, summary['p50_ms'], summary['p95_ms'], summary['p99_ms']
+                )
+            performance_log.log("Frame-time histogram: %s", stats['histogram'])
+
+    def reset(self):
+        """Drop every sample (e.g. when a new level starts)"""
+        self.samples.clear()
+        self.frame_samples.clear()
+        self.work_samples.clear()
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.frames = 0
+        self.discarded_frames = 0
+        self._frame_start = None
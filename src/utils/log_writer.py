@@ -0,0 +1,262 @@
+import os
+import threading
+import logging
+import logging.handlers
+from collections import deque
+from typing import Callable, List, Optional
+
+class LogRingBuffer:
+    """
+    Bounded, thread-safe buffer of log records.
+
+    When the writer falls behind the oldest records are overwritten instead of
+    blocking the render thread.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize the ring buffer
+
+        Args:
+            capacity (int): Maximum number of records waiting to be written
+        """
+        self._records = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self.dropped = 0
+        self.unfinished = 0  # Records buffered or being written
+
+    def put_nowait(self, record: logging.LogRecord):
+        """
+        Add a record without blocking (QueueHandler interface)
+
+        Args:
+            record (logging.LogRecord): Record to buffer
+        """
+        with self._condition:
+            if len(self._records) == self._records.maxlen:
+                self.dropped += 1
+            else:
+                self.unfinished += 1
+            self._records.append(record)
+            self._condition.notify()
+
+    def get_batch(self, max_records: int, timeout: float) -> List[logging.LogRecord]:
+        """
+        Take up to max_records records, waiting up to timeout for the first one
+
+        Args:
+            max_records (int): Maximum batch size
+            timeout (float): Seconds to wait when the buffer is empty
+
+        Returns:
+            List[logging.LogRecord]: Records in arrival order (may be empty)
+        """
+        with self._condition:
+            if not self._records:
+                self._condition.wait(timeout)
+            count = min(max_records, len(self._records))
+            return [self._records.popleft() for _ in range(count)]
+
+    def task_done(self, count: int):
+        """
+        Report records taken with get_batch as written
+
+        Args:
+            count (int): Number of records written
+        """
+        with self._condition:
+            self.unfinished -= count
+
+    def wake(self):
+        """Wake up a waiting writer"""
+        with self._condition:
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+class RingBufferHandler(logging.handlers.QueueHandler):
+    """
+    Handler that only enqueues records and remembers recent ones for crash dumps.
+
+    Formatting happens on the writer thread, not on the caller's thread.
+    """
+
+    def __init__(self,
+                 buffer: LogRingBuffer,
+                 history_size: int = 5000,
+                 on_first_record: Optional[Callable[[], None]] = None):
+        """
+        Initialize the handler
+
+        Args:
+            buffer (LogRingBuffer): Buffer drained by the writer thread
+            history_size (int): Number of recent records kept for crash dumps
+            on_first_record (callable, optional): Called once, before the first record is buffered
+        """
+        super().__init__(buffer)
+        self.history = deque(maxlen=history_size)
+        self._on_first_record = on_first_record
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Keep the record as-is; the writer formats it later
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        # Runs under the handler lock, so the callback fires exactly once
+        if self._on_first_record is not None:
+            on_first_record, self._on_first_record = self._on_first_record, None
+            on_first_record()
+        self.history.append(record)
+        self.queue.put_nowait(record)
+
+    def recent_records(self, seconds: float, now: float) -> List[logging.LogRecord]:
+        """
+        Get the records logged during the last few seconds
+
+        Args:
+            seconds (float): Size of the time window
+            now (float): Current time as returned by time.time()
+
+        Returns:
+            List[logging.LogRecord]: Records inside the window, oldest first
+        """
+        cutoff = now - seconds
+        return [record for record in list(self.history) if record.created >= cutoff]
+
+class BatchRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes a whole batch with one write and flush.
+
+    maxBytes is compared with the encoded size of the batch, so the limit is
+    in bytes even for non-ASCII log text. The log directory is created when
+    the file is first opened.
+    """
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+    def emit_batch(self, records: List[logging.LogRecord]):
+        """
+        Write several records at once, rotating the file when it grows too large
+
+        Args:
+            records (List[logging.LogRecord]): Records to write
+        """
+        if not records:
+            return
+
+        try:
+            text = ''.join(self.format(record) + self.terminator for record in records)
+        except Exception:
+            for record in records:
+                self.handleError(record)
+            return
+
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() > 0:
+                size = len(text.encode(self.stream.encoding or 'utf-8', errors='replace'))
+                if self.stream.tell() + size >= self.maxBytes:
+                    self.doRollover()
+                    # With delay=True the rollover leaves the new file unopened
+                    if self.stream is None:
+                        self.stream = self._open()
+            self.stream.write(text)
+            self.stream.flush()
+        except Exception:
+            # Disk full, file locked during rollover...: the batch is lost, the writer keeps going
+            self.handleError(records[0])
+        finally:
+            self.release()
+
+class AsyncLogWriter(threading.Thread):
+    """Background thread that drains a LogRingBuffer into handlers in batches"""
+
+    def __init__(self,
+                 buffer: LogRingBuffer,
+                 handlers: List[logging.Handler],
+                 batch_size: int = 256,
+                 flush_interval: float = 0.5):
+        """
+        Initialize the writer thread
+
+        Args:
+            buffer (LogRingBuffer): Buffer to drain
+            handlers (List[logging.Handler]): Output handlers
+            batch_size (int): Maximum records written per batch
+            flush_interval (float): Maximum seconds between wake-ups
+        """
+        super().__init__(name='AsyncLogWriter', daemon=True)
+        self.buffer = buffer
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set() or len(self.buffer):
+            batch = self.buffer.get_batch(self.batch_size, self.flush_interval)
+            if batch:
+                self.write_batch(batch)
+                self.buffer.task_done(len(batch))
+
+    def write_batch(self, batch: List[logging.LogRecord]):
+        """
+        Pass a batch of records to every handler
+
+        Args:
+            batch (List[logging.LogRecord]): Records to write
+        """
+        for handler in self.handlers:
+            # A failing handler must not end the thread, or every later record would be lost
+            try:
+                if isinstance(handler, BatchRotatingFileHandler):
+                    handler.emit_batch([record for record in batch if record.levelno >= handler.level])
+                else:
+                    for record in batch:
+                        if record.levelno >= handler.level:
+                            handler.handle(record)
+            except Exception:
+                handler.handleError(batch[0])
+
+    def stop(self, timeout: Optional[float] = 2.0):
+        """
+        Write everything still buffered, then stop the thread
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish
+        """
+        self._stop_event.set()
+        self.buffer.wake()
+        if self.is_alive():
+            self.join(timeout)
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # The stream is already closed (e.g. stdout at interpreter exit)
+                pass
+
+def write_crash_dump(records: List[logging.LogRecord], formatter: logging.Formatter, path: str) -> str:
+    """
+    Synchronously write records to a crash dump file
+
+    Args:
+        records (List[logging.LogRecord]): Records to write
+        formatter (logging.Formatter): Formatter for the records
+        path (str): Output file path
+
+    Returns:
+        str: Path of the written file
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as dump_file:
+        for record in records:
+            dump_file.write(formatter.format(record) + '\n')
+    return path
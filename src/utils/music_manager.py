@@ -0,0 +1,153 @@
+import os
+import pygame
+from typing import Dict, Optional
+from config.setting import current_settings
+from src.utils.debug_section import debug
+
+# Posted by pygame.mixer.music when a track stops (e.g. after a fade-out)
+MUSIC_END_EVENT = pygame.event.custom_type()
+
+class MusicManager:
+    """
+    Streams background tracks through pygame.mixer.music.
+
+    Only one track is decoded at a time, in small chunks while it plays,
+    instead of holding every level track in memory as a fully decoded
+    pygame.mixer.Sound. Switching tracks fades the current one out and the
+    next one in.
+    """
+
+    TRACKS = {
+        'background-menu': 'assets/sounds/background/background-menu.mp3',
+        'level_1': 'assets/sounds/background/level_1.mp3',
+        'level_2': 'assets/sounds/background/level_2.mp3',
+        'level_3': 'assets/sounds/background/level_3.mp3'
+    }
+
+    def __init__(self, tracks: Optional[Dict[str, str]] = None):
+        """
+        Initialize the music manager
+
+        Args:
+            tracks (dict, optional): Track name to file path, defaults to TRACKS
+        """
+        self.tracks = dict(tracks or self.TRACKS)
+        self.current_track: Optional[str] = None
+        self.pending_track: Optional[str] = None
+        self.paused = False
+
+    def _mixer_ready(self) -> bool:
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init()
+            return True
+        except pygame.error as e:
+            debug.warning('audio', f"Mixer unavailable, music disabled: {e}")
+            return False
+
+    def play(self, track: str, fade_ms: Optional[int] = None):
+        """
+        Switch to a track, fading out the one that is playing
+
+        Args:
+            track (str): Track name
+            fade_ms (int, optional): Fade duration, defaults to the music_crossfade_ms setting
+        """
+        if track == self.current_track and self.pending_track is None:
+            # Already playing (a paused track is continued)
+            self.resume()
+            return
+        if not self._mixer_ready():
+            return
+
+        fade_ms = current_settings.music_crossfade_ms if fade_ms is None else fade_ms
+        if self.current_track is not None and pygame.mixer.music.get_busy() and fade_ms > 0:
+            # The next track starts once the fade-out ends (MUSIC_END_EVENT or update)
+            self.pending_track = track
+            pygame.mixer.music.fadeout(fade_ms)
+            debug.log('audio', f"Fading out {self.current_track} for {track}")
+            return
+
+        self._start(track, fade_ms)
+
+    def _start(self, track: str, fade_ms: int):
+        self.pending_track = None
+        self.paused = False
+        path = self.tracks.get(track)
+        if path is None or not os.path.exists(path):
+            debug.warning('audio', f"Music track not found: {track} ({path})")
+            self.current_track = None
+            return
+
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(current_settings.bg_music_volume / 100)
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+            pygame.mixer.music.play(-1, fade_ms=fade_ms)  # -1 means loop indefinitely
+            self.current_track = track
+            debug.log('audio', f"Streaming music track {track}")
+        except pygame.error as e:
+            debug.error('audio', f"Failed to play music track {track}: {e}")
+            self.current_track = None
+
+    def update(self):
+        """Start a pending track if the fade-out already ended (cheap, call once per frame)"""
+        if self.pending_track is not None and not self.paused and not pygame.mixer.music.get_busy():
+            self._start(self.pending_track, current_settings.music_crossfade_ms)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Handle a music event taken from the event queue
+
+        Args:
+            event (pygame.event.Event): Event to check
+
+        Returns:
+            bool: True if the event belonged to the music manager
+        """
+        if event.type != MUSIC_END_EVENT:
+            return False
+        self.update()
+        return True
+
+    def pause(self):
+        """Pause the current track (e.g. while the pause menu is open)"""
+        if self.current_track is not None and pygame.mixer.get_init():
+            pygame.mixer.music.pause()
+            self.paused = True
+
+    def resume(self):
+        """Continue a paused track"""
+        if self.paused and pygame.mixer.get_init():
+            pygame.mixer.music.unpause()
+            self.paused = False
+
+    def stop(self, fade_ms: int = 0):
+        """
+        Stop the music
+
+        Args:
+            fade_ms (int): Fade-out duration
+        """
+        self.pending_track = None
+        self.current_track = None
+        self.paused = False
+        if pygame.mixer.get_init():
+            if fade_ms > 0:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+
+    def set_volume(self, volume: float):
+        """
+        Set the music volume
+
+        Args:
+            volume (float): Volume from 0.0 to 1.0
+        """
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(volume)
+
+# Global music manager
+music_manager = MusicManager()
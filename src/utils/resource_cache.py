@@ -0,0 +1,212 @@
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable
+import pygame
+from src.utils.debug_section import debug
+from src.utils.surface_cache import SurfaceCache
+
+def frames_bytes(frames: Iterable[pygame.Surface]) -> int:
+    """
+    Estimate the pixel memory held by animation frames
+
+    Args:
+        frames (Iterable[pygame.Surface]): Frames to measure
+
+    Returns:
+        int: Total size of the pixel buffers in bytes
+    """
+    return sum(SurfaceCache.surface_bytes(frame) for frame in frames)
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """
+    Estimate the sample memory held by a decoded sound
+
+    Args:
+        sound (pygame.mixer.Sound): Sound to measure
+
+    Returns:
+        int: Size of the sample buffer in bytes
+    """
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        return len(sound.get_raw())
+    frequency, sample_format, channels = mixer_format
+    return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+
+class ResourceCache:
+    """
+    Dict-like LRU cache of loaded assets with a memory budget.
+
+    Every entry is measured when it is stored. Once the category is over its
+    budget, the least recently used entries are evicted, except pinned ones
+    (assets the current screen needs). The ResourceManager reloads an
+    evicted asset from its source the next time it is requested.
+    """
+
+    def __init__(self, category: str, max_bytes: int, measure: Callable[[Any], int]):
+        """
+        Initialize the cache
+
+        Args:
+            category (str): Category name used in stats and log messages
+            max_bytes (int): Memory budget of the category in bytes
+            measure (callable): Returns the memory held by an asset in bytes
+        """
+        self.category = category
+        self.max_bytes = max_bytes
+        self.measure = measure
+
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._pins: Dict[Hashable, int] = defaultdict(int)
+        self.current_bytes = 0
+        # Keys dropped by the budget, so the owner can tell evicted assets from unknown ones
+        self.evicted_keys = set()
+
+        # Statistics
+        self.peak_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __setitem__(self, key: Hashable, value: Any):
+        if key in self._entries:
+            self._remove(key)
+
+        size = self.measure(value)
+        self.evicted_keys.discard(key)
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.current_bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+        self._evict(keep=key)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieve an asset and mark it as recently used
+
+        Args:
+            key (Hashable): Asset key
+            default: Returned when the asset is not cached
+
+        Returns:
+            The cached asset, or default
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove an asset from the cache
+
+        Args:
+            key (Hashable): Asset key
+            default: Returned when the asset is not cached
+
+        Returns:
+            The removed asset, or default
+        """
+        value = self._entries.get(key, default)
+        self._remove(key)
+        return value
+
+    def _remove(self, key: Hashable):
+        self._entries.pop(key, None)
+        self.current_bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self, keep: Hashable = None):
+        if self.current_bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            if self.current_bytes <= self.max_bytes:
+                break
+            if key == keep or self._pins.get(key):
+                continue
+            self._remove(key)
+            self.evicted_keys.add(key)
+            self.evictions += 1
+            debug.log('resources', f"[{self.category}] Evicted {key} (budget {self.max_bytes} bytes)")
+
+    def pin(self, key: Hashable):
+        """
+        Protect an asset from eviction (reference counted, may precede loading)
+
+        Args:
+            key (Hashable): Asset key
+        """
+        self._pins[key] += 1
+
+    def unpin(self, key: Hashable):
+        """
+        Release one pin of an asset, making it evictable once no pins are left
+
+        Args:
+            key (Hashable): Asset key
+        """
+        if self._pins.get(key, 0) <= 1:
+            self._pins.pop(key, None)
+            # Assets kept only by the pin may now push the category over budget
+            self._evict()
+        else:
+            self._pins[key] -= 1
+
+    def is_pinned(self, key: Hashable) -> bool:
+        """
+        Check whether an asset is protected from eviction
+
+        Args:
+            key (Hashable): Asset key
+
+        Returns:
+            bool: True while at least one pin is held
+        """
+        return self._pins.get(key, 0) > 0
+
+    def keys(self):
+        """Keys of the cached assets, least recently used first"""
+        return self._entries.keys()
+
+    def values(self):
+        """Cached assets, least recently used first"""
+        return self._entries.values()
+
+    def items(self):
+        """(key, asset) pairs, least recently used first"""
+        return self._entries.items()
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """
+        Get memory and usage statistics of the category
+
+        Returns:
+            dict: Entry count, memory use, budget, pins and hit/miss/eviction counters
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'peak_bytes': self.peak_bytes,
+            'max_bytes': self.max_bytes,
+            'pinned': sum(1 for key in self._entries if self._pins.get(key)),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -1,6 +1,14 @@
 import os
 import pygame
+from config.setting import current_settings
+from src.utils.asset_baker import asset_baker
+from src.utils.asset_loader import AssetLoader
 from src.utils.debug_section import debug
+from src.utils.resource_cache import ResourceCache, frames_bytes, sound_bytes
+from src.utils.surface_cache import SurfaceCache
+
+# Font face used by the menus and screens
+MENU_FONT_PATH = 'assets/font/River Adventurer.ttf'
 
 class ResourceManager:
     _instance = None
@@ -25,10 +33,20 @@ class ResourceManager:
         if hasattr(self, '_initialized') and self._initialized:
             return
         
-        # Initialize resources dictionaries
-        self.images = {}
-        self.sounds = {}
-        self.fonts = {}
+        # Loaded assets, LRU-evicted per category once over the memory budget
+        budgets = current_settings.resource_budgets_mb
+        self.images = ResourceCache('images', budgets['images'] * 1024 * 1024, SurfaceCache.surface_bytes)
+        self.animations = ResourceCache('animations', budgets['animations'] * 1024 * 1024, frames_bytes)
+        self.sounds = ResourceCache('sounds', budgets['sounds'] * 1024 * 1024, sound_bytes)
+        self.fonts = {}  # (path, size) -> pygame.font.Font
+        
+        # Load arguments of every asset, used to reload evicted ones
+        self.asset_sources = {'image': {}, 'animation': {}, 'sound': {}}
+        self.reloads = 0
+        
+        # Assets pinned for the current screen
+        self.pinned_screen = None
+        self.screen_pins = []
         
         # Default screen dimensions
         self.screen_width = 800  # Default width
@@ -37,7 +55,9 @@ class ResourceManager:
         # Base path for resources
         self.base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
         
-        # Load resources
+        # Load resources (decoded on worker threads, published on first use or poll)
+        workers = current_settings.asset_loader_workers if current_settings.background_asset_loading else 0
+        self.asset_loader = AssetLoader(workers)
         self.load_resources()
         
         self._initialized = True
@@ -52,18 +72,34 @@ class ResourceManager:
     
     def reload_background(self):
         """Reload background image with current screen dimensions"""
+        # Let a queued load publish first so it cannot overwrite the reloaded image
+        self.asset_loader.wait_for('image', 'main_background')
         try:
             background_path = 'assets/Image/Background/background-image.png'
             if os.path.exists(background_path):
-                background_image = pygame.image.load(background_path).convert_alpha()
-                background_image = pygame.transform.scale(background_image, (self.screen_width, self.screen_height))
-                self.images['main_background'] = background_image
+                background_image = asset_baker.load(background_path, (self.screen_width, self.screen_height))
+                self.images['main_background'] = self._convert_image(background_image)
                 debug.log('resources', "Background image reloaded with new dimensions")
         except Exception as e:
             debug.log('resources', f"Failed to reload background: {e}")
 
     def load_resources(self):
-        """Load all game resources."""
+        """
+        Queue all game resources.
+        
+        Assets are grouped by the first screen that needs them: 'menu' assets
+        come first so the main menu can appear before gameplay images and
+        sounds are decoded.
+        """
+        menu_image_resources = {
+            'main_background': {
+                'path': 'assets/Image/Background/background-image.png', 
+                'size': (self.screen_width, self.screen_height)
+            }
+        }
+        for key, resource in menu_image_resources.items():
+            self.load_image(key, resource['path'], resource.get('size'), group='menu')
+
         image_resources = {
             'character_idle': {
                 'path': 'assets/Image/Character/Idle/knightt.png', 
@@ -73,10 +109,6 @@ class ResourceManager:
                 'path': 'assets/Image/Character/running/running1.png', 
                 'size': (80, 80)
             },
-            'main_background': {
-                'path': 'assets/Image/Background/background-image.png', 
-                'size': (self.screen_width, self.screen_height)
-            },
             'blue_item': {
                 'path': 'assets/Image/items/good_thing.jpg', 
                 'size': (30, 30),
@@ -95,6 +127,16 @@ class ResourceManager:
         }
         for key, resource in image_resources.items():
          self.load_image(key, resource['path'], resource.get('size'))
+
+        # Multi-frame animations; keys without an entry fall back to their single image
+        animation_resources = {
+            'character_run': [
+                'assets/Image/Character/running/running1.png',
+                'assets/Image/Character/running/running2.png'
+            ]
+        }
+        for key, paths in animation_resources.items():
+            self.load_animation(key, paths)
         
         sound_resources = {
             'collect_good_item': 'assets/sounds/effect/good_thing.mp3',  # Positive sound
@@ -102,15 +144,15 @@ class ResourceManager:
             'win_sound' : 'assets/sounds/effect/winsound.mp3',
             'lost_sound' : 'assets/sounds/effect/losing.mp3',
             'applause' : 'assets/sounds/effect/applause.mp3',
-            'failing' : 'assets/sounds/effect/losing-extra-sound.mp3',
-            'level_1': 'assets/sounds/background/level_1.mp3',
-            'level_2': 'assets/sounds/background/level_2.mp3',
-            'level_3': 'assets/sounds/background/level_3.mp3',
-            'background-menu': 'assets/sounds/background/background_menu.mp3'
+            'failing' : 'assets/sounds/effect/losing-extra-sound.mp3'
         }
         self.music_volume = 0.5  # Default volume
+        # Only short effects are decoded; music is streamed by the MusicManager
         self.load_sounds(sound_resources)
 
+        if not current_settings.background_asset_loading:
+            self.asset_loader.wait_all()
+
        
 
     def load_images(self, image_resources):
@@ -142,11 +184,25 @@ class ResourceManager:
             debug.log('character', f"Image loading error: {e}")
             # Use fallback methods or default images
 
-    def load_image(self, key, path, size=None, fallback_color=None):
+    def load_image(self, key, path, size=None, fallback_color=None, group='game'):
+        """
+        Queue an image for decoding, or store a fallback surface if the file is missing
+        
+        Args:
+            key (str): Unique identifier for the image
+            path (str): Path to the image file
+            size (tuple, optional): Size to scale the image to
+            fallback_color (tuple, optional): Color of the fallback surface
+            group (str): Loading group of the image
+        
+        Returns:
+            bool: True if the image file exists and was queued
+        """
         debug.log('resources', f"Attempting to load image: {key} from {path}")
         
         # Ensure key is always a string
         key = str(key)
+        self.asset_sources['image'][key] = (path, size, fallback_color, group)
         
         if not os.path.exists(path):
             debug.log('resources', f"File not found: {path}")
@@ -158,20 +214,85 @@ class ResourceManager:
                 self.images[key] = fallback_surface
             return False
         
-        try:
-            image = pygame.image.load(path).convert_alpha()
-            if size:
-                image = pygame.transform.scale(image, size)
-            
+        def decode():
+            # Decoded and scaled once, then read back from the baked cache
+            return asset_baker.load(path, size)
+
+        def publish(image):
             # Store only with string key
-            self.images[key] = image
-            
+            self.images[key] = self._convert_image(image)
             debug.log('resources', f"Successfully loaded image: {key}")
-            return True
-        except Exception as e:
-            debug.log('resources', f"Failed to load image {key}: {e}")
+
+        self.asset_loader.submit('image', key, decode, publish, group)
+        return True
+
+    @staticmethod
+    def _convert_image(image):
+        # Display-format conversion needs the display, so it runs on the main thread
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha()
+
+
+    def load_animation(self, key, paths, group='game'):
+        """
+        Queue the frames of an animation in order, skipping missing files
+        
+        Args:
+            key (str): Unique identifier for the animation
+            paths (list): Frame image paths in playback order
+            group (str): Loading group of the animation
+        
+        Returns:
+            bool: True if at least one frame file exists and was queued
+        """
+        key = str(key)
+        self.asset_sources['animation'][key] = (paths, group)
+        frame_paths = []
+        for path in paths:
+            if not os.path.exists(path):
+                debug.log('resources', f"Animation frame not found: {path}")
+                continue
+            frame_paths.append(path)
+        
+        if not frame_paths:
             return False
 
+        def decode():
+            frames = []
+            for path in frame_paths:
+                try:
+                    frames.append(asset_baker.load(path))
+                except Exception as e:
+                    debug.log('resources', f"Failed to load animation frame {path}: {e}")
+            return frames
+
+        def publish(frames):
+            if not frames:
+                return
+            self.animations[key] = [self._convert_image(frame) for frame in frames]
+            debug.log('resources', f"Loaded animation {key} with {len(frames)} frames")
+
+        self.asset_loader.submit('animation', key, decode, publish, group)
+        return True
+
+    def get_animation_frames(self, key):
+        """
+        Retrieve the frames of an animation
+        
+        Args:
+            key (str): Key of the animation
+        
+        Returns:
+            list: Animation frames, or the single image stored under the same key
+        
+        Raises:
+            KeyError: If neither an animation nor an image is found
+        """
+        frames = self._get_asset('animation', self.animations, str(key))
+        if frames:
+            return frames
+        return [self.get_image(key)]
 
     def get_image(self, key):
         """
@@ -189,14 +310,62 @@ class ResourceManager:
         # Ensure key is a string
         key = str(key)
         
-        # Direct key lookup
-        image = self.images.get(key)
+        # Direct key lookup (waiting for the image if it is still decoding)
+        image = self._get_asset('image', self.images, key)
         if image is not None:
             return image
         
         # If not found, raise a clear error
         raise KeyError(f"Image with key '{key}' not found in resources")
 
+    def load_font(self, path, size):
+        """
+        Load a font face, falling back to the default pygame font
+        
+        Args:
+            path (str or None): Path to a font file, None for the default font
+            size (int): Font size
+        
+        Returns:
+            pygame.font.Font: The loaded font (or the fallback)
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        
+        font = None
+        if path is not None:
+            if os.path.exists(path):
+                try:
+                    font = pygame.font.Font(path, size)
+                except Exception as e:
+                    debug.warning('resources', f"Failed to load font {path}: {e}")
+            else:
+                debug.warning('resources', f"Font file not found: {path}")
+        
+        if font is None:
+            font = pygame.font.Font(None, size)
+        
+        # Register under the requested key so a fallback is resolved only once
+        self.fonts[(path, size)] = font
+        debug.log('resources', f"Loaded font {path or 'default'} at size {size}")
+        return font
+
+    def get_font(self, path=None, size=36):
+        """
+        Retrieve a font by file and size, loading it on first use
+        
+        Args:
+            path (str, optional): Path to a font file, None for the default font
+            size (int): Font size
+        
+        Returns:
+            pygame.font.Font: The requested font
+        """
+        font = self.fonts.get((path, size))
+        if font is None:
+            font = self.load_font(path, size)
+        return font
+
     def get_sound(self, key):
         """
         Retrieve a sound by key.
@@ -207,29 +376,101 @@ class ResourceManager:
         Returns:
             pygame.mixer.Sound or None: The requested sound
         """
-        return self.sounds.get(key)
+        return self._get_asset('sound', self.sounds, key)
 
-    def load_sounds(self, sound_resources):
+    def _get_asset(self, kind, cache, key):
+        """
+        Look up an asset, waiting for a pending load or reloading an evicted one
+        
+        Args:
+            kind (str): Asset kind ('image', 'animation' or 'sound')
+            cache (ResourceCache): Cache of the kind
+            key (str): Asset key
+        
+        Returns:
+            The asset, or None if it was never loaded
+        """
+        self.asset_loader.wait_for(kind, key)
+        asset = cache.get(key)
+        if asset is None and key in cache.evicted_keys:
+            self.reloads += 1
+            debug.log('resources', f"Reloading evicted {kind} {key}")
+            source = self.asset_sources[kind][key]
+            if kind == 'image':
+                self.load_image(key, *source)
+            elif kind == 'animation':
+                self.load_animation(key, *source)
+            else:
+                self.load_sound(key, *source)
+            self.asset_loader.wait_for(kind, key)
+            asset = cache.get(key)
+        return asset
+
+    def pin_screen_assets(self, screen, images=(), animations=(), sounds=()):
+        """
+        Protect the assets a screen uses from eviction, releasing the previous screen's pins
+        
+        Args:
+            screen (str): Screen name, for logging
+            images (Iterable[str]): Image keys used by the screen
+            animations (Iterable[str]): Animation keys used by the screen
+            sounds (Iterable[str]): Sound keys used by the screen
+        """
+        pins = (
+            [(self.images, key) for key in images] +
+            [(self.animations, key) for key in animations] +
+            [(self.sounds, key) for key in sounds]
+        )
+        # Pin first so assets shared with the previous screen are never evictable
+        for cache, key in pins:
+            cache.pin(key)
+        for cache, key in self.screen_pins:
+            cache.unpin(key)
+        
+        self.screen_pins = pins
+        self.pinned_screen = screen
+        debug.log('resources', f"Pinned {len(pins)} assets for screen {screen}")
+
+    def get_cache_stats(self):
+        """
+        Get memory statistics of the asset caches for profiling
+        
+        Returns:
+            dict: Per-category cache stats plus reload count and pinned screen
+        """
+        return {
+            'images': self.images.get_stats(),
+            'animations': self.animations.get_stats(),
+            'sounds': self.sounds.get_stats(),
+            'reloads': self.reloads,
+            'pinned_screen': self.pinned_screen
+        }
+
+    def load_sounds(self, sound_resources, group='game'):
         """
         Load multiple sound files with error handling
         
         Args:
             sound_resources (dict): Dictionary of sound resources to load
+            group (str): Loading group of the sounds
         """
         for key, path in sound_resources.items():
-            self.load_sound(key, path)
+            self.load_sound(key, path, group)
 
-    def load_sound(self, key, path):
+    def load_sound(self, key, path, group='game'):
         """
-        Load a single sound file with comprehensive error handling
+        Queue a single sound file with comprehensive error handling
         
         Args:
             key (str): Unique identifier for the sound
             path (str): Path to the sound file
+            group (str): Loading group of the sound
         
         Returns:
-            bool: True if sound loaded successfully, False otherwise
+            bool: True if the sound file exists and was queued, False otherwise
         """
+        self.asset_sources['sound'][key] = (path, group)
+        
         # Ensure pygame mixer is initialized
         if not pygame.mixer.get_init():
             pygame.mixer.init()
@@ -238,19 +479,14 @@ class ResourceManager:
             debug.warning('resources', f"Sound file not found: {path}")
             return False
         
-        try:
-            # Load sound with volume control
-            sound = pygame.mixer.Sound(path)
-            
+        def publish(sound):
             # Store the sound
             self.sounds[key] = sound
-            
             debug.log('resources', f"Successfully loaded sound: {key}")
-            return True
-        
-        except Exception as e:
-            debug.warning('resources', f"Failed to load sound {key}: {e}")
-            return False
+
+        # Decoding (the slow part for long tracks) runs on a worker thread
+        self.asset_loader.submit('sound', key, lambda: pygame.mixer.Sound(path), publish, group)
+        return True
 
     def play_sound(self, sound_key, volume=0.5):
         """
@@ -262,7 +498,7 @@ class ResourceManager:
         """
         try:
             # Retrieve the sound
-            sound = self.sounds.get(sound_key)
+            sound = self.get_sound(sound_key)
             
             if sound is None:
                 debug.warning('resources', f"Sound not found: {sound_key}")
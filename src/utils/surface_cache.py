@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+import pygame
+from src.utils.debug_section import debug
+
+class SurfaceCache:
+    """
+    Keyed LRU cache for pre-rendered surfaces with an entry limit and a memory budget
+    """
+
+    def __init__(self, max_entries: int = 8, max_bytes: int = 32 * 1024 * 1024, name: str = 'surfaces'):
+        """
+        Initialize the surface cache
+
+        Args:
+            max_entries (int): Maximum number of cached surfaces
+            max_bytes (int): Memory budget for all cached surfaces in bytes
+            name (str): Cache name used in log messages
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.name = name
+
+        self._entries: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.current_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """
+        Estimate the pixel memory held by a surface
+
+        Args:
+            surface (pygame.Surface): Surface to measure
+
+        Returns:
+            int: Size of the pixel buffer in bytes
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key: Hashable, factory: Optional[Callable[[], pygame.Surface]] = None) -> Optional[pygame.Surface]:
+        """
+        Retrieve a surface, building it with factory on a miss
+
+        Args:
+            key (Hashable): Cache key
+            factory (callable, optional): Builds the surface when it is not cached
+
+        Returns:
+            pygame.Surface or None: Cached or freshly built surface
+        """
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if factory is None:
+            return None
+
+        surface = factory()
+        self.put(key, surface)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface):
+        """
+        Store a surface and evict least recently used entries over budget
+
+        Args:
+            key (Hashable): Cache key
+            surface (pygame.Surface): Surface to store
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        size = self.surface_bytes(surface)
+        self._entries[key] = surface
+        self._sizes[key] = size
+        self.current_bytes += size
+
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+            debug.log('resources', f"[{self.name}] Evicted {oldest_key}")
+
+    def _remove(self, key: Hashable):
+        self._entries.pop(key, None)
+        self.current_bytes -= self._sizes.pop(key, 0)
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._entries.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Entry count, memory use and hit/miss counters
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
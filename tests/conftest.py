@@ -0,0 +1,86 @@
+# tests/conftest.py
+import os
+import sys
+import random
+import logging
+
+# Headless: no window and no audio device; must be set before pygame initializes
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+# Asset paths are relative to the project root
+os.chdir(ROOT)
+
+import pygame
+import pytest
+
+# The game package must be imported before its submodules (they import each other)
+import src.game
+from config.setting import current_settings
+from src.character.character import Character
+from src.character.character_controller import CharacterController
+from src.items import Item, ItemSpawner, ItemType
+from src.system.lane_system import LaneManager
+from src.utils.resource_cache import ResourceCache
+
+@pytest.fixture(scope='session', autouse=True)
+def display():
+    """Initialized pygame with a dummy display, as converting images needs one"""
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    yield screen
+    pygame.quit()
+
+@pytest.fixture
+def make_surface():
+    """Factory for blank surfaces with per-pixel alpha"""
+    def make(width: int = 10, height: int = 10) -> pygame.Surface:
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+    return make
+
+@pytest.fixture
+def make_item():
+    """Factory for items of a type in a lane, taken from pool when one is given"""
+    def make(lane: int = 0, item_type: dict = ItemType.GOOD_GREEN, pool=None, rng=None) -> Item:
+        build = pool.acquire if pool is not None else Item
+        return build(
+            lane=lane,
+            color=item_type['color'],
+            is_good=item_type['is_good'],
+            size=item_type['size'],
+            fall_speed=5,
+            level=1,
+            rng=rng or random.Random(1)
+        )
+    return make
+
+@pytest.fixture
+def make_spawner():
+    """Factory for seeded spawners on a 900x600 screen with three lanes"""
+    def make(level: int = 1, seed: int = 5) -> ItemSpawner:
+        return ItemSpawner(900, 600, num_lanes=3, current_level=level, rng=random.Random(seed))
+    return make
+
+@pytest.fixture
+def controller():
+    """Character controller with a 50x50 character in the middle of three lanes"""
+    lane_manager = LaneManager(800, num_lanes=3)
+    character = Character(x=lane_manager.get_lane_center(1, 50), y=500, width=50, height=50)
+    return CharacterController(character, lane_manager, current_settings)
+
+@pytest.fixture
+def make_resource_cache():
+    """Factory for resource caches that measure assets by their length"""
+    def make(max_bytes: int = 30) -> ResourceCache:
+        return ResourceCache('test', max_bytes, measure=len)
+    return make
+
+@pytest.fixture
+def make_record():
+    """Factory for INFO log records"""
+    def make(message: str) -> logging.LogRecord:
+        return logging.LogRecord('test', logging.INFO, __file__, 0, message, None, None)
+    return make
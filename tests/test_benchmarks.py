@@ -0,0 +1,45 @@
+# tests/test_benchmarks.py
+import argparse
+import pytest
+from benchmarks.__main__ import parse_threshold
+from benchmarks.harness import compare_results, threshold_for
+
+def results(**medians) -> dict:
+    return {'results': {name: {'median_us': median} for name, median in medians.items()}}
+
+def test_parse_threshold_splits_at_the_last_equals_sign():
+    assert parse_threshold('game.loop[level=2]*=0.25') == ('game.loop[level=2]*', 0.25)
+    for text in ('0.25', '=0.25', 'game.*=fast'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_threshold(text)
+
+def test_threshold_for_uses_the_last_matching_override():
+    overrides = [parse_threshold(text) for text in ('game.*=0.2', '*=0.3', 'game.*=0.4')]
+    assert threshold_for('game.loop', 0.15, overrides) == 0.4
+    assert threshold_for('collision.check', 0.15, overrides) == 0.3
+    assert threshold_for('collision.check', 0.15, []) == 0.15
+
+def test_compare_results_statuses():
+    current = results(slower=12.0, faster=8.0, steady=10.5, added=1.0)
+    baseline = results(slower=10.0, faster=10.0, steady=10.0, removed=3.0)
+    comparison = {entry['name']: entry for entry in compare_results(current, baseline, max_regression=0.15)}
+
+    assert {name: entry['status'] for name, entry in comparison.items()} == {
+        'slower': 'regression', 'faster': 'improvement', 'steady': 'ok', 'added': 'new', 'removed': 'missing'
+    }
+    assert comparison['slower']['change'] == pytest.approx(0.2)
+    assert comparison['added']['baseline_us'] is None and comparison['removed']['current_us'] is None
+
+def test_compare_results_applies_overrides_per_case():
+    comparison = compare_results(
+        results(loop=12.0, check=12.0), results(loop=10.0, check=10.0),
+        max_regression=0.15, overrides=[('loop', 0.25)]
+    )
+    assert [(entry['name'], entry['status'], entry['threshold']) for entry in comparison] == [
+        ('loop', 'ok', 0.25), ('check', 'regression', 0.15)
+    ]
+
+def test_compare_results_zero_baseline_is_not_an_unchanged_case():
+    comparison = compare_results(results(timed=5.0, idle=0.0), results(timed=0.0, idle=0.0))
+    assert comparison[0]['change'] == float('inf') and comparison[0]['status'] == 'regression'
+    assert comparison[1]['change'] == 0.0 and comparison[1]['status'] == 'ok'
@@ -1 +1,47 @@
-print('hello world')
\ No newline at end of file
+# tests/test_character.py
+import pygame
+from src.system.input_system import InputFrame
+
+def test_lane_switch_plays_run_animation_until_it_ends(controller):
+    character = controller.character
+    assert character.current_animation is character.idle_images
+
+    controller.handle_input(InputFrame([pygame.K_LEFT]))
+    assert controller.is_lane_switch_in_progress
+    assert character.current_animation is character.running_images
+
+    for _ in range(60):
+        controller.update(1 / 60)
+    assert not controller.is_lane_switch_in_progress
+    assert character.current_animation is character.idle_images
+    assert character.x == controller.lane_manager.get_lane_center(0, character.width)
+
+def test_animate_cycles_frames_at_animation_speed(controller):
+    character = controller.character
+    character.set_animation_state(True)
+    frames = len(character.current_animation)
+
+    for _ in range(character.animation_speed * frames):
+        character.animate()
+    assert character.current_frame == 0
+
+    for _ in range(character.animation_speed):
+        character.animate()
+    assert character.current_frame == 1 % frames
+
+def test_frames_are_scaled_to_the_character_size(controller):
+    character = controller.character
+    for frame in character.idle_images + character.running_images:
+        assert frame.get_size() == (character.width, character.height)
+
+def test_every_press_switches_one_lane_within_bounds(controller):
+    lane_manager = controller.lane_manager
+
+    controller.handle_input(InputFrame([pygame.K_RIGHT, pygame.K_LEFT, pygame.K_LEFT]))
+    assert lane_manager.current_lane == 0
+
+    controller.handle_input(InputFrame([pygame.K_LEFT]))
+    assert lane_manager.current_lane == 0
+
+    controller.handle_input(InputFrame([pygame.K_RIGHT, pygame.K_RIGHT, pygame.K_RIGHT]))
+    assert lane_manager.current_lane == lane_manager.num_lanes - 1
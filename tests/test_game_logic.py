@@ -0,0 +1,286 @@
+# tests/test_game_logic.py
+import random
+import pygame
+import pytest
+from src.game.dirty_renderer import DirtyRectRenderer
+from src.game.fixed_timestep import FixedTimestep
+from src.game.replay import REPLAY_FORMAT_VERSION, Replay, ReplayRecorder
+from src.game.simulation import HeadlessSimulation
+from src.game.world import World
+from src.items import ItemType
+from src.system.collision import LaneItemIndex
+from src.system.input_system import InputFrame, InputSystem
+from src.utils.debug_section import debug
+from src.utils.frame_profiler import FrameProfiler
+
+@pytest.mark.parametrize('fps', [30, 60, 144])
+def test_fixed_timestep_runs_the_same_steps_at_any_frame_rate(fps):
+    timestep = FixedTimestep(step_dt=1 / 60, max_steps=5)
+    steps = sum(timestep.advance(1 / fps) for _ in range(fps * 2))
+    assert steps == 120
+    assert timestep.total_steps == 120
+
+def test_fixed_timestep_keeps_the_remainder_as_alpha():
+    timestep = FixedTimestep(step_dt=0.02)
+    assert timestep.advance(0.05) == 2
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.01) == 1
+    assert timestep.alpha == pytest.approx(0.0)
+
+def test_fixed_timestep_drops_steps_beyond_max_steps():
+    timestep = FixedTimestep(step_dt=0.01, max_steps=3)
+    assert timestep.advance(0.105) == 3
+    assert timestep.dropped_steps == 7
+    assert timestep.alpha == pytest.approx(0.5)
+
+def test_fixed_timestep_reset_and_negative_frames():
+    timestep = FixedTimestep(step_dt=0.02)
+    timestep.advance(0.03)
+    timestep.reset()
+    assert timestep.alpha == 0.0
+    assert timestep.advance(-1.0) == 0
+
+def test_profiler_charges_repeated_phases_once_per_frame():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    for _ in range(3):
+        profiler.mark('update')
+        profiler.mark('collisions')
+    profiler.end_frame()
+
+    stats = profiler.get_stats()
+    assert stats['frames'] == 1
+    assert set(stats['phases']) == {'update', 'collisions'}
+    assert len(profiler.samples['update']) == 1
+
+def test_profiler_discarded_frame_records_no_phases():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    profiler.mark('events')
+    profiler.discard_frame()
+    profiler.end_frame()
+    assert profiler.frames == 0
+    assert profiler.samples == {}
+
+def key_event(event_type, key):
+    return pygame.event.Event(event_type, key=key)
+
+def test_input_tap_within_one_frame_is_buffered_until_the_next_step():
+    clock = [1000]
+    input_system = InputSystem(time_source=lambda: clock[0])
+    input_system.process_events([
+        key_event(pygame.KEYDOWN, pygame.K_LEFT), key_event(pygame.KEYUP, pygame.K_LEFT),
+        key_event(pygame.KEYDOWN, pygame.K_LEFT), key_event(pygame.KEYUP, pygame.K_LEFT),
+        key_event(pygame.KEYDOWN, pygame.K_SPACE)
+    ])
+
+    clock[0] = 1016
+    assert input_system.take_frame().pressed == (pygame.K_LEFT, pygame.K_LEFT)
+    assert input_system.last_latency_ms == 16
+    assert input_system.take_frame().pressed == ()
+
+def test_input_buffer_drops_the_oldest_actions_when_full():
+    input_system = InputSystem(buffer_size=2, time_source=lambda: 0)
+    keys = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_LEFT]
+    input_system.process_events([key_event(pygame.KEYDOWN, key) for key in keys])
+    assert input_system.dropped_actions == 1
+    assert input_system.take_frame().pressed == (pygame.K_RIGHT, pygame.K_LEFT)
+
+def test_input_subscribers_consume_events():
+    input_system = InputSystem(time_source=lambda: 0)
+    seen = []
+
+    def consume_f3(event):
+        seen.append(event.key)
+        return event.key == pygame.K_F3
+
+    input_system.subscribe(pygame.KEYDOWN, consume_f3)
+    events = [key_event(pygame.KEYDOWN, pygame.K_F3), key_event(pygame.KEYDOWN, pygame.K_ESCAPE)]
+    unhandled = input_system.process_events(events)
+    assert [event.key for event in unhandled] == [pygame.K_ESCAPE]
+    assert seen == [pygame.K_F3, pygame.K_ESCAPE]
+
+    input_system.unsubscribe(pygame.KEYDOWN, consume_f3)
+    assert len(input_system.process_events(events)) == 2
+
+def test_input_clear_forgets_buffered_presses():
+    input_system = InputSystem(time_source=lambda: 0)
+    input_system.process_events([key_event(pygame.KEYDOWN, pygame.K_RIGHT)])
+    input_system.clear()
+    assert input_system.take_frame().pressed == ()
+
+def test_input_debug_section_can_be_enabled():
+    assert 'input' in debug.sections
+
+def scatter_items(make_item, count: int, lane_positions, seed: int = 3):
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        lane = rng.randrange(len(lane_positions))
+        item = make_item(lane, rng.choice(ItemType.all_types()), rng=rng)
+        item.x = lane_positions[lane]
+        item.y = rng.uniform(-50, 650)
+        items.append(item)
+    return items
+
+def test_lane_index_candidates_include_every_overlapping_item(make_item):
+    lane_positions = [133, 400, 666]
+    index = LaneItemIndex(lane_positions)
+    items = scatter_items(make_item, 300, lane_positions)
+    index.add_many(items)
+
+    found = 0
+    # Rects on each lane, between two lanes and at fractional positions
+    for x in (110.5, 250.25, 375, 640.75):
+        rect = pygame.Rect(x, 500, 50, 50)
+        candidates = index.candidates(rect)
+        overlapping = [item for item in items if rect.colliderect(pygame.Rect(item.x, item.y, item.size, item.size))]
+        found += len(overlapping)
+        assert all(any(item is candidate for candidate in candidates) for item in overlapping)
+        # The broad phase only searches the nearby y-window
+        assert len(candidates) < len(items) / 4
+    assert found
+
+def test_lane_index_remove_and_refresh_after_items_move(make_item):
+    lane_positions = [133, 400, 666]
+    index = LaneItemIndex(lane_positions)
+    items = scatter_items(make_item, 30, lane_positions)
+    index.add_many(items)
+
+    for item in items:
+        item.y = 600 - item.y
+    index.refresh()
+    for bucket in index.buckets:
+        assert [item.y for item in bucket] == sorted(item.y for item in bucket)
+
+    assert index.remove(items[0])
+    assert not index.remove(items[0])
+    assert len(index) == 29
+    index.clear()
+    assert len(index) == 0 and index.max_item_size == 0
+
+def test_replay_round_trip_keeps_presses_per_step(tmp_path):
+    recorder = ReplayRecorder(seed=42, level=2, step_dt=1 / 60)
+    recorder.record_step(InputFrame())
+    recorder.record_step(InputFrame([pygame.K_LEFT, pygame.K_LEFT, pygame.K_SPACE]))
+    recorder.record_step(InputFrame())
+    recorder.record_step(InputFrame([pygame.K_RIGHT]))
+    recorder.finish('win', 1000)
+
+    replay = Replay.load(recorder.save(str(tmp_path)))
+    assert (replay.seed, replay.level, replay.step_dt, replay.step_count) == (42, 2, 1 / 60, 4)
+    assert (replay.outcome, replay.final_score) == ('win', 1000)
+    assert [replay.input_for_step(step).pressed for step in range(5)] == [
+        (), (pygame.K_LEFT, pygame.K_LEFT), (), (pygame.K_RIGHT,), ()
+    ]
+
+def test_replay_rejects_other_format_versions():
+    data = ReplayRecorder(seed=1, level=1).to_dict()
+    data['version'] = REPLAY_FORMAT_VERSION - 1
+    with pytest.raises(ValueError):
+        Replay(data)
+
+def test_replayed_session_matches_the_recorded_one():
+    from src.game.game import Game
+
+    game = Game()
+    game.setup_level(2, seed=99)
+    rng = random.Random(3)
+    outcome = None
+    for step in range(900):
+        if rng.random() < 0.1:
+            key = rng.choice([pygame.K_LEFT, pygame.K_RIGHT])
+            game.input_system.process_events([
+                pygame.event.Event(pygame.KEYDOWN, key=key), pygame.event.Event(pygame.KEYUP, key=key)
+            ])
+        step_input = game.input_system.take_frame()
+        game.replay_recorder.record_step(step_input)
+        outcome = game.step_simulation(1 / 60, step_input)
+        if outcome:
+            break
+    recorder = game.replay_recorder
+    recorder.finish(outcome, game.score_ui.total_score)
+
+    replay = Replay(recorder.to_dict())
+    simulation = HeadlessSimulation.from_replay(replay)
+    stats = simulation.run(frames=replay.step_count)
+    assert stats['score'] == recorder.final_score
+    assert stats['last_outcome'] == recorder.outcome
+    assert simulation.game.lane_manager.current_lane == game.lane_manager.current_lane
+
+def test_level_setup_returns_items_to_the_kept_pool():
+    from src.game.game import Game
+
+    game = Game()
+    game.setup_level(1, seed=5)
+    pool, store = game.item_pool, game.item_store
+    while len(game.items) < 2:
+        game.step_simulation(1 / 60, InputFrame())
+    on_screen = len(game.items)
+
+    game.setup_level(2, seed=6)
+    assert game.item_pool is pool and game.item_store is store
+    assert game.items == [] and len(game.item_index) == 0
+    assert pool.get_stats()['idle'] == on_screen
+    if store is not None:
+        assert len(store) == 0
+
+    while not game.items:
+        game.step_simulation(1 / 60, InputFrame())
+    assert pool.get_stats()['reused'] == len(game.items)
+
+BLUE = (0, 0, 255, 255)
+RED = (255, 0, 0, 255)
+
+@pytest.fixture
+def presented(monkeypatch):
+    """Records what the renderer pushes to the display instead of presenting it"""
+    calls = []
+    monkeypatch.setattr(pygame.display, 'flip', lambda: calls.append('flip'))
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: calls.append(list(rects)))
+    return calls
+
+def render_frame(renderer, key, sprite_rect):
+    def draw_sprites(screen):
+        return [screen.fill(RED, sprite_rect)]
+    renderer.render(key, lambda background: background.fill(BLUE), draw_sprites)
+
+def test_dirty_renderer_restores_previous_rects_and_updates_new_ones(presented):
+    screen = pygame.Surface((100, 100))
+    renderer = DirtyRectRenderer(screen)
+    render_frame(renderer, 'scene', pygame.Rect(10, 10, 10, 10))
+    render_frame(renderer, 'scene', pygame.Rect(50, 50, 10, 10))
+
+    assert presented == ['flip', [pygame.Rect(10, 10, 10, 10), pygame.Rect(50, 50, 10, 10)]]
+    assert screen.get_at((15, 15)) == BLUE
+    assert screen.get_at((55, 55)) == RED
+    assert renderer.get_stats()['partial_frames'] == 1
+
+def test_dirty_renderer_flips_when_the_background_key_changes(presented):
+    screen = pygame.Surface((100, 100))
+    renderer = DirtyRectRenderer(screen)
+    render_frame(renderer, 'scene', pygame.Rect(10, 10, 10, 10))
+    render_frame(renderer, 'scrolled', pygame.Rect(50, 50, 10, 10))
+
+    assert presented == ['flip', 'flip']
+    assert screen.get_at((15, 15)) == BLUE
+    assert renderer.get_stats()['full_frames'] == 2
+
+def test_dirty_renderer_flips_when_too_much_of_the_screen_is_dirty(presented):
+    screen = pygame.Surface((100, 100))
+    renderer = DirtyRectRenderer(screen, max_dirty_fraction=0.5)
+    render_frame(renderer, 'scene', pygame.Rect(0, 0, 10, 10))
+    render_frame(renderer, 'scene', pygame.Rect(0, 0, 80, 80))
+
+    assert presented == ['flip', 'flip']
+    assert renderer.get_stats() == {'full_frames': 2, 'partial_frames': 0, 'updated_pixel_share': 1.0}
+
+def test_world_render_key_changes_with_every_background_swap():
+    world = World(800, 600)
+    key = world.get_render_key()
+    world.update(0.0, zoom_factor=1.5)
+    zoomed_key = world.get_render_key()
+    world.update(0.0, zoom_factor=1.0)
+
+    # Back at the cached 1.0 surface, but the drawn background changed twice
+    assert len({key[0], zoomed_key[0], world.get_render_key()[0]}) == 3
@@ -0,0 +1,181 @@
+# tests/test_items.py
+import random
+import pytest
+from src.items import (
+    NUMPY_AVAILABLE, Item, ItemPool, ItemSpawner, ItemStore, ItemType, SpawnEvent, SpawnScheduler, item_atlas
+)
+
+def test_pool_reuses_released_items(make_item):
+    pool = ItemPool(max_size=4)
+    first = make_item(pool=pool)
+    pool.release(first)
+
+    second = make_item(2, ItemType.BAD_RED, pool=pool)
+    assert second is first
+    assert pool.get_stats()['created'] == 1
+    assert pool.get_stats()['reused'] == 1
+
+def test_reused_item_is_fully_reinitialized(make_item):
+    pool = ItemPool()
+    item = make_item(pool=pool)
+    item.x, item.y, item.previous_y = 120, 300, 290
+    pool.release(item)
+
+    item = make_item(2, ItemType.BAD_RED, pool=pool)
+    assert (item.lane, item.x, item.y, item.previous_y) == (2, 0, 0, 0)
+    assert not item.is_good
+    assert item.size == ItemType.BAD_RED['size']
+    assert item.image_path == ItemType.BAD_RED['image']
+
+def test_pool_discards_items_beyond_max_size(make_item):
+    pool = ItemPool(max_size=2)
+    pool.release_many([make_item(pool=pool) for _ in range(3)])
+    stats = pool.get_stats()
+    assert stats['idle'] == 2
+    assert stats['released'] == 3
+    assert stats['discarded'] == 1
+
+needs_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason='NumPy is not installed')
+
+def store_pool(store) -> ItemPool:
+    return ItemPool(create=store.create, recycle=store.recycle)
+
+def update_one_by_one(items: list, game_speed: float, screen_height: int):
+    """The per-item path of Game.update_game_state"""
+    kept, culled, minimum_fall_speed = [], [], 0
+    for item in items:
+        if item.update(game_speed, screen_height):
+            kept.append(item)
+            if minimum_fall_speed == 0 or item.speed < minimum_fall_speed:
+                minimum_fall_speed = item.speed
+        else:
+            culled.append(item)
+    return kept, culled, minimum_fall_speed
+
+@needs_numpy
+def test_store_update_matches_item_update(make_item):
+    store = ItemStore(capacity=4)  # Also grows while items are created
+    pool = store_pool(store)
+    layout = random.Random(7)
+    plain, stored = [], []
+    for seed in range(40):
+        lane = layout.randrange(3)
+        item_type = layout.choice(ItemType.all_types())
+        y = layout.uniform(-100, 590)
+        for items, item_pool in ((plain, None), (stored, pool)):
+            item = make_item(lane, item_type, pool=item_pool, rng=random.Random(seed))
+            item.y = y
+            items.append(item)
+
+    # A regular step, one below the 0.1 speed floor and one that culls the lower half
+    total_culled = 0
+    for game_speed in (3.0 / 60, 0.05, 20.0):
+        plain_kept, plain_culled, plain_minimum = update_one_by_one(plain, game_speed, 600)
+        culled, minimum = store.update(game_speed, 600)
+
+        assert sorted(map(plain.index, plain_culled)) == sorted(map(stored.index, culled))
+        assert minimum == pytest.approx(plain_minimum)
+        kept = [item for item in stored if not any(item is culled_item for culled_item in culled)]
+        assert [(item.y, item.previous_y) for item in kept] == pytest.approx(
+            [(item.y, item.previous_y) for item in plain_kept]
+        )
+        assert len(store) == len(plain_kept)
+        plain, stored = plain_kept, kept
+        total_culled += len(culled)
+    assert 0 < total_culled < 40
+
+@needs_numpy
+def test_store_reuses_released_views_and_slots(make_item):
+    store = ItemStore()
+    pool = store_pool(store)
+    first = make_item(pool=pool)
+    first.y = 590
+    culled, _ = store.update(100.0, 600)
+    assert [item is first for item in culled] == [True]
+    pool.release_many(culled)
+
+    second = make_item(2, ItemType.BAD_RED, pool=pool)
+    assert second is first
+    assert (second.lane, second.y, second.color) == (2, 0, ItemType.BAD_RED['color'])
+    assert store.high_water == 1 and len(store) == 1
+
+    assert store.release(second)
+    assert not store.release(second)
+    assert len(store) == 0
+
+def run_spawner(spawner: ItemSpawner, dt: float, seconds: float) -> list:
+    spawned = []
+    for step in range(round(seconds / dt)):
+        new_items = spawner.update([], dt)
+        if new_items:
+            spawned.append((round((step + 1) * dt, 6), [(item.lane, item.color) for item in new_items]))
+    return spawned
+
+def test_scheduler_pops_waves_in_time_order():
+    scheduler = SpawnScheduler()
+    for time, lane in ((4.0, 0), (2.0, 1), (2.0, 2), (6.0, 0)):
+        scheduler.schedule(SpawnEvent(time, 0, lane, ItemType.GOOD_GREEN, 5))
+
+    assert [event.time for event in scheduler.upcoming(4.0)] == [2.0, 2.0, 4.0]
+    assert [event.lane for event in scheduler.pop_wave()] == [1, 2]
+    assert scheduler.next_time() == 4.0
+    assert len(scheduler) == 2
+    scheduler.clear()
+    assert scheduler.pop_wave() == [] and scheduler.next_time() is None
+
+def test_spawn_timing_does_not_depend_on_the_step_rate(make_spawner):
+    reference = run_spawner(make_spawner(), 1 / 60, 30)
+    assert len(reference) == 15
+    assert reference[0][0] == 2.0
+    for dt in (1 / 30, 1 / 144):
+        spawned = run_spawner(make_spawner(), dt, 30)
+        assert [items for _, items in spawned] == [items for _, items in reference]
+        assert [time for time, _ in spawned] == pytest.approx([time for time, _ in reference], abs=dt)
+
+def test_difficulty_multiplier_shortens_the_wave_interval(make_spawner):
+    spawner = make_spawner(level=3)
+    spawner.difficulty_multiplier = 1.5
+    assert len(run_spawner(spawner, 1 / 60, 30)) == 22
+
+def test_minimum_fall_speed_ignores_the_yellow_speed_override(make_spawner):
+    spawner = make_spawner()
+    spawner.update([], 1 / 60)
+    spawner.scheduler.clear()
+    due = spawner.clock + 1 / 60
+    spawner.scheduler.schedule(SpawnEvent(due, 1, 0, ItemType.BAD_YELLOW, 60.0, base_speed=6.0))
+    spawner.scheduler.schedule(SpawnEvent(due, 1, 1, ItemType.GOOD_GREEN, 7.0))
+
+    assert len(spawner.update([], 1 / 60)) == 2
+    assert spawner.get_minimum_fall_speed() == 6.0
+
+def test_full_screen_holds_the_next_wave(make_spawner):
+    spawner = make_spawner()
+    spawner.max_items = 1
+    full = [object()]
+    for _ in range(300):
+        assert spawner.update(full, 1 / 60) is None
+    # The held wave spawns as soon as there is room, the next one an interval after it was due
+    assert spawner.update([], 1 / 60)
+    spawned = run_spawner(spawner, 1 / 60, 2.1)
+    assert [time for time, _ in spawned] == pytest.approx([2.0], abs=0.02)
+
+def test_upcoming_spawn_textures_are_prepared_ahead(make_spawner):
+    item_atlas.clear()
+    spawner = make_spawner()
+    spawner.update([], 1 / 60)
+
+    upcoming = spawner.get_upcoming_spawns(spawner.prepare_ahead)
+    assert upcoming
+    for event in upcoming:
+        assert event.prepared
+        for image_path in Item.image_paths_for(event.item_type['is_good']):
+            assert (image_path, event.item_type['size']) in item_atlas.textures
+
+def test_atlas_builds_only_the_images_items_draw():
+    item_atlas.clear()
+    item_atlas.build(ItemType.all_types(), Item.image_paths_for)
+
+    drawn = set(Item.image_paths_for(True) + Item.image_paths_for(False))
+    assert {image_path for image_path, _ in item_atlas.textures} == drawn
+    assert ItemType.BAD_YELLOW['image'] not in drawn
+    assert item_atlas.is_built
@@ -0,0 +1,112 @@
+# tests/test_log_writer.py
+import io
+import logging
+import subprocess
+import sys
+import time
+from src.utils.log_writer import AsyncLogWriter, BatchRotatingFileHandler, LogRingBuffer, RingBufferHandler
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+class FailingStreamHandler(BatchRotatingFileHandler):
+    """Batch handler whose file refuses every write, like a full disk"""
+
+    class BrokenStream(io.StringIO):
+        def write(self, text):
+            raise OSError(28, 'No space left on device')
+
+    def _open(self):
+        return self.BrokenStream()
+
+class RaisingHandler(logging.Handler):
+    def handle(self, record):
+        raise RuntimeError('handler failure')
+
+def test_batch_rolls_over_before_exceeding_max_bytes(tmp_path, make_record):
+    path = tmp_path / 'game.log'
+    handler = BatchRotatingFileHandler(str(path), maxBytes=100, backupCount=2, encoding='utf-8')
+    try:
+        for batch in range(5):
+            handler.emit_batch([make_record(f"batch {batch} line {line}") for line in range(3)])
+    finally:
+        handler.close()
+
+    assert (tmp_path / 'game.log.1').exists()
+    assert (tmp_path / 'game.log.2').exists()
+    assert not (tmp_path / 'game.log.3').exists()
+    assert path.stat().st_size < 100
+    assert 'batch 4 line 2' in path.read_text(encoding='utf-8')
+
+def test_max_bytes_counts_encoded_bytes(tmp_path, make_record):
+    path = tmp_path / 'game.log'
+    handler = BatchRotatingFileHandler(str(path), maxBytes=150, backupCount=1, encoding='utf-8')
+    try:
+        # 61 characters but 121 bytes each: two batches only fit in characters
+        handler.emit_batch([make_record('é' * 60)])
+        handler.emit_batch([make_record('é' * 60)])
+    finally:
+        handler.close()
+
+    assert (tmp_path / 'game.log.1').exists()
+    assert path.stat().st_size == 121
+
+def test_failed_write_is_reported_not_raised(tmp_path, monkeypatch, make_record):
+    handler = FailingStreamHandler(str(tmp_path / 'game.log'), maxBytes=100, backupCount=1, delay=True)
+    errors = []
+    monkeypatch.setattr(handler, 'handleError', errors.append)
+
+    handler.emit_batch([make_record('lost')])
+    assert [record.getMessage() for record in errors] == ['lost']
+
+def test_writer_thread_survives_a_failing_handler(monkeypatch, make_record):
+    monkeypatch.setattr(logging, 'raiseExceptions', False)
+    buffer = LogRingBuffer()
+    collected = CollectingHandler()
+    writer = AsyncLogWriter(buffer, [RaisingHandler(), collected], flush_interval=0.01)
+    writer.start()
+    try:
+        buffer.put_nowait(make_record('first'))
+        deadline = time.monotonic() + 2
+        while not collected.messages and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert writer.is_alive()
+
+        buffer.put_nowait(make_record('second'))
+    finally:
+        writer.stop()
+
+    assert not writer.is_alive()
+    assert collected.messages == ['first', 'second']
+    assert buffer.unfinished == 0
+
+def test_file_and_directory_are_created_on_first_write(tmp_path, make_record):
+    path = tmp_path / 'logs' / 'game.log'
+    handler = BatchRotatingFileHandler(str(path), maxBytes=100, backupCount=1, delay=True)
+    try:
+        assert not path.parent.exists()
+        handler.emit_batch([make_record('first')])
+    finally:
+        handler.close()
+    assert 'first' in path.read_text()
+
+def test_first_record_callback_runs_once(make_record):
+    calls = []
+    handler = RingBufferHandler(LogRingBuffer(), on_first_record=lambda: calls.append(len(handler.queue)))
+    for message in ('first', 'second'):
+        handler.handle(make_record(message))
+    # The callback runs before the first record is buffered
+    assert calls == [0]
+    assert len(handler.queue) == 2
+
+def test_importing_the_game_starts_no_writer_thread():
+    code = (
+        "import threading, src.game, src.game.game, src.game.simulation\n"
+        "assert 'AsyncLogWriter' not in [thread.name for thread in threading.enumerate()]\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True, capture_output=True)
@@ -0,0 +1,85 @@
+# tests/test_resources.py
+from src.utils.surface_cache import SurfaceCache
+
+def test_surface_cache_evicts_least_recently_used_beyond_entry_limit(make_surface):
+    cache = SurfaceCache(max_entries=2)
+    cache.put('a', make_surface())
+    cache.put('b', make_surface())
+    assert cache.get('a') is not None  # 'b' becomes the least recently used
+    cache.put('c', make_surface())
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.evictions == 1
+
+def test_surface_cache_keeps_memory_within_budget(make_surface):
+    size = SurfaceCache.surface_bytes(make_surface())
+    cache = SurfaceCache(max_entries=10, max_bytes=size * 2)
+    for key in range(4):
+        cache.put(key, make_surface())
+
+    assert [key in cache for key in range(4)] == [False, False, True, True]
+    assert cache.current_bytes == size * 2
+
+def test_surface_cache_keeps_newest_entry_over_budget(make_surface):
+    cache = SurfaceCache(max_bytes=1)
+    cache.put('small', make_surface(2, 2))
+    cache.put('large', make_surface(50, 50))
+
+    assert len(cache) == 1 and 'large' in cache
+    assert cache.current_bytes == SurfaceCache.surface_bytes(cache.get('large'))
+
+def test_surface_cache_builds_missing_surface_once(make_surface):
+    cache = SurfaceCache()
+    built = []
+    factory = lambda: built.append(1) or make_surface()
+
+    first = cache.get('key', factory)
+    assert cache.get('key', factory) is first
+    assert len(built) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_resource_cache_evicts_least_recently_used_over_budget(make_resource_cache):
+    cache = make_resource_cache()
+    cache['a'] = 'x' * 10
+    cache['b'] = 'x' * 10
+    cache['c'] = 'x' * 10
+    assert cache.get('a') is not None
+    cache['d'] = 'x' * 10
+
+    assert list(cache.keys()) == ['c', 'a', 'd']
+    assert cache.current_bytes == 30
+    assert cache.evicted_keys == {'b'}
+    assert cache.peak_bytes == 40
+
+def test_resource_cache_never_evicts_pinned_entries(make_resource_cache):
+    cache = make_resource_cache()
+    cache.pin('a')  # Pins may precede loading
+    cache['a'] = 'x' * 20
+    cache['b'] = 'x' * 20
+
+    assert 'a' in cache and 'b' in cache
+    assert cache.current_bytes == 40
+    assert cache.get_stats()['pinned'] == 1
+
+def test_resource_cache_evicts_once_the_last_pin_is_released(make_resource_cache):
+    cache = make_resource_cache()
+    cache.pin('a')
+    cache.pin('a')
+    cache['a'] = 'x' * 20
+    cache['b'] = 'x' * 20
+
+    cache.unpin('a')
+    assert cache.is_pinned('a') and 'a' in cache
+    cache.unpin('a')
+    assert not cache.is_pinned('a')
+    assert 'a' not in cache and 'b' in cache
+    assert cache.evicted_keys == {'a'}
+
+def test_resource_cache_forgets_eviction_when_reloaded(make_resource_cache):
+    cache = make_resource_cache(max_bytes=10)
+    cache['a'] = 'x' * 10
+    cache['b'] = 'x' * 10
+    assert 'a' in cache.evicted_keys
+    cache['a'] = 'x' * 10
+
+    assert 'a' not in cache.evicted_keys and 'b' in cache.evicted_keys